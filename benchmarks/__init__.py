@@ -0,0 +1 @@
+"""This package contains micro-benchmarks of the hot paths of the library."""
@@ -0,0 +1,65 @@
+"""
+This module runs the benchmark suites and writes their measurements as JSON lines.
+
+Run `python -m benchmarks` to run every suite, or pick suites to run, e.g. `python -m benchmarks --suite parsing`.
+Pass `--quick` for a fast smoke run and `--output` to write the measurements to a file, so that the files written
+for two releases can be compared line by line.
+"""
+
+import argparse
+import sys
+from typing import Callable, Iterator
+
+from benchmarks import client_overhead, load_testing, parsing, storages, throughput
+from benchmarks.measuring import write_measurements
+
+Suite = Callable[[bool], Iterator[dict]]
+
+SUITES: dict[str, Suite] = {  # noqa: WPS407
+    'client_overhead': client_overhead.run,
+    'load_testing': load_testing.run,
+    'parsing': parsing.run,
+    'storages': storages.run,
+    'throughput': throughput.run,
+}
+
+
+def run_suites(suite_names: list[str], quick: bool) -> Iterator[dict]:
+    """
+    Run the given suites, one after another.
+
+    Args:
+        suite_names (list[str]): The names of the suites to run.
+        quick (bool): Whether to run the suites on small inputs, as a smoke test.
+
+    Yields:
+        dict: The measurements, each tagged with the name of its suite.
+    """
+    for suite_name in suite_names:
+        yield from ({'suite': suite_name, **measurement} for measurement in SUITES[suite_name](quick))
+
+
+def main() -> None:
+    """Parse the command line and run the requested suites."""
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Benchmark the hot paths.')
+    parser.add_argument(
+        '--suite',
+        action='append',
+        choices=list(SUITES),
+        dest='suites',
+        help='a suite to run, may be repeated (default: all of them)',
+    )
+    parser.add_argument('--quick', action='store_true', help='run on small inputs, as a smoke test')
+    parser.add_argument(
+        '--output',
+        type=argparse.FileType('w'),
+        default=sys.stdout,
+        help='the file to write the measurements to (default: the standard output)',
+    )
+    arguments = parser.parse_args()
+    measurements = run_suites(arguments.suites or list(SUITES), arguments.quick)
+    write_measurements(measurements, arguments.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+This module benchmarks the per-request overhead of the client itself.
+
+Requests are answered by the in-process `StubAdapter`, so the measurements cover URL formatting, the request
+lifecycle hooks, the optional rate limiter and retry policy, `requests` itself and response parsing, but no
+network. Run it with `python -m benchmarks.client_overhead`; it prints one JSON object per measurement.
+"""
+
+import sys
+from functools import partial
+from typing import Callable, Iterator
+
+from benchmarks.measuring import best_time_per_call, microseconds, write_measurements
+from benchmarks.stub import create_stubbed_session
+from hunter_client.client import HunterClient, RateLimiter, RetryPolicy
+from hunter_client.services.response_models.validation import ValidationLevel
+
+CALLS_PER_ROUND = 2000
+QUICK_CALLS_PER_ROUND = 50
+UNLIMITED_REQUESTS_PER_SECOND = 1e9
+VERIFIED_EMAIL = 'john.doe@example.com'
+
+
+def measure(benchmark: str, benchmarked: Callable[[], object], calls_per_round: int) -> dict:
+    """
+    Measure the time of a single call of the benchmarked function.
+
+    Args:
+        benchmark (str): The name of the measurement.
+        benchmarked (Callable[[], object]): The benchmarked function.
+        calls_per_round (int): The number of calls timed together in each round.
+
+    Returns:
+        dict: The best time per call, in microseconds.
+    """
+    return {'benchmark': benchmark, 'per_call_us': microseconds(best_time_per_call(benchmarked, calls_per_round))}
+
+
+def benchmarked_calls() -> dict[str, Callable[[], object]]:
+    """
+    Build the benchmarked calls of the `/email-verifier` endpoint, keyed by the names of their measurements.
+
+    Returns:
+        dict[str, Callable[[], object]]: The benchmarked calls, from URL formatting alone to a fully parsed response.
+    """
+    bare_verifier = HunterClient('benchmark', http_session=create_stubbed_session()).email_verifier
+    guarded_verifier = HunterClient(
+        'benchmark',
+        http_session=create_stubbed_session(),
+        rate_limiter=RateLimiter(UNLIMITED_REQUESTS_PER_SECOND),
+        retry_policy=RetryPolicy(),
+    ).email_verifier
+    return {
+        'format_url': partial(bare_verifier._formatted_url, email=VERIFIED_EMAIL),  # noqa: WPS437
+        'make_request': partial(bare_verifier.make_request, 'GET', email=VERIFIED_EMAIL),
+        'make_request_guarded': partial(guarded_verifier.make_request, 'GET', email=VERIFIED_EMAIL),
+        'request_json': partial(bare_verifier.request_json, 'GET', email=VERIFIED_EMAIL),
+        'verify_email_strict': partial(bare_verifier.verify_email, VERIFIED_EMAIL, ValidationLevel.STRICT),
+        'verify_email_trusted': partial(bare_verifier.verify_email, VERIFIED_EMAIL, ValidationLevel.TRUSTED),
+    }
+
+
+def run(quick: bool = False) -> Iterator[dict]:
+    """
+    Measure the overhead of the client on calls of the `/email-verifier` endpoint.
+
+    The `make_request_guarded` measurement goes through a rate limiter that never waits and a retry policy that
+    never retries, so it shows what configuring them costs on the happy path.
+
+    Args:
+        quick (bool): Whether to time only a few calls, as a smoke test.
+
+    Yields:
+        dict: The measurements.
+    """
+    calls_per_round = QUICK_CALLS_PER_ROUND if quick else CALLS_PER_ROUND
+    yield from (
+        measure(benchmark, benchmarked, calls_per_round)
+        for benchmark, benchmarked in benchmarked_calls().items()
+    )
+
+
+if __name__ == '__main__':
+    write_measurements(run(), sys.stdout)
@@ -0,0 +1,182 @@
+"""
+This module load tests the client against the stand-in server, measuring throughput and tail latency.
+
+The server runs in its own process, so that it does not compete with the client for the interpreter, and answers
+after a log-normal latency. Every scenario sends many `/email-verifier` requests from a pool of threads sharing one
+client, and reports the latency percentiles of the calls as seen by the caller, retries included.
+Run it with `python -m benchmarks.load_testing`; it prints one JSON object per scenario.
+"""
+
+import statistics
+import subprocess  # noqa: S404
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import timedelta
+from functools import partial
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+import requests
+
+from benchmarks.measuring import write_measurements
+from hunter_client.client import HunterClient, RetryPolicy
+
+REQUESTS_COUNT = 2000
+QUICK_REQUESTS_COUNT = 100
+CONCURRENCY = 32
+QUICK_CONCURRENCY = 8
+MILLISECONDS_PER_SECOND = 1000
+REPORTED_PERCENTILES = (50, 90, 99)
+RETRY_BACKOFF_BASE_SECONDS = 0.05
+
+CallOutcome = tuple[float, bool]
+
+
+class LoadScenario(NamedTuple):
+    """
+    A load test scenario.
+
+    Attributes:
+        name (str): The name of the scenario.
+        server_arguments (tuple[str, ...]): The command line arguments of the stand-in server.
+    """
+
+    name: str
+    server_arguments: tuple[str, ...]
+
+
+SCENARIOS = (
+    LoadScenario('healthy', ('--latency', 'lognormal:20:0.5')),
+    LoadScenario('degraded', ('--latency', 'lognormal:20:0.5', '--error-rate', '0.02', '--rate-limit-rate', '0.01')),
+)
+
+
+@contextmanager
+def stand_in_server(server_arguments: tuple[str, ...]) -> Iterator[str]:
+    """
+    Run the stand-in server in a child process.
+
+    Args:
+        server_arguments (tuple[str, ...]): The command line arguments of the server.
+
+    Yields:
+        str: The base URL of the server.
+    """
+    server_process = subprocess.Popen(  # noqa: S603
+        [sys.executable, '-m', 'benchmarks.stand_in', *server_arguments],
+        cwd=Path(__file__).parent.parent,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:  # noqa: WPS501
+        yield server_process.stdout.readline().strip()  # type: ignore[union-attr]
+    finally:
+        server_process.terminate()
+        server_process.wait()
+
+
+def timed_verification(hunter_client: HunterClient, index: int) -> CallOutcome:
+    """
+    Verify an email, measuring the time the call takes.
+
+    Args:
+        hunter_client (HunterClient): The client to verify the email with.
+        index (int): The index of the email, used to make it unique.
+
+    Returns:
+        CallOutcome: The time the call took, in seconds, and whether it succeeded.
+    """
+    started_at = time.perf_counter()
+    try:
+        hunter_client.email_verifier.verify_email('person{0}@example.com'.format(index))
+    except requests.HTTPError:
+        return time.perf_counter() - started_at, False
+    return time.perf_counter() - started_at, True
+
+
+def measure(scenario: LoadScenario, requests_count: int, concurrency: int) -> dict:
+    """
+    Run a load test scenario.
+
+    Args:
+        scenario (LoadScenario): The scenario.
+        requests_count (int): The number of calls to make.
+        concurrency (int): The number of threads making the calls.
+
+    Returns:
+        dict: The throughput, the latency percentiles in milliseconds, the number of failed calls and of retries.
+    """
+    retry_policy = RetryPolicy(backoff_base=timedelta(seconds=RETRY_BACKOFF_BASE_SECONDS))
+    with stand_in_server(scenario.server_arguments) as base_url:
+        with HunterClient('benchmark', base_url=base_url, pool_size=concurrency, retry_policy=retry_policy) as client:
+            elapsed, outcomes = make_calls(client, requests_count, concurrency)
+    return {
+        'benchmark': 'load_verify_email',
+        'scenario': scenario.name,
+        'requests_count': requests_count,
+        'concurrency': concurrency,
+        'calls_per_second': round(requests_count / elapsed),
+        **summarize_calls(outcomes),
+        'retries': retry_policy.stats.retries,
+    }
+
+
+def make_calls(hunter_client: HunterClient, requests_count: int, concurrency: int) -> tuple[float, list[CallOutcome]]:
+    """
+    Make calls from a pool of threads sharing the client.
+
+    Args:
+        hunter_client (HunterClient): The client to make the calls with.
+        requests_count (int): The number of calls to make.
+        concurrency (int): The number of threads making the calls.
+
+    Returns:
+        tuple[float, list[CallOutcome]]: The time all calls took, in seconds, and the outcome of every call.
+    """
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        outcomes = list(executor.map(partial(timed_verification, hunter_client), range(requests_count)))
+    return time.perf_counter() - started_at, outcomes
+
+
+def summarize_calls(outcomes: list[CallOutcome]) -> dict[str, float]:
+    """
+    Summarize the outcomes of calls.
+
+    Args:
+        outcomes (list[CallOutcome]): The outcomes of the calls.
+
+    Returns:
+        dict[str, float]: The reported percentiles and the maximum of the call times, in milliseconds, and the
+            number of failed calls.
+    """
+    call_times = [call_time for call_time, _ in outcomes]
+    percentiles = statistics.quantiles(call_times, n=100, method='inclusive')
+    summary = {
+        'p{0}_ms'.format(percentile): round(percentiles[percentile - 1] * MILLISECONDS_PER_SECOND, 2)
+        for percentile in REPORTED_PERCENTILES
+    }
+    summary['max_ms'] = round(max(call_times) * MILLISECONDS_PER_SECOND, 2)
+    summary['failed_calls'] = sum(1 for _, succeeded in outcomes if not succeeded)
+    return summary
+
+
+def run(quick: bool = False) -> Iterator[dict]:
+    """
+    Run every load test scenario.
+
+    Args:
+        quick (bool): Whether to make few calls from few threads, as a smoke test.
+
+    Yields:
+        dict: The measurements.
+    """
+    requests_count = QUICK_REQUESTS_COUNT if quick else REQUESTS_COUNT
+    concurrency = QUICK_CONCURRENCY if quick else CONCURRENCY
+    yield from (measure(scenario, requests_count, concurrency) for scenario in SCENARIOS)
+
+
+if __name__ == '__main__':
+    write_measurements(run(), sys.stdout)
@@ -0,0 +1,90 @@
+"""
+This module provides the timing and reporting helpers shared by all benchmarks.
+
+Every benchmark produces measurements as flat dicts, and `write_measurements` prints them as JSON lines together
+with a description of the environment they were taken in, so that results of different releases can be compared
+by tools rather than by eye.
+"""
+
+import json
+import platform
+import time
+import timeit
+from datetime import datetime, timezone
+from typing import Callable, Iterable, TextIO
+
+REPEATS = 5
+MICROSECONDS_PER_SECOND = 1000000
+
+
+def best_time_per_call(benchmarked: Callable[[], object], calls_per_round: int) -> float:
+    """
+    Return the best time of a single call of the benchmarked function over several rounds.
+
+    Args:
+        benchmarked (Callable[[], object]): The benchmarked function.
+        calls_per_round (int): The number of calls timed together in each round.
+
+    Returns:
+        float: The time of a single call, in seconds.
+    """
+    return min(timeit.repeat(benchmarked, number=calls_per_round, repeat=REPEATS)) / calls_per_round
+
+
+def time_once(benchmarked: Callable[[], object]) -> float:
+    """
+    Return the time of a single call of the benchmarked function, for operations too slow to be repeated.
+
+    Args:
+        benchmarked (Callable[[], object]): The benchmarked function.
+
+    Returns:
+        float: The time of the call, in seconds.
+    """
+    started_at = time.perf_counter()
+    benchmarked()
+    return time.perf_counter() - started_at
+
+
+def microseconds(seconds: float) -> float:
+    """
+    Convert a duration to microseconds, rounded for reporting.
+
+    Args:
+        seconds (float): The duration, in seconds.
+
+    Returns:
+        float: The duration, in microseconds.
+    """
+    return round(seconds * MICROSECONDS_PER_SECOND, 2)
+
+
+def environment() -> dict[str, str]:
+    """
+    Describe the environment the measurements are taken in.
+
+    Returns:
+        dict[str, str]: The Python version and implementation, the platform and the time of the measurements.
+    """
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'measured_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+    }
+
+
+def write_measurements(measurements: Iterable[dict], output: TextIO) -> None:
+    """
+    Write measurements as JSON lines, each extended with the description of the environment.
+
+    The lines are flushed one by one, so that the progress of long benchmarks can be followed.
+
+    Args:
+        measurements (Iterable[dict]): The measurements to write.
+        output (TextIO): The stream to write the measurements to.
+    """
+    environment_description = environment()
+    for measurement in measurements:
+        output.write('{0}\n'.format(json.dumps({**measurement, **environment_description})))
+        output.flush()
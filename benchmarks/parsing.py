@@ -0,0 +1,157 @@
+"""
+This module benchmarks parsing the responses of every endpoint, at realistic payload sizes.
+
+It compares decoding the body into a dict and then validating the dict (what the raw handler methods followed by
+`model_validate` do) with validating the body straight from bytes (what the typed handler methods do), at the
+strict and trusted validation levels. `/domain-search` responses of growing size are additionally turned into raw
+slotted records (what the raw validation level does).
+Run it with `python -m benchmarks.parsing`; it prints one JSON object per measurement.
+"""
+
+import json
+import sys
+from functools import partial
+from typing import Callable, Iterator
+
+from pydantic import BaseModel
+
+from benchmarks.measuring import best_time_per_call, microseconds, write_measurements
+from benchmarks.payloads import (
+    build_domain_search_payload,
+    build_email_count_payload,
+    build_email_finder_payload,
+    build_email_verifier_payload,
+    encode,
+)
+from hunter_client.services.response_models import (
+    DomainAndNameSearcherResponse,
+    DomainSearcherResponse,
+    EmailCounterResponse,
+    EmailVerifierResponse,
+)
+from hunter_client.services.response_models.records import EmailRecord
+from hunter_client.services.response_models.validation import ValidationLevel, validation_context
+
+EMAILS_COUNTS = (10, 100, 1000)
+QUICK_EMAILS_COUNTS = (10,)
+SOURCES_COUNT = 3
+EMAILS_PER_ROUND = 10000
+PARSES_PER_ROUND = 1000
+QUICK_ROUND_DIVISOR = 100
+
+Parse = Callable[[bytes], object]
+
+
+def parse_via_dict(model_type: type[BaseModel], raw_body: bytes) -> BaseModel:
+    """Decode the body into a dict, then validate the dict."""
+    return model_type.model_validate(json.loads(raw_body))
+
+
+def parse_from_bytes(model_type: type[BaseModel], validation_level: ValidationLevel, raw_body: bytes) -> BaseModel:
+    """Validate the body straight from bytes at the given validation level."""
+    return model_type.model_validate_json(raw_body, context=validation_context(validation_level))
+
+
+def parse_raw(raw_body: bytes) -> list[EmailRecord]:
+    """Decode the body into a dict and build raw records of its emails."""
+    emails_json = json.loads(raw_body)['data']['emails']
+    return [EmailRecord.from_json(email_json) for email_json in emails_json]
+
+
+def parsing_strategies(model_type: type[BaseModel]) -> dict[str, Parse]:
+    """
+    Return the parsing strategies applicable to the given response model, keyed by their names.
+
+    Args:
+        model_type (type[BaseModel]): The response model.
+
+    Returns:
+        dict[str, Parse]: The strategies; raw records are only built for `/domain-search` responses.
+    """
+    strategies: dict[str, Parse] = {
+        'via_dict': partial(parse_via_dict, model_type),
+        'from_bytes': partial(parse_from_bytes, model_type, ValidationLevel.STRICT),
+        'trusted': partial(parse_from_bytes, model_type, ValidationLevel.TRUSTED),
+    }
+    if model_type is DomainSearcherResponse:
+        strategies['raw'] = parse_raw
+    return strategies
+
+
+def measure(benchmark: str, model_type: type[BaseModel], payload: dict, parses_per_round: int) -> dict:
+    """
+    Measure all parsing strategies applicable to a response model on the given payload.
+
+    Args:
+        benchmark (str): The name of the measurement.
+        model_type (type[BaseModel]): The response model.
+        payload (dict): The benchmarked payload.
+        parses_per_round (int): The number of parses timed together in each round.
+
+    Returns:
+        dict: The best time per parse of each strategy, in microseconds, and its speedup relative to `via_dict`.
+    """
+    raw_body = encode(payload)
+    timings = time_strategies(model_type, raw_body, parses_per_round)
+    measurement: dict[str, object] = {'benchmark': benchmark, 'body_bytes': len(raw_body)}
+    for strategy_name, timing in timings.items():
+        measurement['{0}_us'.format(strategy_name)] = microseconds(timing)
+        measurement['{0}_speedup'.format(strategy_name)] = round(timings['via_dict'] / timing, 2)  # noqa: WPS221
+    return measurement
+
+
+def time_strategies(model_type: type[BaseModel], raw_body: bytes, parses_per_round: int) -> dict[str, float]:
+    """
+    Time every parsing strategy applicable to a response model on the given body.
+
+    Args:
+        model_type (type[BaseModel]): The response model.
+        raw_body (bytes): The benchmarked body.
+        parses_per_round (int): The number of parses timed together in each round.
+
+    Returns:
+        dict[str, float]: The best time per parse of each strategy, in seconds.
+    """
+    return {
+        strategy_name: best_time_per_call(partial(parse, raw_body), parses_per_round)
+        for strategy_name, parse in parsing_strategies(model_type).items()
+    }
+
+
+def run(quick: bool = False) -> Iterator[dict]:
+    """
+    Measure parsing the responses of every endpoint.
+
+    Args:
+        quick (bool): Whether to parse only small `/domain-search` responses, and only a few times, as a smoke test.
+
+    Yields:
+        dict: The measurements.
+    """
+    round_divisor = QUICK_ROUND_DIVISOR if quick else 1
+    for emails_count in QUICK_EMAILS_COUNTS if quick else EMAILS_COUNTS:
+        measurement = measure(
+            'parse_domain_search',
+            DomainSearcherResponse,
+            build_domain_search_payload(emails_count),
+            max(1, EMAILS_PER_ROUND // emails_count // round_divisor),
+        )
+        yield {**measurement, 'emails_count': emails_count}
+    parses_per_round = PARSES_PER_ROUND // round_divisor
+    yield measure(
+        'parse_email_finder',
+        DomainAndNameSearcherResponse,
+        build_email_finder_payload(SOURCES_COUNT),
+        parses_per_round,
+    )
+    yield measure(
+        'parse_email_verifier',
+        EmailVerifierResponse,
+        build_email_verifier_payload(SOURCES_COUNT),
+        parses_per_round,
+    )
+    yield measure('parse_email_count', EmailCounterResponse, build_email_count_payload(), parses_per_round)
+
+
+if __name__ == '__main__':
+    write_measurements(run(), sys.stdout)
@@ -0,0 +1,220 @@
+"""This module builds realistic Hunter API response payloads of configurable size for the benchmarks."""
+
+import json
+
+DEPARTMENTS = (
+    'executive',
+    'it',
+    'finance',
+    'management',
+    'sales',
+    'legal',
+    'support',
+    'hr',
+    'marketing',
+    'communication',
+    'education',
+    'design',
+    'health',
+    'operations',
+)
+
+
+def build_information_source(index: int, domain: str) -> dict:
+    """
+    Build a single entry of a `sources` list.
+
+    Args:
+        index (int): The index of the source, used to make its fields unique.
+        domain (str): The domain the source belongs to.
+
+    Returns:
+        dict: The source entry.
+    """
+    return {
+        'domain': 'blog.{0}'.format(domain),
+        'uri': 'http://blog.{0}/posts/{1}'.format(domain, index),
+        'extracted_on': '2015-08-29',
+        'last_seen_on': '2017-07-01',
+        'still_on_page': True,
+    }
+
+
+def build_email_info(index: int, domain: str) -> dict:
+    """
+    Build a single entry of the `data.emails` list of a `/domain-search` response.
+
+    Args:
+        index (int): The index of the email, used to make its fields unique.
+        domain (str): The domain of the email.
+
+    Returns:
+        dict: The email entry.
+    """
+    return {
+        'value': 'person{0}@{1}'.format(index, domain),
+        'type': 'personal',
+        'confidence': 90,
+        'sources': [build_information_source(index, domain)],
+        'first_name': 'First{0}'.format(index),
+        'last_name': 'Last{0}'.format(index),
+        'position': 'Engineer',
+        'seniority': 'senior',
+        'department': 'it',
+        'linkedin': 'https://www.linkedin.com/in/person{0}'.format(index),
+        'twitter': None,
+        'phone_number': None,
+        'verification': {'date': '2023-01-02', 'status': 'valid'},
+    }
+
+
+def build_domain_search_payload(emails_count: int, domain: str = 'example.com') -> dict:
+    """
+    Build a `/domain-search` response listing the given number of emails.
+
+    Args:
+        emails_count (int): The number of emails in the response.
+        domain (str): The searched domain.
+
+    Returns:
+        dict: The response payload.
+    """
+    return {
+        'data': {
+            'domain': domain,
+            'disposable': False,
+            'webmail': False,
+            'accept_all': False,
+            'pattern': '{first}.{last}',
+            'organization': 'Example Company',
+            'description': 'Example Company is a company.',
+            'industry': 'Information Technology',
+            'twitter': None,
+            'facebook': None,
+            'linkedin': None,
+            'instagram': None,
+            'youtube': None,
+            'technologies': ['react', 'sentry'],
+            'country': None,
+            'state': None,
+            'city': None,
+            'postal_code': None,
+            'street': None,
+            'emails': [build_email_info(index, domain) for index in range(emails_count)],
+            'linked_domains': [],
+        },
+        'meta': {
+            'results': emails_count,
+            'limit': emails_count,
+            'offset': 0,
+            'params': {'domain': domain, 'company': None, 'type': None, 'seniority': None, 'department': None},
+        },
+    }
+
+
+def build_email_finder_payload(sources_count: int, domain: str = 'example.com') -> dict:
+    """
+    Build an `/email-finder` response citing the given number of sources.
+
+    Args:
+        sources_count (int): The number of sources in the response.
+        domain (str): The searched domain.
+
+    Returns:
+        dict: The response payload.
+    """
+    return {
+        'data': {
+            'first_name': 'John',
+            'last_name': 'Doe',
+            'email': 'john.doe@{0}'.format(domain),
+            'score': 97,
+            'domain': domain,
+            'accept_all': False,
+            'position': 'Cofounder',
+            'twitter': None,
+            'linkedin_url': 'https://www.linkedin.com/in/john-doe',
+            'phone_number': None,
+            'company': 'Example Company',
+            'sources': [build_information_source(index, domain) for index in range(sources_count)],
+            'verification': {'date': '2023-01-02', 'status': 'valid'},
+        },
+        'meta': {
+            'params': {
+                'first_name': 'John',
+                'last_name': 'Doe',
+                'full_name': None,
+                'domain': domain,
+                'company': None,
+                'max_duration': None,
+            },
+        },
+    }
+
+
+def build_email_verifier_payload(sources_count: int, email: str = 'john.doe@example.com') -> dict:
+    """
+    Build an `/email-verifier` response citing the given number of sources.
+
+    Args:
+        sources_count (int): The number of sources in the response.
+        email (str): The verified email address.
+
+    Returns:
+        dict: The response payload.
+    """
+    domain = email.partition('@')[2]
+    return {
+        'data': {
+            'status': 'valid',
+            'result': 'deliverable',
+            'score': 100,
+            'email': email,
+            'regexp': True,
+            'gibberish': False,
+            'disposable': False,
+            'webmail': False,
+            'mx_records': True,
+            'smtp_server': True,
+            'smtp_check': True,
+            'accept_all': False,
+            'block': False,
+            'sources': [build_information_source(index, domain) for index in range(sources_count)],
+        },
+        'meta': {'params': {'email': email}},
+    }
+
+
+def build_email_count_payload(domain: str = 'example.com') -> dict:
+    """
+    Build an `/email-count` response.
+
+    Args:
+        domain (str): The counted domain.
+
+    Returns:
+        dict: The response payload.
+    """
+    return {
+        'data': {
+            'total': len(DEPARTMENTS),
+            'personal_emails': len(DEPARTMENTS),
+            'generic_emails': 0,
+            'department': dict.fromkeys(DEPARTMENTS, 1),
+            'seniority': {'junior': 0, 'senior': 0, 'executive': 0},
+        },
+        'meta': {'params': {'domain': domain, 'company': None, 'type': None}},
+    }
+
+
+def encode(payload: dict) -> bytes:
+    """
+    Encode a payload the way it arrives over the wire.
+
+    Args:
+        payload (dict): The payload to encode.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON body.
+    """
+    return json.dumps(payload).encode('utf-8')
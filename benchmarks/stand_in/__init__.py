@@ -0,0 +1,36 @@
+"""
+This package provides a local HTTP server standing in for the Hunter API, for load tests without network access.
+
+The server answers the four endpoints wrapped by the client with the payloads of `tests/mock_responses`, adapted
+to the query of every request. Its behaviour is configurable: the latency of every response is drawn from a
+distribution, a share of the requests can be answered with server errors or with `429 Too Many Requests`, and
+`/domain-search` can list any number of emails, paginated with `limit` and `offset` like the real endpoint.
+Requests for the domains listed as unknown (`nonexistent.com` by default) are answered with the failed payloads.
+
+Unlike the in-process `StubAdapter`, the server exercises the whole HTTP stack of the client, including its
+connection pool. Point a client at it with `HunterClient(api_key, base_url=server.base_url)`.
+
+Usage:
+    Use `HunterStandInServer` as a context manager in tests and benchmarks, or run the server in its own process
+    with `python -m benchmarks.stand_in --port 8080 --latency lognormal:20:0.5 --rate-limit-rate 0.01`, which
+    prints the base URL of the server once it is listening.
+"""
+
+from benchmarks.stand_in.behaviour import (
+    StandInBehaviour,
+    constant_latency,
+    lognormal_latency,
+    parse_latency,
+    uniform_latency,
+)
+from benchmarks.stand_in.server import HunterStandInServer, StandInStats
+
+__all__ = [
+    'HunterStandInServer',
+    'StandInBehaviour',
+    'StandInStats',
+    'constant_latency',
+    'lognormal_latency',
+    'parse_latency',
+    'uniform_latency',
+]
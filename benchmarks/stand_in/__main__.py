@@ -0,0 +1,50 @@
+"""This module runs the stand-in server in its own process until it is interrupted."""
+
+import argparse
+import sys
+
+from benchmarks.stand_in.behaviour import StandInBehaviour, constant_latency, parse_latency
+from benchmarks.stand_in.server import HunterStandInServer
+
+
+def parse_behaviour() -> tuple[argparse.Namespace, StandInBehaviour]:
+    """
+    Parse the command line.
+
+    Returns:
+        tuple[argparse.Namespace, StandInBehaviour]: The parsed arguments and the behaviour of the server.
+    """
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.stand_in', description='Serve a fake Hunter API.')
+    parser.add_argument('--host', default='127.0.0.1', help='the address to listen on')
+    parser.add_argument('--port', type=int, default=0, help='the port to listen on (default: a free one)')
+    parser.add_argument('--latency', type=parse_latency, default=constant_latency(0), help='e.g. lognormal:20:0.5')
+    parser.add_argument('--error-rate', type=float, default=0, help='the share of 503 responses')
+    parser.add_argument('--rate-limit-rate', type=float, default=0, help='the share of 429 responses')
+    parser.add_argument('--retry-after', type=int, default=1, help='the Retry-After of 429 responses, in seconds')
+    parser.add_argument('--emails', type=int, default=None, help='the number of emails listed per domain')
+    parser.add_argument('--seed', type=int, default=None, help='the seed of the random numbers')
+    arguments = parser.parse_args()
+    return arguments, StandInBehaviour(
+        latency=arguments.latency,
+        error_rate=arguments.error_rate,
+        rate_limit_rate=arguments.rate_limit_rate,
+        retry_after=arguments.retry_after,
+        domain_emails_count=arguments.emails,
+        seed=arguments.seed,
+    )
+
+
+def main() -> None:
+    """Serve requests until interrupted, after printing the base URL of the server."""
+    arguments, behaviour = parse_behaviour()
+    server = HunterStandInServer(behaviour, arguments.host, arguments.port)
+    sys.stdout.write('{0}\n'.format(server.base_url))
+    sys.stdout.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""This module defines the configurable behaviour of the stand-in server, including its latency distributions."""
+
+import argparse
+import random
+from dataclasses import dataclass
+from typing import Callable
+
+LatencyDistribution = Callable[[random.Random], float]
+
+MILLISECONDS_PER_SECOND = 1000
+
+
+def constant_latency(seconds: float) -> LatencyDistribution:
+    """
+    Build a distribution always yielding the same latency.
+
+    Args:
+        seconds (float): The latency, in seconds.
+
+    Returns:
+        LatencyDistribution: The distribution.
+    """
+    return lambda _random_numbers: seconds
+
+
+def uniform_latency(low: float, high: float) -> LatencyDistribution:
+    """
+    Build a distribution yielding latencies spread uniformly between two bounds.
+
+    Args:
+        low (float): The lowest latency, in seconds.
+        high (float): The highest latency, in seconds.
+
+    Returns:
+        LatencyDistribution: The distribution.
+    """
+    return lambda random_numbers: random_numbers.uniform(low, high)
+
+
+def lognormal_latency(median: float, sigma: float) -> LatencyDistribution:
+    """
+    Build a log-normal distribution of latencies, whose long right tail resembles latencies of real services.
+
+    Args:
+        median (float): The median latency, in seconds.
+        sigma (float): The standard deviation of the logarithm of the latency; larger values make the tail longer.
+
+    Returns:
+        LatencyDistribution: The distribution.
+    """
+    return lambda random_numbers: median * random_numbers.lognormvariate(0, sigma)
+
+
+def parse_latency(specification: str) -> LatencyDistribution:
+    """
+    Parse a latency distribution given on the command line, with all durations in milliseconds.
+
+    Args:
+        specification (str): Either `constant:<ms>`, `uniform:<low ms>:<high ms>` or `lognormal:<median ms>:<sigma>`.
+
+    Returns:
+        LatencyDistribution: The distribution.
+
+    Raises:
+        ArgumentTypeError: If the specification is malformed.
+    """
+    kind, *raw_arguments = specification.split(':')
+    try:
+        arguments = [float(raw_argument) for raw_argument in raw_arguments]
+    except ValueError:
+        raise argparse.ArgumentTypeError('Malformed latency: {0}'.format(specification))
+    if kind == 'constant' and len(arguments) == 1:
+        return constant_latency(arguments[0] / MILLISECONDS_PER_SECOND)
+    if kind == 'uniform' and len(arguments) == 2:
+        return uniform_latency(arguments[0] / MILLISECONDS_PER_SECOND, arguments[1] / MILLISECONDS_PER_SECOND)
+    if kind == 'lognormal' and len(arguments) == 2:
+        return lognormal_latency(arguments[0] / MILLISECONDS_PER_SECOND, arguments[1])
+    raise argparse.ArgumentTypeError('Malformed latency: {0}'.format(specification))
+
+
+@dataclass(frozen=True)
+class StandInBehaviour(object):
+    """
+    The configurable behaviour of the stand-in server.
+
+    Attributes:
+        latency (LatencyDistribution): The distribution the latency of every response is drawn from.
+        error_rate (float): The share of requests answered with `503 Service Unavailable`.
+        rate_limit_rate (float): The share of requests answered with `429 Too Many Requests`.
+        retry_after (int): The value of the `Retry-After` header of `429` responses, in seconds.
+        domain_emails_count (int | None): The number of emails listed by `/domain-search`, or None for the fixture's.
+        unknown_domains (frozenset[str]): The domains answered with the failed payloads.
+        seed (int | None): The seed of the random numbers driving latencies and injected failures.
+    """
+
+    latency: LatencyDistribution = constant_latency(0)
+    error_rate: float = 0
+    rate_limit_rate: float = 0
+    retry_after: int = 1
+    domain_emails_count: int | None = None
+    unknown_domains: frozenset[str] = frozenset(('nonexistent.com',))
+    seed: int | None = None
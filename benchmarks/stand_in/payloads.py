@@ -0,0 +1,116 @@
+"""
+This module builds the bodies served by the stand-in server from the payloads of `tests/mock_responses`.
+
+Every payload is adapted to the query it answers: the verified email is echoed back, and `/domain-search` lists the
+configured number of emails, numbered after the emails of the fixture and paginated with `limit` and `offset`.
+Malformed pagination parameters are rejected with a `ValueError`, to be answered with `400 Bad Request`.
+"""
+
+import copy
+import json
+from http import HTTPStatus
+from typing import Callable
+
+from benchmarks.stand_in.behaviour import StandInBehaviour
+from tests.mock_responses import failed, successful
+
+DEFAULT_PAGE_SIZE = 10
+
+_SUCCESSFUL_PAYLOADS: dict[str, Callable[[], dict]] = {  # noqa: WPS407
+    '/domain-search': successful.domain_search_successful_response,
+    '/email-finder': successful.domain_and_name_search_successful_response,
+    '/email-verifier': successful.email_verification_successful_response,
+    '/email-count': successful.email_count_successful_response,
+}
+_FAILED_PAYLOADS: dict[str, Callable[[], dict]] = {  # noqa: WPS407
+    '/domain-search': failed.domain_search_failed_response,
+    '/email-finder': failed.domain_and_name_search_failed_response,
+    '/email-verifier': failed.email_verification_failed_response,
+    '/email-count': failed.email_count_failed_response,
+}
+
+
+def serves(endpoint_path: str) -> bool:
+    """
+    Tell whether the stand-in server serves the given endpoint.
+
+    Args:
+        endpoint_path (str): The path of the endpoint, relative to the API version.
+
+    Returns:
+        bool: Whether the endpoint is served.
+    """
+    return endpoint_path in _SUCCESSFUL_PAYLOADS
+
+
+def build_body(behaviour: StandInBehaviour, endpoint_path: str, query_params: dict[str, str]) -> bytes:
+    """
+    Build the body answering a successful request of a served endpoint.
+
+    Args:
+        behaviour (StandInBehaviour): The behaviour of the server.
+        endpoint_path (str): The path of the endpoint, relative to the API version.
+        query_params (dict[str, str]): The query parameters of the request.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON body.
+    """
+    queried_email = query_params.get('email', '')
+    queried_domain = query_params.get('domain') or queried_email.partition('@')[2]
+    if queried_domain in behaviour.unknown_domains:
+        return _encode(_FAILED_PAYLOADS[endpoint_path]())
+    payload = _SUCCESSFUL_PAYLOADS[endpoint_path]()
+    if endpoint_path == '/domain-search':
+        _paginate(payload, behaviour.domain_emails_count, query_params)
+    elif endpoint_path == '/email-verifier' and 'email' in query_params:
+        payload['data']['email'] = query_params['email']
+        payload['meta']['params'] = {'email': query_params['email']}
+    return _encode(payload)
+
+
+def build_error_body(status: HTTPStatus, error_id: str, details: str | None = None) -> bytes:
+    """
+    Build the body of an error response, shaped like the errors of the Hunter API.
+
+    Args:
+        status (HTTPStatus): The status of the response.
+        error_id (str): The identifier of the error.
+        details (str | None): The description of the error, or None to use the phrase of the status.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON body.
+    """
+    error = {'id': error_id, 'code': status.value, 'details': details or status.phrase}
+    return _encode({'errors': [error]})
+
+
+def _paginate(payload: dict, emails_count: int | None, query_params: dict[str, str]) -> None:
+    email_templates = payload['data']['emails']
+    if emails_count is None:
+        emails_count = len(email_templates)
+    limit, offset = _page_bounds(query_params)
+    payload['data']['emails'] = [
+        _numbered_email(email_templates[index % len(email_templates)], index)
+        for index in range(offset, min(offset + limit, emails_count))
+    ]
+    payload['meta'].update(results=emails_count, limit=limit, offset=offset)
+
+
+def _page_bounds(query_params: dict[str, str]) -> tuple[int, int]:
+    limit = query_params.get('limit', str(DEFAULT_PAGE_SIZE))
+    offset = query_params.get('offset', '0')
+    are_integers = limit.isdecimal() and offset.isdecimal()
+    if not are_integers or int(limit) < 1:
+        raise ValueError('`limit` must be a positive integer and `offset` a non-negative integer.')
+    return int(limit), int(offset)
+
+
+def _numbered_email(email_template: dict, index: int) -> dict:
+    email_info = copy.deepcopy(email_template)
+    local_part, _, domain = email_info['value'].partition('@')
+    email_info['value'] = '{0}{1}@{2}'.format(local_part, index, domain)
+    return email_info
+
+
+def _encode(payload: dict) -> bytes:
+    return json.dumps(payload).encode('utf-8')
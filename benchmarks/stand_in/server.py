@@ -0,0 +1,186 @@
+"""This module implements the stand-in server, answering requests in background threads over real HTTP."""
+
+import random
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+from urllib.parse import parse_qsl, urlsplit
+
+from benchmarks.stand_in.behaviour import StandInBehaviour
+from benchmarks.stand_in.payloads import build_body, build_error_body, serves
+
+QueryParams = tuple[tuple[str, str], ...]
+Response = tuple[HTTPStatus, dict[str, str], bytes]
+
+API_VERSION_PATH = '/v2'
+SHUTDOWN_POLL_INTERVAL = 0.05
+ENCODED_BODIES_CACHE_SIZE = 4096
+
+
+@dataclass
+class StandInStats(object):
+    """
+    Counters of the responses sent by the stand-in server.
+
+    Attributes:
+        responses_by_status (dict[int, int]): The number of responses sent, by status code.
+    """
+
+    responses_by_status: dict[int, int] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    @property
+    def requests(self) -> int:
+        """The total number of requests answered."""
+        return sum(self.responses_by_status.values())
+
+    def record(self, status: int) -> None:
+        """
+        Record a sent response.
+
+        Args:
+            status (int): The status code of the response.
+        """
+        status_code = int(status)
+        with self._lock:
+            self.responses_by_status[status_code] = self.responses_by_status.get(status_code, 0) + 1
+
+
+class HunterStandInServer(object):  # noqa: WPS214
+    """
+    A local HTTP server standing in for the Hunter API.
+
+    The server answers every request in its own thread and keeps connections alive, like the real API does.
+    Encoded bodies are cached per query, so that the server spends its time waiting rather than serializing.
+    """
+
+    def __init__(self, behaviour: StandInBehaviour | None = None, host: str = '127.0.0.1', port: int = 0) -> None:
+        """
+        Bind the server, without serving requests yet.
+
+        Args:
+            behaviour (StandInBehaviour | None): The behaviour of the server, or None to answer at once, always well.
+            host (str): The address to listen on.
+            port (int): The port to listen on, or 0 to pick a free one.
+        """
+        self.behaviour = behaviour or StandInBehaviour()
+        self.stats = StandInStats()
+        self._host = host
+        self._random = random.Random(self.behaviour.seed)  # noqa: S311
+        self._random_lock = threading.Lock()
+        self._cached_body = lru_cache(maxsize=ENCODED_BODIES_CACHE_SIZE)(self._build_body)
+        self._http_server = _StandInHTTPServer(self, (host, port))
+        self._serving_thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        """The scheme and host to pass as the `base_url` of a client."""
+        return 'http://{0}:{1}'.format(self._host, self._http_server.server_port)
+
+    def __enter__(self) -> 'HunterStandInServer':
+        """
+        Start serving requests in a background thread.
+
+        Returns:
+            HunterStandInServer: The server itself.
+        """
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop serving requests and release the port."""
+        self.stop()
+
+    def start(self) -> None:
+        """Start serving requests in a background thread."""
+        self._serving_thread = threading.Thread(target=self.serve_forever, name='hunter-stand-in', daemon=True)
+        self._serving_thread.start()
+
+    def serve_forever(self) -> None:
+        """Serve requests in the calling thread until the server is stopped."""
+        self._http_server.serve_forever(poll_interval=SHUTDOWN_POLL_INTERVAL)
+
+    def stop(self) -> None:
+        """Stop serving requests and release the port."""
+        self._http_server.shutdown()
+        self._http_server.server_close()
+        if self._serving_thread is not None:
+            self._serving_thread.join()
+
+    def respond(self, request_target: str) -> Response:
+        """
+        Build the response to a request, after waiting for its latency.
+
+        Args:
+            request_target (str): The path and query of the request.
+
+        Returns:
+            Response: The status, the extra headers and the body of the response.
+        """
+        injected_failure = self._wait_and_inject_failure()
+        if injected_failure is not None:
+            return injected_failure
+        split_url = urlsplit(request_target)
+        endpoint_path = split_url.path.removeprefix(API_VERSION_PATH)
+        if not serves(endpoint_path):
+            return HTTPStatus.NOT_FOUND, {}, build_error_body(HTTPStatus.NOT_FOUND, 'not_found')
+        query: QueryParams = tuple(sorted(parse_qsl(split_url.query)))
+        return self._respond_to_query(endpoint_path, query)
+
+    def _wait_and_inject_failure(self) -> Response | None:
+        with self._random_lock:
+            latency = self.behaviour.latency(self._random)
+            failure_draw = self._random.random()
+        threading.Event().wait(latency)
+        if failure_draw < self.behaviour.rate_limit_rate:
+            retry_after = {'Retry-After': str(self.behaviour.retry_after)}
+            return HTTPStatus.TOO_MANY_REQUESTS, retry_after, build_error_body(HTTPStatus.TOO_MANY_REQUESTS, 'limit')
+        if failure_draw < self.behaviour.rate_limit_rate + self.behaviour.error_rate:
+            return HTTPStatus.SERVICE_UNAVAILABLE, {}, build_error_body(HTTPStatus.SERVICE_UNAVAILABLE, 'unavailable')
+        return None
+
+    def _respond_to_query(self, endpoint_path: str, query: QueryParams) -> Response:
+        try:
+            body = self._cached_body(endpoint_path, query)
+        except ValueError as invalid_query:
+            error_body = build_error_body(HTTPStatus.BAD_REQUEST, 'wrong_params', str(invalid_query))
+            return HTTPStatus.BAD_REQUEST, {}, error_body
+        return HTTPStatus.OK, {}, body
+
+    def _build_body(self, endpoint_path: str, query: QueryParams) -> bytes:
+        return build_body(self.behaviour, endpoint_path, dict(query))
+
+
+class _StandInHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, stand_in: HunterStandInServer, server_address: tuple[str, int]) -> None:
+        super().__init__(server_address, _StandInRequestHandler)
+        self.stand_in = stand_in
+
+
+class _StandInRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server: _StandInHTTPServer
+
+    def do_GET(self) -> None:  # noqa: N802
+        status, headers, body = self.server.stand_in.respond(self.path)
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for header_name, header_value in headers.items():
+            self.send_header(header_name, header_value)
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.stand_in.stats.record(status)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: WPS125
+        """Keep quiet, as logging every request would dominate the time spent by the server."""
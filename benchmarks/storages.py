@@ -0,0 +1,173 @@
+"""
+This module benchmarks the storage backends on the workload of the email validation service.
+
+Every backend is filled with verdicts of a million emails (ten thousand in quick mode), one `set` at a time and in
+a single `set_many`, and then queried for a random sample of stored and missing emails, one `get` at a time and in
+a single `get_many`. Run it with `python -m benchmarks.storages`; it prints one JSON object per measurement.
+"""
+
+import itertools
+import random
+import sys
+import tempfile
+from functools import partial
+from pathlib import Path
+from typing import Callable, Iterator
+
+from benchmarks.measuring import microseconds, time_once, write_measurements
+from hunter_client.storages.dummy import DummyStorage
+from hunter_client.storages.interface import ResultsStorage
+from hunter_client.storages.lru import LRUStorage
+from hunter_client.storages.sqlite import SQLiteStorage
+
+KEYS_COUNT = 1000000
+QUICK_KEYS_COUNT = 10000
+SAMPLE_SIZE = 100000
+RANDOM_SEED = 42
+
+VerdictsStorage = ResultsStorage[str, bool]
+
+
+def storage_factories(keys_count: int, directory: Path) -> dict[str, Callable[[], VerdictsStorage]]:
+    """
+    Return the factories of the benchmarked backends, keyed by the backend names.
+
+    Args:
+        keys_count (int): The number of keys the backends must hold without evicting any of them.
+        directory (Path): The directory to create database files in.
+
+    Returns:
+        dict[str, Callable[[], VerdictsStorage]]: The factories, each creating a new empty backend.
+    """
+    database_paths = (directory / 'storage{0}.sqlite3'.format(index) for index in itertools.count())
+    return {
+        'dummy': DummyStorage,
+        'lru': partial(LRUStorage, keys_count),
+        'sqlite': lambda: SQLiteStorage(next(database_paths)),
+    }
+
+
+Operation = Callable[[], object]
+
+
+class StorageWorkload(object):
+    """The measured operations of a backend, run against two instances of it."""
+
+    def __init__(self, create_storage: Callable[[], VerdictsStorage], keys: list[str]) -> None:
+        """
+        Create the instances of the backend and pick the sampled keys.
+
+        Args:
+            create_storage (Callable[[], VerdictsStorage]): The factory of the backend.
+            keys (list[str]): The keys to fill the backend with.
+        """
+        self._storage = create_storage()
+        self._batch_storage = create_storage()
+        self._keys = keys
+        sample_size = min(SAMPLE_SIZE, len(keys))
+        self._stored_sample = random.Random(RANDOM_SEED).sample(keys, sample_size)  # noqa: S311
+        self._missing_sample = ['missing{0}@example.com'.format(index) for index in range(sample_size)]
+
+    def operations(self) -> dict[str, tuple[int, Operation]]:
+        """
+        Return the operations in the order they must be measured, keyed by the names of their measurements.
+
+        The first instance is filled one key at a time and then queried, the second one is filled in a single batch.
+
+        Returns:
+            dict[str, tuple[int, Operation]]: The number of keys each operation processes and the operation.
+        """
+        sample_size = len(self._stored_sample)
+        return {
+            'set': (len(self._keys), self._set_one_by_one),
+            'get_hit': (sample_size, partial(self._look_up_one_by_one, self._stored_sample)),
+            'get_miss': (sample_size, partial(self._look_up_one_by_one, self._missing_sample)),
+            'get_many': (sample_size, partial(self._storage.get_many, self._stored_sample)),
+            'set_many': (len(self._keys), self._set_in_one_batch),
+        }
+
+    def close(self) -> None:
+        """Close the instances of the backend, if they are persistent."""
+        for storage in (self._storage, self._batch_storage):
+            if isinstance(storage, SQLiteStorage):
+                storage.close()
+
+    def _set_one_by_one(self) -> None:
+        for key in self._keys:
+            self._storage.set(key, value_to_store=True)
+        self._settle(self._storage)
+
+    def _set_in_one_batch(self) -> None:
+        self._batch_storage.set_many(dict.fromkeys(self._keys, True))  # noqa: WPS425
+        self._settle(self._batch_storage)
+
+    def _look_up_one_by_one(self, keys: list[str]) -> None:
+        for key in keys:
+            self._storage.get(key)
+
+    def _settle(self, storage: VerdictsStorage) -> None:
+        if isinstance(storage, SQLiteStorage):
+            storage.flush()
+
+
+def measurement(benchmark: str, backend: str, operations_count: int, elapsed: float) -> dict:
+    """
+    Describe the throughput of a measured operation.
+
+    Args:
+        benchmark (str): The name of the measured operation.
+        backend (str): The name of the measured backend.
+        operations_count (int): The number of keys the operation processed.
+        elapsed (float): The time the operation took, in seconds.
+
+    Returns:
+        dict: The time per key, in microseconds, and the number of keys processed per second.
+    """
+    return {
+        'benchmark': benchmark,
+        'backend': backend,
+        'keys_count': operations_count,
+        'per_key_us': microseconds(elapsed / operations_count),
+        'keys_per_second': round(operations_count / elapsed),
+    }
+
+
+def measure_backend(backend: str, workload: StorageWorkload) -> Iterator[dict]:
+    """
+    Measure the operations of a backend, in order, each one only once.
+
+    Args:
+        backend (str): The name of the backend.
+        workload (StorageWorkload): The workload of the backend.
+
+    Yields:
+        dict: The measurements.
+    """
+    try:  # noqa: WPS501
+        yield from (
+            measurement(benchmark, backend, keys_count, time_once(operation))
+            for benchmark, (keys_count, operation) in workload.operations().items()
+        )
+    finally:
+        workload.close()
+
+
+def run(quick: bool = False) -> Iterator[dict]:
+    """
+    Measure every backend.
+
+    Args:
+        quick (bool): Whether to fill the backends with few keys, as a smoke test.
+
+    Yields:
+        dict: The measurements.
+    """
+    keys_count = QUICK_KEYS_COUNT if quick else KEYS_COUNT
+    keys = ['person{0}@example.com'.format(index) for index in range(keys_count)]
+    with tempfile.TemporaryDirectory() as directory:
+        for backend, create_storage in storage_factories(keys_count, Path(directory)).items():
+            yield from measure_backend(backend, StorageWorkload(create_storage, keys))
+
+
+if __name__ == '__main__':
+    write_measurements(run(), sys.stdout)
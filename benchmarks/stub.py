@@ -0,0 +1,115 @@
+"""
+This module provides an in-process stand-in for the Hunter API, used by the benchmarks that exercise the client.
+
+`StubAdapter` is a transport adapter for `requests` that answers every request with a canned body chosen by the
+endpoint path, optionally after a simulated network latency. Mounted on a session, it lets the whole client stack
+run without sockets, so that the benchmarks measure the client rather than the network.
+"""
+
+import time
+from http import HTTPStatus
+from typing import Mapping, Optional, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+
+from benchmarks.payloads import (
+    build_domain_search_payload,
+    build_email_count_payload,
+    build_email_finder_payload,
+    build_email_verifier_payload,
+    encode,
+)
+
+API_VERSION_PATH = '/v2'
+DOMAIN_SEARCH_EMAILS_COUNT = 10
+SOURCES_COUNT = 3
+
+CertificatePart = bytes | str
+TimeoutPair = tuple[float, Optional[float]]
+Timeout = Optional[Union[float, TimeoutPair]]
+Certificate = Optional[Union[CertificatePart, tuple[CertificatePart, CertificatePart]]]
+
+
+def default_bodies() -> dict[str, bytes]:
+    """
+    Build the canned bodies of all endpoints, keyed by their paths relative to the API version.
+
+    Returns:
+        dict[str, bytes]: The bodies of a domain search listing ten emails and of responses citing three sources.
+    """
+    return {
+        '/domain-search': encode(build_domain_search_payload(DOMAIN_SEARCH_EMAILS_COUNT)),
+        '/email-finder': encode(build_email_finder_payload(SOURCES_COUNT)),
+        '/email-verifier': encode(build_email_verifier_payload(SOURCES_COUNT)),
+        '/email-count': encode(build_email_count_payload()),
+    }
+
+
+class StubAdapter(BaseAdapter):
+    """Transport adapter answering requests with canned bodies instead of sending them over the network."""
+
+    def __init__(self, bodies: Mapping[str, bytes], latency: float = 0) -> None:
+        """
+        Initialize the adapter.
+
+        Args:
+            bodies (Mapping[str, bytes]): The bodies to answer with, keyed by endpoint paths.
+            latency (float): The simulated network latency of every request, in seconds.
+        """
+        super().__init__()
+        self._bodies = bodies
+        self._latency = latency
+
+    def send(  # noqa: WPS211
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Timeout = None,
+        verify: bool | str = True,
+        cert: Certificate = None,
+        proxies: Mapping[str, str] | None = None,
+    ) -> requests.Response:
+        """
+        Answer the request with the canned body of its endpoint.
+
+        Args:
+            request (requests.PreparedRequest): The request to answer.
+            stream (bool): Ignored.
+            timeout (Timeout): Ignored.
+            verify (bool | str): Ignored.
+            cert (Certificate): Ignored.
+            proxies (Mapping[str, str] | None): Ignored.
+
+        Returns:
+            requests.Response: The canned response.
+        """
+        if self._latency:
+            time.sleep(self._latency)
+        response = requests.Response()
+        response.status_code = HTTPStatus.OK
+        response.url = request.url or ''
+        response.request = request
+        response.headers['Content-Type'] = 'application/json'
+        response._content = self._bodies[urlsplit(response.url).path.removeprefix(API_VERSION_PATH)]  # noqa: WPS437
+        return response
+
+    def close(self) -> None:
+        """Release nothing, as the adapter holds no connections."""
+
+
+def create_stubbed_session(latency: float = 0, bodies: Mapping[str, bytes] | None = None) -> requests.Session:
+    """
+    Create an HTTP session whose requests to the Hunter API are answered by a `StubAdapter`.
+
+    Args:
+        latency (float): The simulated network latency of every request, in seconds.
+        bodies (Mapping[str, bytes] | None): The bodies to answer with, or None to use `default_bodies`.
+
+    Returns:
+        requests.Session: The stubbed session.
+    """
+    stubbed_session = requests.Session()
+    stubbed_session.mount('https://', StubAdapter(bodies or default_bodies(), latency))
+    return stubbed_session
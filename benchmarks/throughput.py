@@ -0,0 +1,75 @@
+"""
+This module benchmarks the end-to-end throughput of the email validation service.
+
+Emails are validated with `PersistentEmailValidationService.validate_many` through a client whose requests are
+answered by the in-process `StubAdapter` after a simulated network latency, so the measurements show how well the
+service overlaps requests at different concurrency levels. Without latency they show the CPU cost per validation.
+Run it with `python -m benchmarks.throughput`; it prints one JSON object per measurement.
+"""
+
+import sys
+from collections import deque
+from functools import partial
+from typing import Iterator
+
+from benchmarks.measuring import microseconds, time_once, write_measurements
+from benchmarks.stub import create_stubbed_session
+from hunter_client.client import HunterClient
+from hunter_client.services.email_validation import PersistentEmailValidationService
+from hunter_client.storages.dummy import DummyStorage
+
+EMAILS_COUNT = 2000
+QUICK_EMAILS_COUNT = 100
+LATENCIES = (0, 0.005)
+CONCURRENCY_LEVELS = (1, 8, 32)
+
+
+def validate_all(service: PersistentEmailValidationService, emails_count: int, max_concurrency: int) -> None:
+    """Validate the given number of distinct emails, discarding the results."""
+    emails = ('person{0}@example.com'.format(index) for index in range(emails_count))
+    deque(service.validate_many(emails, max_concurrency=max_concurrency), maxlen=0)
+
+
+def measure(emails_count: int, latency: float, max_concurrency: int) -> dict:
+    """
+    Measure validating the given number of emails.
+
+    Args:
+        emails_count (int): The number of validated emails.
+        latency (float): The simulated network latency of every request, in seconds.
+        max_concurrency (int): The maximum number of validations in flight.
+
+    Returns:
+        dict: The time per validation, in microseconds, and the number of validations per second.
+    """
+    hunter_client = HunterClient('benchmark', http_session=create_stubbed_session(latency))
+    service = PersistentEmailValidationService('benchmark', DummyStorage(), hunter_client=hunter_client)
+    elapsed = time_once(partial(validate_all, service, emails_count, max_concurrency))
+    hunter_client.close()
+    return {
+        'benchmark': 'validate_many',
+        'emails_count': emails_count,
+        'latency_ms': latency * 1000,
+        'max_concurrency': max_concurrency,
+        'per_email_us': microseconds(elapsed / emails_count),
+        'emails_per_second': round(emails_count / elapsed),
+    }
+
+
+def run(quick: bool = False) -> Iterator[dict]:
+    """
+    Measure validating emails at every combination of latency and concurrency.
+
+    Args:
+        quick (bool): Whether to validate few emails, as a smoke test.
+
+    Yields:
+        dict: The measurements.
+    """
+    emails_count = QUICK_EMAILS_COUNT if quick else EMAILS_COUNT
+    for latency in LATENCIES:
+        yield from (measure(emails_count, latency, max_concurrency) for max_concurrency in CONCURRENCY_LEVELS)
+
+
+if __name__ == '__main__':
+    write_measurements(run(), sys.stdout)
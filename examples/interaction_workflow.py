@@ -12,11 +12,14 @@ emails_storage = DummyStorage[str, bool]()
 email_validation_service = PersistentEmailValidationService('qwerty12345', emails_storage)
 emails_to_validate = ['email1@example.com', 'email2@anotherdomain.com', 'nonexistent@email.com']
 
-for email in emails_to_validate:
-    is_valid = email_validation_service.validate_and_store_email_status(email)
+validated_emails = []
+for email, verdict in email_validation_service.validate_many(emails_to_validate, max_concurrency=3):
+    if isinstance(verdict, Exception):
+        logger.error('Email {0} could not be validated: {1}'.format(email, verdict))
+    else:
+        logger.info('Email {0} is valid: {1}'.format(email, verdict))
+        validated_emails.append(email)
 
-for stored_email in emails_to_validate:
-    validity_check_result = emails_storage.get(stored_email)
-    if not validity_check_result:
+for stored_email in validated_emails:
+    if emails_storage.get(stored_email) is None:
         logger.error('Somehow the email {0} was not stored in the storage system.'.format(stored_email))
-    logger.info('Email {0} is valid: {1}'.format(stored_email, is_valid))
@@ -0,0 +1 @@
+"""This package contains the command line interface for validating emails in bulk with the Hunter.io API."""
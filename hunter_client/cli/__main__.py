@@ -0,0 +1,125 @@
+"""
+This module validates the emails listed in a CSV or JSON Lines input in bulk, streaming their outcomes.
+
+Run `python -m hunter_client.cli emails.csv --output outcomes.jsonl`, or `hunter-validate` once the package is
+installed. The input is read from the standard input if no file is given, and the outcomes are written to the
+standard output unless `--output` is given, so the command can be part of a pipeline. The emails are read, validated
+and written one at a time by a pool of workers, which keeps the memory use constant whatever the size of the input,
+and the live throughput is reported on the standard error.
+"""
+
+import argparse
+import os
+import sys
+from typing import Iterator
+
+from hunter_client.cli.progress import ThroughputReporter
+from hunter_client.cli.readers import InputFormat, detect_input_format, read_emails
+from hunter_client.cli.streaming import IN_FLIGHT_VALIDATIONS_PER_WORKER, open_job_queue, validate_stream
+from hunter_client.cli.writers import OutcomeWriter, OutputFormat, ValidationOutcome
+
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse the command line.
+
+    Args:
+        argv (list[str] | None): The arguments to parse, or None to parse the ones of the process.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(prog='hunter-validate', description='Validate emails in bulk.')
+    _add_input_arguments(parser)
+    _add_output_arguments(parser)
+    parser.add_argument('--api-key', default=os.environ.get('HUNTER_API_KEY'), help='default: $HUNTER_API_KEY')
+    parser.add_argument('--workers', type=int, default=8, help='the number of concurrent validations')
+    parser.add_argument('--database', help='an SQLite database storing the verdicts, reused on later runs')
+    arguments = parser.parse_args(argv)
+    if arguments.api_key is None:
+        parser.error('the API key must be given with --api-key or the HUNTER_API_KEY environment variable')
+    if arguments.workers < 1:
+        parser.error('--workers must be a positive integer')
+    if arguments.progress_interval <= 0:
+        parser.error('--progress-interval must be a positive number of seconds')
+    return arguments
+
+
+def run(arguments: argparse.Namespace) -> None:
+    """
+    Validate the emails of the input and write their outcomes.
+
+    Args:
+        arguments (argparse.Namespace): The parsed command line.
+    """
+    max_in_flight = arguments.workers * IN_FLIGHT_VALIDATIONS_PER_WORKER
+    with open_job_queue(arguments.api_key, arguments.workers, arguments.database) as job_queue:
+        _write_outcomes(validate_stream(job_queue, _read_input_emails(arguments), max_in_flight), arguments)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    Run the command line interface.
+
+    Args:
+        argv (list[str] | None): The arguments to parse, or None to parse the ones of the process.
+    """
+    arguments = parse_arguments(argv)
+    try:
+        run(arguments)
+    except ValueError as input_error:
+        sys.exit('error: {0}'.format(input_error))
+
+
+def _add_input_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        'input',
+        nargs='?',
+        type=argparse.FileType('r', encoding='utf-8'),
+        default='-',
+        help='the CSV or JSON Lines file listing the emails (default: the standard input)',
+    )
+    parser.add_argument(
+        '--input-format',
+        choices=[input_format.value for input_format in InputFormat],
+        help='the format of the input (default: guessed from its extension, CSV for the standard input)',
+    )
+    parser.add_argument('--column', default='email', help='the CSV column or JSON field holding the emails')
+    parser.add_argument('--no-header', action='store_true', help='the CSV input has no header, read its first column')
+
+
+def _add_output_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        '--output',
+        type=argparse.FileType('w', encoding='utf-8'),
+        default=sys.stdout,
+        help='the file to write the outcomes to (default: the standard output)',
+    )
+    parser.add_argument(
+        '--output-format',
+        choices=[output_format.value for output_format in OutputFormat],
+        default=OutputFormat.JSONL.value,
+        help='the format of the outcomes',
+    )
+    parser.add_argument('--progress-interval', type=float, default=1, help='the seconds between progress reports')
+
+
+def _read_input_emails(arguments: argparse.Namespace) -> Iterator[str]:
+    input_format = detect_input_format(arguments.input.name)
+    if arguments.input_format is not None:
+        input_format = InputFormat(arguments.input_format)
+    return read_emails(arguments.input, input_format, arguments.column, has_header=not arguments.no_header)
+
+
+def _write_outcomes(outcomes: Iterator[ValidationOutcome], arguments: argparse.Namespace) -> None:
+    outcome_writer = OutcomeWriter(arguments.output, OutputFormat(arguments.output_format))
+    throughput_reporter = ThroughputReporter(sys.stderr, arguments.progress_interval)
+    for outcome in outcomes:
+        outcome_writer.write(outcome)
+        throughput_reporter.record(outcome)
+    outcome_writer.flush()
+    throughput_reporter.finish()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+This module reports the live throughput of a bulk validation.
+
+The reporter rewrites a single status line on a terminal stream, usually the standard error, at most once per
+interval, and writes a final summary once the validation is over.
+"""
+
+import time
+from typing import Callable, TextIO
+
+from hunter_client.cli.writers import ValidationOutcome
+
+
+class ThroughputReporter(object):
+    """A periodic reporter of the number of validated emails and of the rate they are validated at."""
+
+    def __init__(
+        self,
+        stream: TextIO,
+        interval: float = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the reporter and start measuring.
+
+        Args:
+            stream (TextIO): The stream to write the status line to.
+            interval (float): The minimum number of seconds between two status lines.
+            clock (Callable[[], float]): A monotonic clock returning the current time in seconds.
+        """
+        self._stream = stream
+        self._interval = interval
+        self._clock = clock
+        self._started_at = clock()
+        self._reported_at = self._started_at
+        self._reported_count = 0
+        self.validated = 0
+        self.failed = 0
+
+    def record(self, outcome: ValidationOutcome) -> None:
+        """
+        Count the outcome of a validation, reporting the progress if the interval has passed.
+
+        Args:
+            outcome (ValidationOutcome): The outcome.
+        """
+        self.validated += 1
+        if outcome.error is not None:
+            self.failed += 1
+        now = self._clock()
+        since_report = now - self._reported_at
+        if since_report >= self._interval and since_report > 0:
+            validated_since_report = self.validated - self._reported_count
+            self._write_status(validated_since_report / since_report, line_end='\r')
+            self._reported_at = now
+            self._reported_count = self.validated
+
+    def finish(self) -> None:
+        """Report the final counts and the average rate of the whole validation."""
+        elapsed = self._clock() - self._started_at
+        average_rate = self.validated / elapsed if elapsed > 0 else 0
+        self._write_status(average_rate, line_end='\n')
+
+    def _write_status(self, rate: float, line_end: str) -> None:
+        status = 'validated {0} emails, {1} failed, {2:.1f} emails/s'.format(self.validated, self.failed, rate)
+        self._stream.write(status + line_end)
+        self._stream.flush()
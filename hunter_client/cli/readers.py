@@ -0,0 +1,93 @@
+"""
+This module reads the emails to validate from CSV or JSON Lines input, one record at a time.
+
+The input is consumed as an iterable of lines, e.g. an open file or the standard input, so that arbitrarily large
+inputs are read in constant memory. Records without an email are skipped.
+"""
+
+import csv
+import enum
+import json
+from pathlib import PurePath
+from typing import Iterable, Iterator
+
+_JSON_LINES_SUFFIXES = frozenset(('.jsonl', '.ndjson'))
+
+
+class InputFormat(enum.Enum):
+    """
+    The format of the input listing the emails to validate.
+
+    Attributes:
+        CSV: Comma-separated values, with the emails in one of the columns.
+        JSONL: JSON Lines, with either an object holding the email or the email itself as a string on every line.
+    """
+
+    CSV = 'csv'  # noqa: WPS115
+    JSONL = 'jsonl'  # noqa: WPS115
+
+
+def detect_input_format(input_name: str) -> InputFormat:
+    """
+    Guess the format of an input from its file name.
+
+    Args:
+        input_name (str): The name of the input file, or `<stdin>` for the standard input.
+
+    Returns:
+        InputFormat: JSON Lines for `.jsonl` and `.ndjson` files, CSV for anything else.
+    """
+    if PurePath(input_name).suffix.lower() in _JSON_LINES_SUFFIXES:
+        return InputFormat.JSONL
+    return InputFormat.CSV
+
+
+def read_emails(
+    lines: Iterable[str],
+    input_format: InputFormat,
+    column: str = 'email',
+    has_header: bool = True,
+) -> Iterator[str]:
+    """
+    Stream the emails listed in the input.
+
+    Args:
+        lines (Iterable[str]): The lines of the input.
+        input_format (InputFormat): The format of the input.
+        column (str): The CSV column or the JSON field holding the emails.
+        has_header (bool): Whether the CSV input starts with a header; if not, the emails are in its first column.
+
+    Returns:
+        Iterator[str]: The emails, stripped of surrounding whitespace.
+    """
+    if input_format is InputFormat.JSONL:
+        return _read_json_lines_emails(lines, column)
+    return _read_csv_emails(lines, column, has_header)
+
+
+def _read_csv_emails(lines: Iterable[str], column: str, has_header: bool) -> Iterator[str]:
+    rows = csv.reader(lines)
+    column_index = 0
+    if has_header:
+        header = next(rows, [])
+        if column not in header:
+            raise ValueError('The CSV input has no `{0}` column.'.format(column))
+        column_index = header.index(column)
+    for row in rows:
+        if len(row) > column_index and row[column_index].strip():
+            yield row[column_index].strip()
+
+
+def _read_json_lines_emails(lines: Iterable[str], field_name: str) -> Iterator[str]:
+    for line_number, line in enumerate(lines, start=1):
+        email = _parse_json_line(line, line_number, field_name) if line.strip() else None
+        if isinstance(email, str) and email.strip():
+            yield email.strip()
+
+
+def _parse_json_line(line: str, line_number: int, field_name: str) -> object:
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError as decode_error:
+        raise ValueError('Line {0} of the JSON Lines input is not valid JSON.'.format(line_number)) from decode_error
+    return record.get(field_name) if isinstance(record, dict) else record
@@ -0,0 +1,91 @@
+"""
+This module validates a stream of emails concurrently, yielding their outcomes in the order of the input.
+
+The emails are submitted to a `ValidationJobQueue` as batch jobs, and only a bounded number of them is in flight at
+any moment, so that the input may be arbitrarily long. Unless a database is given, the verdicts are kept in a bounded
+in-memory storage, so that the memory use does not grow with the input either. As with
+`PersistentEmailValidationService.validate_many`, a failed validation does not stop the stream: it is reported in
+its outcome instead.
+"""
+
+from collections import deque
+from concurrent.futures import Future
+from contextlib import ExitStack, contextmanager
+from typing import Iterable, Iterator
+
+from hunter_client.cli.writers import ValidationOutcome
+from hunter_client.client import HunterClient
+from hunter_client.services.email_validation import PersistentEmailValidationService
+from hunter_client.services.job_queue import JobClass, ValidationJobQueue
+from hunter_client.storages.interface import ResultsStorage
+from hunter_client.storages.lru import LRUStorage
+from hunter_client.storages.sqlite import SQLiteStorage
+
+IN_FLIGHT_VALIDATIONS_PER_WORKER = 2
+_PendingValidation = tuple[str, 'Future[bool]']
+
+
+@contextmanager
+def open_job_queue(api_key: str, workers: int, database_path: str | None = None) -> Iterator[ValidationJobQueue]:
+    """
+    Start a queue of email validations, shutting it down on exit.
+
+    Args:
+        api_key (str): The API key for accessing the Hunter.io API.
+        workers (int): The number of concurrent validations.
+        database_path (str | None): An SQLite database to store the verdicts in and reuse them from, if any.
+
+    Yields:
+        ValidationJobQueue: The queue, accepting batch jobs only.
+    """
+    max_in_flight = workers * IN_FLIGHT_VALIDATIONS_PER_WORKER
+    with ExitStack() as exit_stack:
+        results_storage: ResultsStorage[str, bool] = LRUStorage[str, bool](max_entries=max_in_flight)
+        if database_path is not None:
+            results_storage = exit_stack.enter_context(SQLiteStorage[bool](database_path))
+        validation_service = PersistentEmailValidationService(
+            hunter_api_key=api_key,
+            results_storage=results_storage,
+            read_through=database_path is not None,
+            hunter_client=HunterClient(api_key=api_key, pool_size=workers),
+        )
+        job_queue = ValidationJobQueue(
+            validation_service,
+            workers=workers,
+            interactive_workers=0,
+            max_queued_batch=max_in_flight,
+        )
+        yield exit_stack.enter_context(job_queue)
+
+
+def validate_stream(
+    job_queue: ValidationJobQueue,
+    emails: Iterable[str],
+    max_in_flight: int,
+) -> Iterator[ValidationOutcome]:
+    """
+    Validate the emails concurrently and yield their outcomes in the order of the input.
+
+    Args:
+        job_queue (ValidationJobQueue): The queue running the validations.
+        emails (Iterable[str]): The emails to validate.
+        max_in_flight (int): The maximum number of emails submitted but not yielded yet.
+
+    Yields:
+        ValidationOutcome: The outcome of the validation of every email.
+    """
+    in_flight: deque[_PendingValidation] = deque()
+    for email in emails:
+        in_flight.append((email, job_queue.submit(email, JobClass.BATCH)))
+        if len(in_flight) >= max_in_flight:
+            yield _outcome(*in_flight.popleft())
+    while in_flight:
+        yield _outcome(*in_flight.popleft())
+
+
+def _outcome(email: str, validation: 'Future[bool]') -> ValidationOutcome:
+    try:
+        is_valid = validation.result()
+    except Exception as validation_error:
+        return ValidationOutcome(email, None, '{0}: {1}'.format(type(validation_error).__name__, validation_error))
+    return ValidationOutcome(email, is_valid)
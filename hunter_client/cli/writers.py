@@ -0,0 +1,76 @@
+"""
+This module writes the outcomes of email validations as a stream of CSV rows or JSON Lines.
+
+Every outcome is written as soon as it is known, so that the output of a long run can be followed while it is
+produced, and nothing but the current outcome is kept in memory.
+"""
+
+import csv
+import enum
+import json
+from typing import NamedTuple, TextIO
+
+_OUTCOME_FIELDS = ('email', 'is_valid', 'error')
+
+
+class OutputFormat(enum.Enum):
+    """
+    The format of the output listing the validation outcomes.
+
+    Attributes:
+        CSV: Comma-separated values with an `email,is_valid,error` header.
+        JSONL: JSON Lines, with an object holding the email, the verdict and the error on every line.
+    """
+
+    CSV = 'csv'  # noqa: WPS115
+    JSONL = 'jsonl'  # noqa: WPS115
+
+
+class ValidationOutcome(NamedTuple):
+    """
+    The outcome of the validation of a single email.
+
+    Attributes:
+        email (str): The validated email.
+        is_valid (bool | None): Whether the email is valid, or None if its validation failed.
+        error (str | None): The reason the validation failed, if it did.
+    """
+
+    email: str
+    is_valid: bool | None
+    error: str | None = None
+
+
+class OutcomeWriter(object):
+    """A writer of validation outcomes to a text stream, in one of the output formats."""
+
+    def __init__(self, stream: TextIO, output_format: OutputFormat) -> None:
+        """
+        Initialize the writer, writing the CSV header if needed.
+
+        Args:
+            stream (TextIO): The stream to write the outcomes to.
+            output_format (OutputFormat): The format of the output.
+        """
+        self._stream = stream
+        self._output_format = output_format
+        self._csv_writer = csv.writer(stream)
+        if output_format is OutputFormat.CSV:
+            self._csv_writer.writerow(_OUTCOME_FIELDS)
+
+    def write(self, outcome: ValidationOutcome) -> None:
+        """
+        Write the outcome of a validation.
+
+        Args:
+            outcome (ValidationOutcome): The outcome.
+        """
+        if self._output_format is OutputFormat.CSV:
+            self._csv_writer.writerow(('' if field_value is None else field_value for field_value in outcome))
+        else:
+            outcome_record = dict(zip(_OUTCOME_FIELDS, outcome))
+            self._stream.write('{0}\n'.format(json.dumps(outcome_record)))
+
+    def flush(self) -> None:
+        """Flush the outcomes written so far to the stream."""
+        self._stream.flush()
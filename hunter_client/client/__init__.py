@@ -1,5 +1,31 @@
+from hunter_client.client.async_client import AsyncHunterClient
 from hunter_client.client.client import HunterClient
+from hunter_client.client.coalescing import AsyncRequestCoalescer, RequestCoalescer
+from hunter_client.client.credits import CallPriority, CreditBudget, CreditTracker, call_priority, current_priority
+from hunter_client.client.metrics import InProcessMetrics, MetricsRecorder
+from hunter_client.client.prometheus import render_prometheus_text
+from hunter_client.client.rate_limiting import RateLimiter
+from hunter_client.client.response_cache import ResponseCache
+from hunter_client.client.retrying import RetryPolicy
+from hunter_client.client.timing import CallPhase, CallTimer, CallTimings
 
 __all__ = [
+    'AsyncHunterClient',
+    'AsyncRequestCoalescer',
+    'CallPhase',
+    'CallPriority',
+    'CallTimer',
+    'CallTimings',
+    'CreditBudget',
+    'CreditTracker',
     'HunterClient',
+    'InProcessMetrics',
+    'MetricsRecorder',
+    'RateLimiter',
+    'RequestCoalescer',
+    'ResponseCache',
+    'RetryPolicy',
+    'call_priority',
+    'current_priority',
+    'render_prometheus_text',
 ]
@@ -0,0 +1,109 @@
+"""
+This module provides an asynchronous client for interacting with the Hunter API.
+
+The AsyncHunterClient class defined in this module exposes the same functionality as `HunterClient`, but its endpoint
+handlers are coroutines running on top of `httpx.AsyncClient`. This allows a single event loop to keep many
+Hunter API calls in flight at once instead of dedicating a thread to each of them.
+"""
+
+from types import TracebackType
+
+import httpx
+
+from hunter_client.client.async_endpoint_handlers import (
+    AsyncDomainAndNameSearcher,
+    AsyncDomainSearcher,
+    AsyncEmailCounter,
+    AsyncEmailVerifier,
+)
+from hunter_client.client.coalescing import AsyncRequestCoalescer
+from hunter_client.client.credits import CreditTracker
+from hunter_client.client.endpoint_handlers import HUNTER_API_BASE_URL
+from hunter_client.client.metrics import MetricsRecorder
+from hunter_client.client.rate_limiting import RateLimiter
+from hunter_client.client.response_cache import ResponseCache
+from hunter_client.client.retrying import RetryPolicy
+from hunter_client.client.timing import CallTimer
+from hunter_client.services.response_models.validation import ValidationLevel
+
+
+class AsyncHunterClient(object):  # noqa: WPS230
+    """
+    Asynchronous client for interacting with the Hunter.io API via HTTP requests.
+
+    This class exposes functionality of the Hunter.io API endpoints as coroutines.
+    See https://hunter.io/api-documentation/v2 for more information.
+
+    The client owns its HTTP session unless one is passed in explicitly, so it should either be used as an
+    asynchronous context manager or closed with `aclose` once it is no longer needed. A session passed in is left
+    open, to be closed by its owner.
+    """
+
+    def __init__(  # noqa: WPS211
+        self,
+        api_key: str,
+        http_session: httpx.AsyncClient | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        request_coalescer: AsyncRequestCoalescer | None = None,
+        max_connections: int = 100,
+        validation_level: ValidationLevel = ValidationLevel.STRICT,
+        base_url: str = HUNTER_API_BASE_URL,
+        metrics: MetricsRecorder | None = None,
+        call_timer: CallTimer | None = None,
+        response_cache: ResponseCache | None = None,
+        credit_tracker: CreditTracker | None = None,
+    ) -> None:
+        """
+        Initialize a new instance of the AsyncHunterClient class.
+
+        Args:
+            api_key (str): The API key for accessing the Hunter.io API.
+            http_session (httpx.AsyncClient | None): The HTTP session to use for making requests.
+            rate_limiter (RateLimiter | None): The rate limiter pacing the requests, or None to send them unpaced.
+            retry_policy (RetryPolicy | None): The policy for retrying transient failures, or None to never retry.
+            request_coalescer (AsyncRequestCoalescer | None): The coalescer of identical concurrent requests, if any.
+            max_connections (int): The number of concurrent connections of the HTTP session created by the client.
+            validation_level (ValidationLevel): The default depth of validation of the typed responses.
+            base_url (str): The scheme and host of the Hunter API, e.g. of a local stand-in server.
+            metrics (MetricsRecorder | None): The recorder of the metrics of the requests, or None to record none.
+            call_timer (CallTimer | None): The timer of the phases of every call, or None to not time calls.
+            response_cache (ResponseCache | None): The cache of the bodies of successful responses, if any.
+            credit_tracker (CreditTracker | None): The tracker enforcing credit budgets on the calls, if any.
+        """
+        self._api_key = api_key
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.request_coalescer = request_coalescer
+        self.validation_level = validation_level
+        self.base_url = base_url
+        self.metrics = metrics
+        self.call_timer = call_timer
+        self.response_cache = response_cache
+        self.credit_tracker = credit_tracker
+        self._owns_session = http_session is None
+        connection_limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        self.http_session = http_session or httpx.AsyncClient(limits=connection_limits)
+        self.http_session.headers.update({'X-API-KEY': self._api_key})
+        self.domain_searcher = AsyncDomainSearcher(client=self)
+        self.domain_and_name_searcher = AsyncDomainAndNameSearcher(client=self)
+        self.email_verifier = AsyncEmailVerifier(client=self)
+        self.email_counter = AsyncEmailCounter(client=self)
+
+    async def __aenter__(self) -> 'AsyncHunterClient':
+        """Enter the asynchronous context of the client."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit the asynchronous context of the client, closing the HTTP session it owns."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP session the client created and release its pooled connections."""
+        if self._owns_session:
+            await self.http_session.aclose()
@@ -0,0 +1,13 @@
+"""This package contains asynchronous implementations of the endpoint handlers for the Hunter.io API."""
+
+from hunter_client.client.async_endpoint_handlers.domain_and_name_searcher import AsyncDomainAndNameSearcher
+from hunter_client.client.async_endpoint_handlers.domain_searcher import AsyncDomainSearcher
+from hunter_client.client.async_endpoint_handlers.email_counter import AsyncEmailCounter
+from hunter_client.client.async_endpoint_handlers.email_verifier import AsyncEmailVerifier
+
+__all__ = [
+    'AsyncDomainAndNameSearcher',
+    'AsyncDomainSearcher',
+    'AsyncEmailCounter',
+    'AsyncEmailVerifier',
+]
@@ -0,0 +1,199 @@
+"""
+This module defines the base type for handling API endpoints of the Hunter service asynchronously.
+
+It mirrors `hunter_client.client.endpoint_handlers.base`, reusing its URL formatting and request lifecycle hooks,
+but sends requests through an `httpx.AsyncClient`, so that a single event loop can keep many requests in flight.
+"""
+
+import asyncio
+import json
+import logging
+from typing import TYPE_CHECKING, Callable, Unpack
+
+import httpx
+
+from hunter_client.client.endpoint_handlers.base import (
+    AbstractEndpointHandlerCommons,
+    ParsedBody,
+    PossibleQueryParams,
+    ResponseModel,
+    ResponseModelParser,
+)
+from hunter_client.client.metrics import MetricsRecorder
+from hunter_client.client.retrying import RetryPolicy
+from hunter_client.client.timing import CallPhase, end_phase, is_call_timed
+from hunter_client.services.response_models.validation import ValidationLevel
+
+if TYPE_CHECKING:
+    from hunter_client.client import AsyncHunterClient, CreditTracker
+
+logger = logging.getLogger(__name__)
+
+
+class AbstractAsyncBaseEndpointHandler(AbstractEndpointHandlerCommons):  # noqa: WPS214
+    """
+    Abstract base class for handling various API endpoints of the Hunter service asynchronously.
+
+    This class is the asynchronous counterpart of `AbstractBaseEndpointHandler`. Subclasses define their own URL
+    path exactly like the blocking handlers do, and get the same hooks and the same error semantics: a response
+    with an error status code raises an exception instead of being returned.
+    """
+
+    def __init__(self, client: 'AsyncHunterClient') -> None:
+        """
+        Initialize an instance of the AbstractAsyncBaseEndpointHandler.
+
+        Args:
+            client (AsyncHunterClient): An instance of the `AsyncHunterClient` class which is used to make HTTP
+                requests.
+        """
+        self._client = client
+        self._hunter_api_base_url = client.base_url
+
+    def after_request(self, response: httpx.Response) -> None:
+        """Request lifecycle hook after making an HTTP request."""
+        logger.debug('Got HTTP response: {0} {1}'.format(response.status_code, response.url))
+
+    async def make_request(self, method: str, **query_params: Unpack[PossibleQueryParams]) -> httpx.Response:
+        """Central method to make HTTP requests, retrying transient failures per the client's retry policy."""
+        with self._timed_call(self._client.call_timer, method):
+            url = self._formatted_url(**query_params)
+            credit_tracker = self._client.credit_tracker
+            if credit_tracker is None:
+                response = await self._send_request_per_policy(method, url, **query_params)
+            else:
+                response = await self._send_budgeted_request(credit_tracker, method, url, **query_params)
+            response.raise_for_status()
+        return response
+
+    async def request_json(self, method: str, **query_params: Unpack[PossibleQueryParams]) -> dict:
+        """Make an HTTP request and parse its JSON body, coalescing identical concurrent requests if enabled."""
+        return await self._request_parsed(json.loads, method, **query_params)
+
+    async def request_model(
+        self,
+        model_type: type[ResponseModel],
+        method: str,
+        validation_level: ValidationLevel | None = None,
+        **query_params: Unpack[PossibleQueryParams],
+    ) -> ResponseModel:
+        """Make an HTTP request and validate its raw body into a response model, skipping the intermediate dict."""
+        parse = ResponseModelParser(model_type, validation_level or self._client.validation_level)
+        return await self._request_parsed(parse, method, **query_params)
+
+    async def _request_parsed(
+        self,
+        parse: Callable[[bytes], ParsedBody],
+        method: str,
+        **query_params: Unpack[PossibleQueryParams],
+    ) -> ParsedBody:
+        request_coalescer = self._client.request_coalescer
+        if request_coalescer is None:
+            return await self._fetch_parsed(parse, method, **query_params)
+        request_key = (parse, self._request_key(method, **query_params))
+        return await request_coalescer.coalesce(request_key, lambda: self._fetch_parsed(parse, method, **query_params))
+
+    async def _fetch_parsed(
+        self,
+        parse: Callable[[bytes], ParsedBody],
+        method: str,
+        **query_params: Unpack[PossibleQueryParams],
+    ) -> ParsedBody:
+        with self._timed_call(self._client.call_timer, method):
+            parsed_body = parse(await self._fetch_body(method, **query_params))
+            end_phase(self._parse_phase(parse))
+        return parsed_body
+
+    async def _fetch_body(self, method: str, **query_params: Unpack[PossibleQueryParams]) -> bytes:
+        response_cache = self._client.response_cache
+        if response_cache is None:
+            response = await self.make_request(method, **query_params)
+            return response.content
+        cached_body = response_cache.lookup(method, self._endpoint_url_path, query_params)
+        if cached_body is not None:
+            return cached_body
+        response = await self.make_request(method, **query_params)
+        response_cache.store(method, self._endpoint_url_path, query_params, response.content)
+        return response.content
+
+    async def _send_budgeted_request(
+        self,
+        credit_tracker: 'CreditTracker',
+        method: str,
+        url: str,
+        **query_params: Unpack[PossibleQueryParams],
+    ) -> httpx.Response:
+        reservation = await credit_tracker.admit_async(self._endpoint_url_path)
+        response: httpx.Response | None = None
+        try:  # noqa: WPS501
+            response = await self._send_request_per_policy(method, url, **query_params)
+        finally:
+            credit_tracker.settle(reservation, None if response is None else response.status_code)
+        return response
+
+    async def _send_request_per_policy(
+        self,
+        method: str,
+        url: str,
+        **query_params: Unpack[PossibleQueryParams],
+    ) -> httpx.Response:
+        retry_policy = self._client.retry_policy
+        if retry_policy is None:
+            return await self._send_request(method, url, **query_params)
+        return await self._send_request_with_retries(retry_policy, method, url, **query_params)
+
+    async def _send_request(self, method: str, url: str, **query_params: Unpack[PossibleQueryParams]) -> httpx.Response:
+        if self._client.rate_limiter is not None:
+            await self._client.rate_limiter.acquire_async(self._endpoint_url_path)
+        self.before_request(method, url, **query_params)
+        end_phase(CallPhase.QUEUE)
+        metrics = self._client.metrics
+        if metrics is None:
+            response = await self._transfer(method, url)
+        else:
+            response = await self._send_measured_request(metrics, method, url)
+        self.after_request(response)
+        return response
+
+    async def _send_measured_request(self, metrics: MetricsRecorder, method: str, url: str) -> httpx.Response:
+        endpoint = self._endpoint_url_path
+        metrics.request_started(endpoint)
+        started_at = metrics.clock()
+        response: httpx.Response | None = None
+        try:  # noqa: WPS501
+            response = await self._transfer(method, url)
+        finally:
+            latency = metrics.clock() - started_at
+            if response is None:
+                metrics.request_failed(endpoint, latency)
+            else:
+                metrics.request_finished(endpoint, response.status_code, latency, len(response.content))
+        return response
+
+    async def _transfer(self, method: str, url: str) -> httpx.Response:
+        if not is_call_timed():
+            return await self._client.http_session.request(method, url)
+        async with self._client.http_session.stream(method, url) as response:
+            end_phase(CallPhase.WAIT)
+            await response.aread()
+            end_phase(CallPhase.DOWNLOAD)
+            return response
+
+    async def _send_request_with_retries(
+        self,
+        retry_policy: RetryPolicy,
+        method: str,
+        url: str,
+        **query_params: Unpack[PossibleQueryParams],
+    ) -> httpx.Response:
+        started_at = retry_policy.clock()
+        attempt = 1
+        response = await self._send_request(method, url, **query_params)
+        delay = retry_policy.next_delay(method, response, attempt, started_at)
+        while delay is not None:
+            await asyncio.sleep(delay)
+            end_phase(CallPhase.RETRY_BACKOFF)
+            attempt += 1
+            response = await self._send_request(method, url, **query_params)
+            delay = retry_policy.next_delay(method, response, attempt, started_at)
+        return response
@@ -0,0 +1,57 @@
+"""This module contains async handler class implementation for the `email-finder` endpoint of the Hunter API."""
+
+from hunter_client.client.async_endpoint_handlers.base import AbstractAsyncBaseEndpointHandler
+from hunter_client.services.response_models import DomainAndNameSearcherResponse
+from hunter_client.services.response_models.validation import ValidationLevel
+
+
+class AsyncDomainAndNameSearcher(AbstractAsyncBaseEndpointHandler):
+    """
+    Asynchronous handler for the `email-finder` endpoint in the Hunter API.
+
+    Wraps this endpoint: https://hunter.io/api-documentation/v2#email-finder.
+    """
+
+    _endpoint_url_path = '/email-finder'
+
+    async def search_email_by_domain_and_name(self, target_domain: str, first_name: str, last_name: str) -> dict:
+        """
+        Search for emails associated with a given domain and name.
+
+        Args:
+            target_domain (str): The domain to search emails for.
+            first_name (str): The first name of the person to search for.
+            last_name (str): The last name of the person to search for.
+
+        Returns:
+            dict: Raw JSON response from the wrapped API endpoint (`.../email-finder`).
+        """
+        return await self.request_json('GET', domain=target_domain, first_name=first_name, last_name=last_name)
+
+    async def find_email(
+        self,
+        target_domain: str,
+        first_name: str,
+        last_name: str,
+        validation_level: ValidationLevel | None = None,
+    ) -> DomainAndNameSearcherResponse:
+        """
+        Search for emails associated with a given domain and name, validating the response from its raw body.
+
+        Args:
+            target_domain (str): The domain to search emails for.
+            first_name (str): The first name of the person to search for.
+            last_name (str): The last name of the person to search for.
+            validation_level (ValidationLevel | None): The depth of validation, or None to use the client's default.
+
+        Returns:
+            DomainAndNameSearcherResponse: Validated response from the wrapped API endpoint (`.../email-finder`).
+        """
+        return await self.request_model(
+            DomainAndNameSearcherResponse,
+            'GET',
+            validation_level,
+            domain=target_domain,
+            first_name=first_name,
+            last_name=last_name,
+        )
@@ -0,0 +1,44 @@
+"""This module contains async handler class implementation for the `domain-search` endpoint of the Hunter API."""
+
+from hunter_client.client.async_endpoint_handlers.base import AbstractAsyncBaseEndpointHandler
+from hunter_client.services.response_models import DomainSearcherResponse
+from hunter_client.services.response_models.validation import ValidationLevel
+
+
+class AsyncDomainSearcher(AbstractAsyncBaseEndpointHandler):
+    """
+    Asynchronous handler for the `domain-search` endpoint in the Hunter API.
+
+    Wraps this endpoint: https://hunter.io/api-documentation/v2#domain-search.
+    """
+
+    _endpoint_url_path = '/domain-search'
+
+    async def search_emails_by_domain(self, target_domain: str) -> dict:
+        """
+        Search for emails associated with a given domain.
+
+        Args:
+            target_domain (str): The domain to search emails for.
+
+        Returns:
+            dict: Raw JSON response from the wrapped API endpoint (`.../domain-search`).
+        """
+        return await self.request_json('GET', domain=target_domain)
+
+    async def search_domain(
+        self,
+        target_domain: str,
+        validation_level: ValidationLevel | None = None,
+    ) -> DomainSearcherResponse:
+        """
+        Search for emails associated with a given domain, validating the response straight from its raw body.
+
+        Args:
+            target_domain (str): The domain to search emails for.
+            validation_level (ValidationLevel | None): The depth of validation, or None to use the client's default.
+
+        Returns:
+            DomainSearcherResponse: Validated response from the wrapped API endpoint (`.../domain-search`).
+        """
+        return await self.request_model(DomainSearcherResponse, 'GET', validation_level, domain=target_domain)
@@ -0,0 +1,44 @@
+"""This module contains async handler class implementation for the `email-count` endpoint of the Hunter API."""
+
+from hunter_client.client.async_endpoint_handlers.base import AbstractAsyncBaseEndpointHandler
+from hunter_client.services.response_models import EmailCounterResponse
+from hunter_client.services.response_models.validation import ValidationLevel
+
+
+class AsyncEmailCounter(AbstractAsyncBaseEndpointHandler):
+    """
+    Asynchronous handler for the `email-count` endpoint in the Hunter API.
+
+    Wraps this endpoint: https://hunter.io/api-documentation/v2#email-count.
+    """
+
+    _endpoint_url_path = '/email-count'
+
+    async def count_emails_by_domain(self, target_domain: str) -> dict:
+        """
+        Count the number of emails associated with a given domain.
+
+        Args:
+            target_domain (str): The domain to count emails for.
+
+        Returns:
+            dict: Raw JSON response from the wrapped API endpoint (`.../email-count`).
+        """
+        return await self.request_json('GET', domain=target_domain)
+
+    async def count_emails(
+        self,
+        target_domain: str,
+        validation_level: ValidationLevel | None = None,
+    ) -> EmailCounterResponse:
+        """
+        Count the number of emails associated with a given domain, validating the response from its raw body.
+
+        Args:
+            target_domain (str): The domain to count emails for.
+            validation_level (ValidationLevel | None): The depth of validation, or None to use the client's default.
+
+        Returns:
+            EmailCounterResponse: Validated response from the wrapped API endpoint (`.../email-count`).
+        """
+        return await self.request_model(EmailCounterResponse, 'GET', validation_level, domain=target_domain)
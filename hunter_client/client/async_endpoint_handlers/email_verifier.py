@@ -0,0 +1,44 @@
+"""This module contains async handler class implementation for the `email-verifier` endpoint of the Hunter API."""
+
+from hunter_client.client.async_endpoint_handlers.base import AbstractAsyncBaseEndpointHandler
+from hunter_client.services.response_models import EmailVerifierResponse
+from hunter_client.services.response_models.validation import ValidationLevel
+
+
+class AsyncEmailVerifier(AbstractAsyncBaseEndpointHandler):
+    """
+    Asynchronous handler for the `email-verifier` endpoint in the Hunter API.
+
+    Wraps this endpoint: https://hunter.io/api-documentation/v2#email-verifier.
+    """
+
+    _endpoint_url_path = '/email-verifier'
+
+    async def check_if_email_is_valid(self, email: str) -> dict:
+        """
+        Verify the status of an email address.
+
+        Args:
+            email (str): The email address to verify.
+
+        Returns:
+            dict: Raw JSON response from the wrapped API endpoint (`.../email-verifier`).
+        """
+        return await self.request_json('GET', email=email)
+
+    async def verify_email(
+        self,
+        email: str,
+        validation_level: ValidationLevel | None = None,
+    ) -> EmailVerifierResponse:
+        """
+        Verify the status of an email address, validating the response straight from its raw body.
+
+        Args:
+            email (str): The email address to verify.
+            validation_level (ValidationLevel | None): The depth of validation, or None to use the client's default.
+
+        Returns:
+            EmailVerifierResponse: Validated response from the wrapped API endpoint (`.../email-verifier`).
+        """
+        return await self.request_model(EmailVerifierResponse, 'GET', validation_level, email=email)
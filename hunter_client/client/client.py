@@ -6,28 +6,57 @@ such as searching for emails by domain, finding specific emails using a person's
 status of an email address, and counting the number of emails associated with a particular domain.
 """
 
+from types import TracebackType
+from typing import Callable
+
 import requests
 
-from hunter_client.client.endpoint_handlers.domain_and_name_searcher import DomainAndNameSearcher
-from hunter_client.client.endpoint_handlers.domain_searcher import DomainSearcher
-from hunter_client.client.endpoint_handlers.email_counter import EmailCounter
-from hunter_client.client.endpoint_handlers.email_verifier import EmailVerifier
+from hunter_client.client.coalescing import RequestCoalescer
+from hunter_client.client.credits import CreditTracker
+from hunter_client.client.endpoint_handlers import (
+    HUNTER_API_BASE_URL,
+    DomainAndNameSearcher,
+    DomainSearcher,
+    EmailCounter,
+    EmailVerifier,
+)
+from hunter_client.client.metrics import MetricsRecorder
+from hunter_client.client.rate_limiting import RateLimiter
+from hunter_client.client.response_cache import ResponseCache
+from hunter_client.client.retrying import RetryPolicy
+from hunter_client.client.sessions import ThreadLocalSessions, create_pooled_session
+from hunter_client.client.timing import CallTimer
+from hunter_client.services.response_models.validation import ValidationLevel
 
 
-class HunterClient(object):
+class HunterClient(object):  # noqa: WPS230
     """
     Client for interacting with the Hunter.io API via HTTP requests.
 
     This class exposes functionality of the Hunter.io API endpoints.
     See https://hunter.io/api-documentation/v2 for more information.
-    """
 
-    _hunter_domain = 'https://api.hunter.io/v2'
+    The client is safe to share between threads. By default all threads share one HTTP session whose connection
+    pool keeps `pool_size` connections alive, which should match the number of threads using the client.
+    Alternatively, every thread can be given its own HTTP session. The client closes only the HTTP sessions it
+    created, so a session passed in is left open, to be closed by its owner.
+    """
 
-    def __init__(
+    def __init__(  # noqa: WPS211
         self,
         api_key: str,
         http_session: requests.Session | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        request_coalescer: RequestCoalescer | None = None,
+        pool_size: int = 10,
+        per_thread_sessions: bool = False,
+        validation_level: ValidationLevel = ValidationLevel.STRICT,
+        base_url: str = HUNTER_API_BASE_URL,
+        metrics: MetricsRecorder | None = None,
+        call_timer: CallTimer | None = None,
+        response_cache: ResponseCache | None = None,
+        credit_tracker: CreditTracker | None = None,
     ) -> None:
         """
         Initialize a new instance of the HunterClient class.
@@ -35,11 +64,70 @@ class HunterClient(object):
         Args:
             api_key (str): The API key for accessing the Hunter.io API.
             http_session (requests.Session | None): The HTTP session to use for making requests.
+            rate_limiter (RateLimiter | None): The rate limiter pacing the requests, or None to send them unpaced.
+            retry_policy (RetryPolicy | None): The policy for retrying transient failures, or None to never retry.
+            request_coalescer (RequestCoalescer | None): The coalescer of identical concurrent requests, if any.
+            pool_size (int): The number of connections kept alive by the shared HTTP session created by the client.
+            per_thread_sessions (bool): Whether to give every thread its own HTTP session instead of a shared one.
+            validation_level (ValidationLevel): The default depth of validation of the typed responses.
+            base_url (str): The scheme and host of the Hunter API, e.g. of a local stand-in server.
+            metrics (MetricsRecorder | None): The recorder of the metrics of the requests, or None to record none.
+            call_timer (CallTimer | None): The timer of the phases of every call, or None to not time calls.
+            response_cache (ResponseCache | None): The cache of the bodies of successful responses, if any.
+            credit_tracker (CreditTracker | None): The tracker enforcing credit budgets on the calls, if any.
+
+        Raises:
+            ValueError: If both `http_session` and `per_thread_sessions` are given.
         """
+        if http_session is not None and per_thread_sessions:
+            raise ValueError('`http_session` cannot be combined with `per_thread_sessions`.')
         self._api_key = api_key
-        self.http_session = http_session or requests.Session()
-        self.http_session.headers.update({'X-API-KEY': self._api_key})
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.request_coalescer = request_coalescer
+        self.validation_level = validation_level
+        self.base_url = base_url
+        self.metrics = metrics
+        self.call_timer = call_timer
+        self.response_cache = response_cache
+        self.credit_tracker = credit_tracker
+        self._owns_sessions = http_session is None
+        if per_thread_sessions:
+            thread_local_sessions = ThreadLocalSessions(lambda: self._authenticated(create_pooled_session(1)))
+            self._provide_session: Callable[[], requests.Session] = thread_local_sessions.get
+            self._close_sessions = thread_local_sessions.close
+        else:
+            shared_session = self._authenticated(http_session or create_pooled_session(pool_size))
+            self._provide_session = lambda: shared_session
+            self._close_sessions = shared_session.close
         self.domain_searcher = DomainSearcher(client=self)
         self.domain_and_name_searcher = DomainAndNameSearcher(client=self)
         self.email_verifier = EmailVerifier(client=self)
         self.email_counter = EmailCounter(client=self)
+
+    def __enter__(self) -> 'HunterClient':
+        """Enter the context of the client."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit the context of the client, closing the HTTP sessions it owns."""
+        self.close()
+
+    @property
+    def http_session(self) -> requests.Session:
+        """Return the HTTP session to be used by the calling thread."""
+        return self._provide_session()
+
+    def close(self) -> None:
+        """Close the HTTP sessions the client created and release their pooled connections."""
+        if self._owns_sessions:
+            self._close_sessions()
+
+    def _authenticated(self, http_session: requests.Session) -> requests.Session:
+        http_session.headers.update({'X-API-KEY': self._api_key})
+        return http_session
@@ -0,0 +1,117 @@
+"""
+This module provides single-flight coalescing of identical requests sent to the Hunter API at the same time.
+
+When several threads (or asynchronous tasks) ask for exactly the same endpoint with exactly the same query parameters
+while a matching request is already in flight, they do not send requests of their own. Instead, they wait for the
+request in flight and all receive its parsed result, or its exception. This saves both API credits and latency on
+inputs with many duplicates. Coalesced results are shared objects, so callers must not mutate them.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+FetchedResult = TypeVar('FetchedResult')
+
+
+@dataclass
+class CoalescingStats(object):
+    """
+    Thread-safe counters describing how many requests were coalesced.
+
+    Attributes:
+        leaders (int): The number of requests actually sent.
+        followers (int): The number of requests that reused the result of an identical request in flight.
+    """
+
+    leaders: int = 0
+    followers: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def record(self, is_leader: bool) -> None:
+        """Record a request that was either sent or coalesced with an identical one."""
+        with self._lock:
+            if is_leader:
+                self.leaders += 1
+            else:
+                self.followers += 1
+
+
+class RequestCoalescer(object):
+    """Single-flight coalescer for requests made from multiple threads."""
+
+    def __init__(self) -> None:
+        """Initialize the coalescer with no requests in flight."""
+        self._in_flight: dict[Hashable, Future[Any]] = {}
+        self._lock = threading.Lock()
+        self.stats = CoalescingStats()
+
+    def coalesce(self, request_key: Hashable, fetch: Callable[[], FetchedResult]) -> FetchedResult:
+        """
+        Return the result of `fetch`, sharing it with concurrent callers using the same key.
+
+        Any exception of `fetch`, including a `KeyboardInterrupt` or a `SystemExit`, is raised to the waiting callers
+        too, so that none of them is left blocked.
+
+        Args:
+            request_key (Hashable): The key identifying identical requests.
+            fetch (Callable[[], FetchedResult]): The function sending the request and parsing its response.
+
+        Returns:
+            FetchedResult: The result of the request, possibly fetched by another thread.
+        """
+        with self._lock:
+            shared_future = self._in_flight.get(request_key)
+            is_leader = shared_future is None
+            if shared_future is None:
+                shared_future = Future()
+                self._in_flight[request_key] = shared_future
+        self.stats.record(is_leader)
+        if not is_leader:
+            return shared_future.result()
+        try:
+            fetched_result = fetch()
+        except BaseException as fetch_error:  # noqa: WPS424
+            shared_future.set_exception(fetch_error)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(request_key, None)
+        shared_future.set_result(fetched_result)
+        return fetched_result
+
+
+class AsyncRequestCoalescer(object):
+    """Single-flight coalescer for requests made from multiple tasks of an event loop."""
+
+    def __init__(self) -> None:
+        """Initialize the coalescer with no requests in flight."""
+        self._in_flight: dict[Hashable, asyncio.Future[Any]] = {}
+        self.stats = CoalescingStats()
+
+    async def coalesce(
+        self,
+        request_key: Hashable,
+        fetch: Callable[[], Awaitable[FetchedResult]],
+    ) -> FetchedResult:
+        """
+        Return the result of `fetch`, sharing it with concurrent tasks using the same key.
+
+        A task that is cancelled while waiting does not cancel the shared request for the other tasks.
+
+        Args:
+            request_key (Hashable): The key identifying identical requests.
+            fetch (Callable[[], Awaitable[FetchedResult]]): The coroutine function sending the request.
+
+        Returns:
+            FetchedResult: The result of the request, possibly fetched by another task.
+        """
+        shared_task = self._in_flight.get(request_key)
+        self.stats.record(is_leader=shared_task is None)
+        if shared_task is None:
+            shared_task = asyncio.ensure_future(fetch())
+            self._in_flight[request_key] = shared_task
+            shared_task.add_done_callback(lambda _: self._in_flight.pop(request_key, None))
+        return await asyncio.shield(shared_task)
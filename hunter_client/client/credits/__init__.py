@@ -0,0 +1,27 @@
+"""
+This package provides the credit accounting of the calls of the Hunter API.
+
+A `CreditTracker` given to a client counts the credits spent on each endpoint, enforces hourly, daily and per-job
+`CreditBudget`s, and admits, defers or rejects calls according to the `CallPriority` they are made with.
+"""
+
+from hunter_client.client.credits.budgets import CallPriority, CreditBudget, call_priority, current_priority
+from hunter_client.client.credits.tracker import (
+    DEFAULT_ENDPOINT_COSTS,
+    CreditBudgetExceededError,
+    CreditReservation,
+    CreditStats,
+    CreditTracker,
+)
+
+__all__ = [
+    'DEFAULT_ENDPOINT_COSTS',
+    'CallPriority',
+    'CreditBudget',
+    'CreditBudgetExceededError',
+    'CreditReservation',
+    'CreditStats',
+    'CreditTracker',
+    'call_priority',
+    'current_priority',
+]
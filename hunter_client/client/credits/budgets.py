@@ -0,0 +1,189 @@
+"""
+This module defines the credit budgets enforced by a credit tracker and the priorities of the calls spending them.
+
+A budget caps the credits spent within a rolling time window, e.g. an hour or a day, or over the whole lifetime of
+the tracker, i.e. of a job. Calls are admitted by priority: each priority may only use a share of every budget, so
+that once a budget runs low, the credits left over are kept for the most valuable calls. The priority of the calls
+made by a piece of code is set with the `call_priority` context manager.
+"""
+
+import enum
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Iterator
+
+
+class CallPriority(enum.Enum):
+    """
+    The priority of a call spending credits.
+
+    Attributes:
+        HIGH: Calls that may spend a budget entirely.
+        NORMAL: The calls made without an explicit priority.
+        LOW: Calls that are deferred first when a budget runs low.
+    """
+
+    HIGH = 'high'  # noqa: WPS115
+    NORMAL = 'normal'  # noqa: WPS115
+    LOW = 'low'  # noqa: WPS115
+
+
+_current_priority: ContextVar[CallPriority] = ContextVar('_current_priority', default=CallPriority.NORMAL)
+_SETTLEMENT_POLL_INTERVAL = 0.05
+
+
+@contextmanager
+def call_priority(priority: CallPriority) -> Iterator[None]:
+    """
+    Set the priority of the calls made in the current thread or task within the context.
+
+    Args:
+        priority (CallPriority): The priority of the calls.
+
+    Yields:
+        None: Once the priority is set.
+    """
+    priority_token = _current_priority.set(priority)
+    try:  # noqa: WPS501
+        yield
+    finally:
+        _current_priority.reset(priority_token)
+
+
+def current_priority() -> CallPriority:
+    """
+    Return the priority of the calls made in the current thread or task.
+
+    Returns:
+        CallPriority: The priority set by the innermost `call_priority` context, or the normal priority.
+    """
+    return _current_priority.get()
+
+
+@dataclass(frozen=True)
+class CreditBudget(object):
+    """
+    A cap on the credits spent within a rolling time window, or over the lifetime of a credit tracker.
+
+    Attributes:
+        limit (float): The maximum number of credits spent.
+        window (timedelta | None): The rolling window the credits are counted in, or None for a per-job budget.
+    """
+
+    limit: float
+    window: timedelta | None = None
+
+    @classmethod
+    def hourly(cls, limit: float) -> 'CreditBudget':
+        """Return a budget of credits spent within any hour."""
+        return cls(limit, timedelta(hours=1))
+
+    @classmethod
+    def daily(cls, limit: float) -> 'CreditBudget':
+        """Return a budget of credits spent within any day."""
+        return cls(limit, timedelta(days=1))
+
+    @classmethod
+    def per_job(cls, limit: float) -> 'CreditBudget':
+        """Return a budget of credits spent over the lifetime of the credit tracker."""
+        return cls(limit)
+
+
+class BudgetLedger(object):
+    """
+    The credits spent and reserved against a budget.
+
+    The ledger is not thread-safe on its own; it is guarded by the lock of the credit tracker owning it.
+
+    Attributes:
+        budget (CreditBudget): The budget.
+        reserved (float): The credits reserved by admitted calls that have not finished yet.
+    """
+
+    def __init__(self, budget: CreditBudget) -> None:
+        """
+        Initialize an empty ledger.
+
+        Args:
+            budget (CreditBudget): The budget.
+        """
+        self.budget = budget
+        self.reserved: float = 0
+        self._charges: deque[tuple[float, float]] = deque()
+        self._charged: float = 0
+
+    def usage(self, now: float) -> float:
+        """
+        Return the credits counted against the budget.
+
+        Args:
+            now (float): The current time in seconds.
+
+        Returns:
+            float: The credits charged within the window of the budget, plus the reserved credits.
+        """
+        self._expire_charges(now)
+        return self._charged + self.reserved
+
+    def delay_until_fits(self, cost: float, allowance: float, now: float) -> float | None:
+        """
+        Tell how long a call has to wait until its cost fits into its allowance of the budget.
+
+        Args:
+            cost (float): The cost of the call.
+            allowance (float): The credits the call may use up, given its priority.
+            now (float): The current time in seconds.
+
+        While the reservations of calls in flight stand in the way, the call has to check again shortly, since they
+        may be refunded or charged at any moment.
+
+        Returns:
+            float | None: The number of seconds until enough charges leave the window of the budget, or until the
+                call should check again, or None if the cost will never fit, e.g. because a per-job budget is spent.
+                Free calls always fit.
+        """
+        excess = self.usage(now) + cost - allowance
+        if cost <= 0 or excess <= 0:
+            return 0
+        if self._never_fits(cost, allowance):
+            return None
+        expiry_delay = self._delay_until_charges_expire(excess, now)
+        if self.reserved <= 0:
+            return expiry_delay
+        return min(expiry_delay or _SETTLEMENT_POLL_INTERVAL, _SETTLEMENT_POLL_INTERVAL)
+
+    def charge(self, cost: float, now: float) -> None:
+        """
+        Charge the cost of a finished call against the budget.
+
+        Args:
+            cost (float): The cost of the call.
+            now (float): The current time in seconds.
+        """
+        self._charges.append((now, cost))
+        self._charged += cost
+
+    def _never_fits(self, cost: float, allowance: float) -> bool:
+        if cost > allowance:
+            return True
+        return self.budget.window is None and self._charged + cost > allowance
+
+    def _delay_until_charges_expire(self, excess: float, now: float) -> float | None:
+        if self.budget.window is None:
+            return None
+        for charged_at, charge in self._charges:
+            excess -= charge
+            if excess <= 0:
+                return charged_at + self.budget.window.total_seconds() - now
+        return None
+
+    def _expire_charges(self, now: float) -> None:
+        if self.budget.window is None:
+            return
+        window_start = now - self.budget.window.total_seconds()
+        while self._charges and self._charges[0][0] <= window_start:
+            _, expired_charge = self._charges.popleft()
+            self._charged -= expired_charge
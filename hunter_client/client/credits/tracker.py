@@ -0,0 +1,265 @@
+"""
+This module provides the credit tracker, which accounts for the credits spent on the Hunter API and admits calls.
+
+Every call of an endpoint costs a number of credits, configured per endpoint. Before a call is sent, the tracker
+reserves its cost against every budget; a call whose cost does not fit into the share of a budget its priority may
+use is deferred until enough earlier spending leaves the rolling window of the budget, or rejected with a
+`CreditBudgetExceededError` if it would have to wait for longer than allowed, e.g. because a per-job budget is spent.
+Once the call finishes, its reservation is charged if the API answered successfully, and refunded otherwise. A
+single tracker may be shared by several clients, threads and asynchronous tasks.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import timedelta
+from http import HTTPStatus
+from types import MappingProxyType
+from typing import Callable, Iterable, Mapping
+
+from hunter_client.client.credits.budgets import BudgetLedger, CallPriority, CreditBudget, current_priority
+
+DEFAULT_ENDPOINT_COSTS: Mapping[str, float] = MappingProxyType({
+    '/domain-search': 1,
+    '/email-finder': 1,
+    '/email-verifier': 0.5,
+    '/email-count': 0,
+})
+DEFAULT_PRIORITY_SHARES: Mapping[CallPriority, float] = MappingProxyType({
+    CallPriority.HIGH: 1,
+    CallPriority.NORMAL: 0.9,
+    CallPriority.LOW: 0.75,
+})
+_DEFAULT_ENDPOINT_COST = 1
+_NO_DEFERRAL = timedelta(0)
+
+
+class CreditBudgetExceededError(Exception):
+    """
+    Raised instead of calling the Hunter API when the cost of the call does not fit into the credit budgets in time.
+
+    Attributes:
+        endpoint (str): The URL path of the endpoint of the rejected call.
+        priority (CallPriority): The priority of the rejected call.
+    """
+
+    def __init__(self, endpoint: str, priority: CallPriority) -> None:
+        """
+        Initialize the error.
+
+        Args:
+            endpoint (str): The URL path of the endpoint of the rejected call.
+            priority (CallPriority): The priority of the rejected call.
+        """
+        super().__init__(
+            'The credit budgets do not allow a {0} priority call of {1}.'.format(priority.value, endpoint),
+        )
+        self.endpoint = endpoint
+        self.priority = priority
+
+
+@dataclass(frozen=True)
+class CreditReservation(object):
+    """
+    The credits reserved for an admitted call, to be settled once the call finishes.
+
+    Attributes:
+        endpoint (str): The URL path of the endpoint of the call.
+        cost (float): The reserved credits.
+    """
+
+    endpoint: str
+    cost: float
+
+
+@dataclass
+class CreditStats(object):
+    """
+    Thread-safe counters of the credits spent and of the calls held back by a credit tracker.
+
+    Attributes:
+        spent_by_endpoint (dict[str, float]): The credits charged for the calls of each endpoint.
+        deferrals (int): The number of times a call had to wait for credits to free up.
+        rejections (int): The number of calls rejected for not fitting into the budgets in time.
+    """
+
+    spent_by_endpoint: dict[str, float] = field(default_factory=dict)
+    deferrals: int = 0
+    rejections: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    @property
+    def spent(self) -> float:
+        """Return the credits charged for the calls of all endpoints."""
+        with self._lock:
+            return sum(self.spent_by_endpoint.values())
+
+    def record_charge(self, endpoint: str, cost: float) -> None:
+        """Record the credits charged for a call of an endpoint."""
+        with self._lock:
+            self.spent_by_endpoint[endpoint] = self.spent_by_endpoint.get(endpoint, 0) + cost
+
+    def record_deferral(self) -> None:
+        """Record a call waiting for credits to free up."""
+        with self._lock:
+            self.deferrals += 1
+
+    def record_rejection(self) -> None:
+        """Record a call rejected for not fitting into the budgets in time."""
+        with self._lock:
+            self.rejections += 1
+
+
+class CreditTracker(object):
+    """
+    Credit accounting for the calls of the Hunter API, enforcing credit budgets by call priority.
+
+    Endpoints are identified by their URL path, as declared by the endpoint handlers (e.g. `/email-verifier`).
+    The priority of a call is the one set by the innermost `call_priority` context it is made in.
+
+    Attributes:
+        stats (CreditStats): The credits spent per endpoint and the calls deferred or rejected.
+    """
+
+    def __init__(  # noqa: WPS211
+        self,
+        budgets: Iterable[CreditBudget] = (),
+        endpoint_costs: Mapping[str, float] = DEFAULT_ENDPOINT_COSTS,
+        priority_shares: Mapping[CallPriority, float] = DEFAULT_PRIORITY_SHARES,
+        max_deferral: timedelta = _NO_DEFERRAL,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialize the tracker.
+
+        Args:
+            budgets (Iterable[CreditBudget]): The budgets every call has to fit into.
+            endpoint_costs (Mapping[str, float]): The credits a call of each endpoint costs; other endpoints cost one.
+            priority_shares (Mapping[CallPriority, float]): The share of every budget the calls of each priority use.
+            max_deferral (timedelta): The longest time a call may wait for credits before it is rejected.
+            clock (Callable[[], float]): A monotonic clock returning the current time in seconds.
+            sleep (Callable[[float], None]): The function used to wait in the blocking `admit` method.
+
+        Raises:
+            ValueError: If a budget limit is negative or a priority has no share of the budgets.
+        """
+        self._ledgers = [BudgetLedger(budget) for budget in budgets]
+        if any(ledger.budget.limit < 0 for ledger in self._ledgers):
+            raise ValueError('Credit budget limits must not be negative.')
+        if set(priority_shares) != set(CallPriority):
+            raise ValueError('Every call priority must have a share of the credit budgets.')
+        self._endpoint_costs = dict(endpoint_costs)
+        self._priority_shares = dict(priority_shares)
+        self._max_deferral = max_deferral.total_seconds()
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self.stats = CreditStats()
+
+    def admit(self, endpoint_url_path: str) -> CreditReservation:
+        """
+        Block the calling thread until a call of the given endpoint fits into the budgets, and reserve its cost.
+
+        Args:
+            endpoint_url_path (str): The URL path of the endpoint of the call.
+
+        Returns:
+            CreditReservation: The reservation to settle once the call finishes.
+        """
+        deadline = self._clock() + self._max_deferral
+        reservation, delay = self.reserve(endpoint_url_path, deadline)
+        while reservation is None:
+            self._sleep(delay)
+            reservation, delay = self.reserve(endpoint_url_path, deadline)
+        return reservation
+
+    async def admit_async(self, endpoint_url_path: str) -> CreditReservation:
+        """
+        Suspend the calling task until a call of the given endpoint fits into the budgets, and reserve its cost.
+
+        Args:
+            endpoint_url_path (str): The URL path of the endpoint of the call.
+
+        Returns:
+            CreditReservation: The reservation to settle once the call finishes.
+        """
+        deadline = self._clock() + self._max_deferral
+        reservation, delay = self.reserve(endpoint_url_path, deadline)
+        while reservation is None:
+            await asyncio.sleep(delay)
+            reservation, delay = self.reserve(endpoint_url_path, deadline)
+        return reservation
+
+    def reserve(self, endpoint_url_path: str, deadline: float) -> tuple[CreditReservation | None, float]:
+        """
+        Try to reserve the cost of a call of the given endpoint, made with the current priority.
+
+        Args:
+            endpoint_url_path (str): The URL path of the endpoint of the call.
+            deadline (float): The time, per the clock of the tracker, the call may wait for credits until.
+
+        Returns:
+            tuple[CreditReservation | None, float]: The reservation, or None and the number of seconds to wait
+                before trying again.
+
+        Raises:
+            CreditBudgetExceededError: If the cost of the call will not fit into the budgets before the deadline.
+        """
+        cost = self._endpoint_costs.get(endpoint_url_path, _DEFAULT_ENDPOINT_COST)
+        priority = current_priority()
+        with self._lock:
+            delay = self._delay_until_fits(cost, self._priority_shares[priority])
+            if delay == 0:
+                for ledger in self._ledgers:
+                    ledger.reserved += cost
+                return CreditReservation(endpoint_url_path, cost), 0
+        if delay is None or delay > deadline - self._clock():
+            self.stats.record_rejection()
+            raise CreditBudgetExceededError(endpoint_url_path, priority)
+        self.stats.record_deferral()
+        return None, delay
+
+    def settle(self, reservation: CreditReservation, status_code: int | None) -> None:
+        """
+        Charge the reserved cost of a finished call if the API answered it successfully, and refund it otherwise.
+
+        Args:
+            reservation (CreditReservation): The reservation of the call.
+            status_code (int | None): The status code of the final response, or None if the call failed without one.
+        """
+        charged = status_code is not None and HTTPStatus.OK <= status_code < HTTPStatus.MULTIPLE_CHOICES
+        with self._lock:
+            now = self._clock()
+            for ledger in self._ledgers:
+                ledger.reserved -= reservation.cost
+                if charged:
+                    ledger.charge(reservation.cost, now)
+        if charged:
+            self.stats.record_charge(reservation.endpoint, reservation.cost)
+
+    def remaining_credits(self) -> dict[CreditBudget, float]:
+        """
+        Return the credits left in every budget, not counting the reservations of the calls in flight as spent.
+
+        Returns:
+            dict[CreditBudget, float]: The credits left in each budget.
+        """
+        with self._lock:
+            now = self._clock()
+            return {
+                ledger.budget: ledger.budget.limit - ledger.usage(now) + ledger.reserved
+                for ledger in self._ledgers
+            }
+
+    def _delay_until_fits(self, cost: float, share: float) -> float | None:
+        now = self._clock()
+        delays = [
+            ledger.delay_until_fits(cost, ledger.budget.limit * share, now)
+            for ledger in self._ledgers
+        ]
+        known_delays = [delay for delay in delays if delay is not None]
+        if len(known_delays) < len(delays):
+            return None
+        return max(known_delays, default=0)
@@ -1 +1,15 @@
 """This package contains implementations of the endpoint handlers for the Hunter.io API."""
+
+from hunter_client.client.endpoint_handlers.base import HUNTER_API_BASE_URL
+from hunter_client.client.endpoint_handlers.domain_and_name_searcher import DomainAndNameSearcher
+from hunter_client.client.endpoint_handlers.domain_searcher import DomainSearcher
+from hunter_client.client.endpoint_handlers.email_counter import EmailCounter
+from hunter_client.client.endpoint_handlers.email_verifier import EmailVerifier
+
+__all__ = [
+    'DomainAndNameSearcher',
+    'DomainSearcher',
+    'EmailCounter',
+    'EmailVerifier',
+    'HUNTER_API_BASE_URL',
+]
@@ -6,18 +6,31 @@ for interacting with the Hunter API. The module ensures a consistent approach fo
 to various API endpoints and manages common tasks like error handling, session management, and URL construction.
 """
 
+import json
 import logging
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, NotRequired, TypedDict, Unpack
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, ContextManager, Generic, Hashable, NotRequired, TypedDict, TypeVar, Unpack
 from urllib.parse import urlencode, urljoin
 
 import requests
+from pydantic import BaseModel
+
+from hunter_client.client.metrics import MetricsRecorder
+from hunter_client.client.retrying import RetryPolicy
+from hunter_client.client.timing import CallPhase, CallTimer, end_phase, is_call_timed, timed_call
+from hunter_client.services.response_models.validation import ValidationLevel, validation_context
 
 if TYPE_CHECKING:
-    from hunter_client.client import HunterClient
+    from hunter_client.client import CreditTracker, HunterClient
 
 logger = logging.getLogger(__name__)
 
+HUNTER_API_BASE_URL = 'https://api.hunter.io'
+
+ResponseModel = TypeVar('ResponseModel', bound=BaseModel)
+ParsedBody = TypeVar('ParsedBody')
+
 
 class PossibleQueryParams(TypedDict):
     """
@@ -34,46 +47,54 @@ class PossibleQueryParams(TypedDict):
     first_name: NotRequired[str]
     last_name: NotRequired[str]
     email: NotRequired[str]
+    limit: NotRequired[int]
+    offset: NotRequired[int]
 
 
-class AbstractBaseEndpointHandler(ABC):
+@dataclass(frozen=True)
+class ResponseModelParser(Generic[ResponseModel]):
     """
-    Abstract base class for handling various API endpoints of the Hunter service.
+    Parser validating raw response bodies into a response model at a given validation level.
 
-    This class provides a common interface and utility methods for different endpoint
-    handlers. It requires subclasses to define their own URL path and implements
-    common functionalities like URL formatting and error dispatching.
+    The parser is hashable, so identical requests validated at the same level share a key when they are coalesced.
+
+    Attributes:
+        model_type (type[ResponseModel]): The response model to validate the bodies into.
+        validation_level (ValidationLevel): The depth of validation of the bodies.
     """
 
-    _hunter_api_base_url = 'https://api.hunter.io'
-    _current_api_version_path = '/v2'
+    model_type: type[ResponseModel]
+    validation_level: ValidationLevel
 
-    def __init__(self, client: 'HunterClient') -> None:
+    def __call__(self, raw_body: bytes) -> ResponseModel:
         """
-        Initialize an instance of the AbstractBaseEndpointHandler.
+        Validate a raw response body into the response model.
 
         Args:
-            client (HunterClient): An instance of the `HunterClient` class which is used to make HTTP requests.
+            raw_body (bytes): The raw response body.
+
+        Returns:
+            ResponseModel: The validated response.
         """
-        self._client = client
+        return self.model_type.model_validate_json(raw_body, context=validation_context(self.validation_level))
+
+
+class AbstractEndpointHandlerCommons(ABC):
+    """
+    Abstract base class holding the parts of an endpoint handler that do not depend on the HTTP transport.
+
+    This class implements URL formatting and the request lifecycle hook that fires before a request is sent.
+    It is shared by the blocking handlers defined in this package and by the asynchronous handlers defined in
+    the `async_endpoint_handlers` package, so that both kinds of handlers build URLs in exactly the same way.
+    """
+
+    _hunter_api_base_url = HUNTER_API_BASE_URL
+    _current_api_version_path = '/v2'
 
     def before_request(self, method: str, url: str, **_query_params: Unpack[PossibleQueryParams]) -> None:
         """Request lifecycle hook before making an HTTP request."""
         logger.debug('Going to make an HTTP request: {0} {1}'.format(method, url))
 
-    def after_request(self, response: requests.Response) -> None:
-        """Request lifecycle hook after making an HTTP request."""
-        logger.debug('Got HTTP response: {0} {1}'.format(response.status_code, response.url))
-
-    def make_request(self, method: str, **query_params: Unpack[PossibleQueryParams]) -> requests.Response:
-        """Central method to make HTTP requests."""
-        url = self._formatted_url(**query_params)
-        self.before_request(method, url, **query_params)
-        response = self._client.http_session.request(method, url)
-        self.after_request(response)
-        response.raise_for_status()
-        return response
-
     @property
     @abstractmethod
     def _endpoint_url_path(self) -> str:
@@ -102,3 +123,208 @@ class AbstractBaseEndpointHandler(ABC):
         """
         joined_url = urljoin(self._hunter_api_base_url, self._current_api_version_path + self._endpoint_url_path)
         return '{0}?{1}'.format(joined_url, urlencode(query_params))
+
+    def _request_key(self, method: str, **query_params: Unpack[PossibleQueryParams]) -> Hashable:
+        """
+        Build a key identifying a request regardless of the order of its query parameters.
+
+        Args:
+            method (str): The HTTP method of the request.
+            query_params (Unpack[PossibleQueryParams]): A set of key-value pairs representing query parameters.
+
+        Returns:
+            Hashable: The key of the request.
+        """
+        return (method, self._endpoint_url_path, frozenset(query_params.items()))
+
+    def _timed_call(self, call_timer: CallTimer | None, method: str) -> ContextManager[None]:
+        """
+        Time the phases of a call of the endpoint with the given timer, if any.
+
+        Args:
+            call_timer (CallTimer | None): The timer of the calls of the client, or None if calls are not timed.
+            method (str): The HTTP method of the call.
+
+        Returns:
+            ContextManager[None]: The context of the timed call.
+        """
+        return timed_call(call_timer, self._endpoint_url_path, method)
+
+    def _parse_phase(self, parse: Callable[[bytes], object]) -> CallPhase:
+        """
+        Tell which phase of a call parsing its body with the given parser is.
+
+        Args:
+            parse (Callable[[bytes], object]): The parser of the body.
+
+        Returns:
+            CallPhase: Validation for the response model parsers, decoding for any other parser.
+        """
+        return CallPhase.VALIDATE if isinstance(parse, ResponseModelParser) else CallPhase.DECODE
+
+
+class AbstractBaseEndpointHandler(AbstractEndpointHandlerCommons):  # noqa: WPS214
+    """
+    Abstract base class for handling various API endpoints of the Hunter service.
+
+    This class provides a common interface and utility methods for different endpoint
+    handlers. It requires subclasses to define their own URL path and implements
+    common functionalities like URL formatting and error dispatching.
+    """
+
+    def __init__(self, client: 'HunterClient') -> None:
+        """
+        Initialize an instance of the AbstractBaseEndpointHandler.
+
+        Args:
+            client (HunterClient): An instance of the `HunterClient` class which is used to make HTTP requests.
+        """
+        self._client = client
+        self._hunter_api_base_url = client.base_url
+
+    def after_request(self, response: requests.Response) -> None:
+        """Request lifecycle hook after making an HTTP request."""
+        logger.debug('Got HTTP response: {0} {1}'.format(response.status_code, response.url))
+
+    def make_request(self, method: str, **query_params: Unpack[PossibleQueryParams]) -> requests.Response:
+        """Central method to make HTTP requests, retrying transient failures per the client's retry policy."""
+        with self._timed_call(self._client.call_timer, method):
+            url = self._formatted_url(**query_params)
+            credit_tracker = self._client.credit_tracker
+            if credit_tracker is None:
+                response = self._send_request_per_policy(method, url, **query_params)
+            else:
+                response = self._send_budgeted_request(credit_tracker, method, url, **query_params)
+            response.raise_for_status()
+        return response
+
+    def request_json(self, method: str, **query_params: Unpack[PossibleQueryParams]) -> dict:
+        """Make an HTTP request and parse its JSON body, coalescing identical concurrent requests if enabled."""
+        return self._request_parsed(json.loads, method, **query_params)
+
+    def request_model(
+        self,
+        model_type: type[ResponseModel],
+        method: str,
+        validation_level: ValidationLevel | None = None,
+        **query_params: Unpack[PossibleQueryParams],
+    ) -> ResponseModel:
+        """Make an HTTP request and validate its raw body into a response model, skipping the intermediate dict."""
+        parse = ResponseModelParser(model_type, validation_level or self._client.validation_level)
+        return self._request_parsed(parse, method, **query_params)
+
+    def _request_parsed(
+        self,
+        parse: Callable[[bytes], ParsedBody],
+        method: str,
+        **query_params: Unpack[PossibleQueryParams],
+    ) -> ParsedBody:
+        request_coalescer = self._client.request_coalescer
+        if request_coalescer is None:
+            return self._fetch_parsed(parse, method, **query_params)
+        request_key = (parse, self._request_key(method, **query_params))
+        return request_coalescer.coalesce(request_key, lambda: self._fetch_parsed(parse, method, **query_params))
+
+    def _fetch_parsed(
+        self,
+        parse: Callable[[bytes], ParsedBody],
+        method: str,
+        **query_params: Unpack[PossibleQueryParams],
+    ) -> ParsedBody:
+        with self._timed_call(self._client.call_timer, method):
+            parsed_body = parse(self._fetch_body(method, **query_params))
+            end_phase(self._parse_phase(parse))
+        return parsed_body
+
+    def _fetch_body(self, method: str, **query_params: Unpack[PossibleQueryParams]) -> bytes:
+        response_cache = self._client.response_cache
+        if response_cache is None:
+            return self.make_request(method, **query_params).content
+        cached_body = response_cache.lookup(method, self._endpoint_url_path, query_params)
+        if cached_body is not None:
+            return cached_body
+        raw_body = self.make_request(method, **query_params).content
+        response_cache.store(method, self._endpoint_url_path, query_params, raw_body)
+        return raw_body
+
+    def _send_budgeted_request(
+        self,
+        credit_tracker: 'CreditTracker',
+        method: str,
+        url: str,
+        **query_params: Unpack[PossibleQueryParams],
+    ) -> requests.Response:
+        reservation = credit_tracker.admit(self._endpoint_url_path)
+        response: requests.Response | None = None
+        try:  # noqa: WPS501
+            response = self._send_request_per_policy(method, url, **query_params)
+        finally:
+            credit_tracker.settle(reservation, None if response is None else response.status_code)
+        return response
+
+    def _send_request_per_policy(
+        self,
+        method: str,
+        url: str,
+        **query_params: Unpack[PossibleQueryParams],
+    ) -> requests.Response:
+        retry_policy = self._client.retry_policy
+        if retry_policy is None:
+            return self._send_request(method, url, **query_params)
+        return self._send_request_with_retries(retry_policy, method, url, **query_params)
+
+    def _send_request(self, method: str, url: str, **query_params: Unpack[PossibleQueryParams]) -> requests.Response:
+        if self._client.rate_limiter is not None:
+            self._client.rate_limiter.acquire(self._endpoint_url_path)
+        self.before_request(method, url, **query_params)
+        end_phase(CallPhase.QUEUE)
+        metrics = self._client.metrics
+        if metrics is None:
+            response = self._transfer(method, url)
+        else:
+            response = self._send_measured_request(metrics, method, url)
+        self.after_request(response)
+        return response
+
+    def _send_measured_request(self, metrics: MetricsRecorder, method: str, url: str) -> requests.Response:
+        endpoint = self._endpoint_url_path
+        metrics.request_started(endpoint)
+        started_at = metrics.clock()
+        response: requests.Response | None = None
+        try:  # noqa: WPS501
+            response = self._transfer(method, url)
+        finally:
+            latency = metrics.clock() - started_at
+            if response is None:
+                metrics.request_failed(endpoint, latency)
+            else:
+                metrics.request_finished(endpoint, response.status_code, latency, len(response.content))
+        return response
+
+    def _transfer(self, method: str, url: str) -> requests.Response:
+        if not is_call_timed():
+            return self._client.http_session.request(method, url)
+        response = self._client.http_session.request(method, url, stream=True)
+        end_phase(CallPhase.WAIT)
+        response.content  # noqa: WPS428 -- reads the streamed body, which the response then keeps
+        end_phase(CallPhase.DOWNLOAD)
+        return response
+
+    def _send_request_with_retries(
+        self,
+        retry_policy: RetryPolicy,
+        method: str,
+        url: str,
+        **query_params: Unpack[PossibleQueryParams],
+    ) -> requests.Response:
+        started_at = retry_policy.clock()
+        attempt = 1
+        response = self._send_request(method, url, **query_params)
+        delay = retry_policy.next_delay(method, response, attempt, started_at)
+        while delay is not None:
+            retry_policy.sleep(delay)
+            end_phase(CallPhase.RETRY_BACKOFF)
+            attempt += 1
+            response = self._send_request(method, url, **query_params)
+            delay = retry_policy.next_delay(method, response, attempt, started_at)
+        return response
@@ -1,6 +1,8 @@
 """This module contains handler class implementation for the `email-finder` endpoint of the Hunter API."""
 
 from hunter_client.client.endpoint_handlers.base import AbstractBaseEndpointHandler
+from hunter_client.services.response_models import DomainAndNameSearcherResponse
+from hunter_client.services.response_models.validation import ValidationLevel
 
 
 class DomainAndNameSearcher(AbstractBaseEndpointHandler):
@@ -24,4 +26,32 @@ class DomainAndNameSearcher(AbstractBaseEndpointHandler):
         Returns:
             dict: Raw JSON response from the wrapped API endpoint (`.../email-finder`).
         """
-        return self.make_request('GET', domain=target_domain, first_name=first_name, last_name=last_name).json()
+        return self.request_json('GET', domain=target_domain, first_name=first_name, last_name=last_name)
+
+    def find_email(
+        self,
+        target_domain: str,
+        first_name: str,
+        last_name: str,
+        validation_level: ValidationLevel | None = None,
+    ) -> DomainAndNameSearcherResponse:
+        """
+        Search for emails associated with a given domain and name, validating the response from its raw body.
+
+        Args:
+            target_domain (str): The domain to search emails for.
+            first_name (str): The first name of the person to search for.
+            last_name (str): The last name of the person to search for.
+            validation_level (ValidationLevel | None): The depth of validation, or None to use the client's default.
+
+        Returns:
+            DomainAndNameSearcherResponse: Validated response from the wrapped API endpoint (`.../email-finder`).
+        """
+        return self.request_model(
+            DomainAndNameSearcherResponse,
+            'GET',
+            validation_level,
+            domain=target_domain,
+            first_name=first_name,
+            last_name=last_name,
+        )
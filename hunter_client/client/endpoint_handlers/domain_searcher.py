@@ -1,6 +1,18 @@
 """This module contains handler class implementation for the `domain-search` endpoint of the Hunter API."""
 
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from functools import partial
+from typing import Callable, Generator, Iterator, Sequence
+
 from hunter_client.client.endpoint_handlers.base import AbstractBaseEndpointHandler
+from hunter_client.services.response_models import DomainSearcherResponse
+from hunter_client.services.response_models.components import EmailInfo
+from hunter_client.services.response_models.records import EmailRecord
+from hunter_client.services.response_models.validation import ValidationLevel
+
+Page = tuple[int, Sequence[EmailInfo | EmailRecord]]
+PendingPage = Callable[[], Page]
 
 
 class DomainSearcher(AbstractBaseEndpointHandler):
@@ -22,4 +34,110 @@ class DomainSearcher(AbstractBaseEndpointHandler):
         Returns:
             dict: Raw JSON response from the wrapped API endpoint (`.../domain-search`).
         """
-        return self.make_request('GET', domain=target_domain).json()
+        return self.request_json('GET', domain=target_domain)
+
+    def search_domain(
+        self,
+        target_domain: str,
+        validation_level: ValidationLevel | None = None,
+    ) -> DomainSearcherResponse:
+        """
+        Search for emails associated with a given domain, validating the response straight from its raw body.
+
+        Args:
+            target_domain (str): The domain to search emails for.
+            validation_level (ValidationLevel | None): The depth of validation, or None to use the client's default.
+
+        Returns:
+            DomainSearcherResponse: Validated response from the wrapped API endpoint (`.../domain-search`).
+        """
+        return self.request_model(DomainSearcherResponse, 'GET', validation_level, domain=target_domain)
+
+    def iterate_emails_by_domain(  # noqa: WPS211
+        self,
+        target_domain: str,
+        page_size: int = 10,
+        max_results: int | None = None,
+        prefetch: bool = False,
+        validation_level: ValidationLevel | None = None,
+    ) -> Generator[EmailInfo | EmailRecord, None, None]:
+        """
+        Lazily iterate over all emails associated with a given domain, one page of results at a time.
+
+        Only the page being consumed is held in memory, and by default a page is only requested once the previous one
+        has been read, so closing the iterator early never costs a page that is not read. With `prefetch` enabled, the
+        next page is requested in the background while the current one is consumed, so closing the iterator before
+        the last page (or the page reaching `max_results`) costs the one page fetched ahead.
+
+        Pages fetched ahead are requested in the context of the consumer, e.g. with the priority of its
+        `call_priority` context.
+
+        At the raw validation level the pages are not validated at all and the emails are yielded as compact
+        `EmailRecord` instances instead of `EmailInfo` models.
+
+        Args:
+            target_domain (str): The domain to search emails for.
+            page_size (int): The number of emails requested per page.
+            max_results (int | None): The maximum number of emails to yield, or None to yield all of them.
+            prefetch (bool): Whether to request the next page while the current one is consumed.
+            validation_level (ValidationLevel | None): The depth of validation, or None to use the client's default.
+
+        Yields:
+            EmailInfo | EmailRecord: The emails found for the domain, in the order returned by the API.
+        """
+        fetch_page = partial(
+            self._fetch_page,
+            target_domain,
+            page_size,
+            validation_level or self._client.validation_level,
+        )
+        if not prefetch:
+            yield from self._iterate_pages(lambda offset: partial(fetch_page, offset), max_results)
+            return
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='domain-search-prefetch')
+        try:  # noqa: WPS501
+            yield from self._iterate_pages(
+                lambda offset: executor.submit(copy_context().run, fetch_page, offset).result,
+                max_results,
+            )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch_page(
+        self,
+        target_domain: str,
+        page_size: int,
+        validation_level: ValidationLevel,
+        offset: int,
+    ) -> Page:
+        if validation_level is ValidationLevel.RAW:
+            page_json = self.request_json('GET', domain=target_domain, limit=page_size, offset=offset)
+            page_emails = [EmailRecord.from_json(email_json) for email_json in page_json['data']['emails']]
+            return page_json['meta']['results'], page_emails
+        page = self.request_model(
+            DomainSearcherResponse,
+            'GET',
+            validation_level,
+            domain=target_domain,
+            limit=page_size,
+            offset=offset,
+        )
+        return page.meta.results, page.data.emails
+
+    def _iterate_pages(
+        self,
+        schedule_page: Callable[[int], PendingPage],
+        max_results: int | None,
+    ) -> Iterator[EmailInfo | EmailRecord]:
+        yielded_count = 0
+        pending_page: PendingPage | None = schedule_page(yielded_count)
+        while pending_page is not None:
+            results_count, all_page_emails = pending_page()
+            if max_results is not None:
+                results_count = min(results_count, max_results)
+            page_emails = all_page_emails[:results_count - yielded_count]
+            yielded_count += len(page_emails)
+            pending_page = None
+            if page_emails and yielded_count < results_count:
+                pending_page = schedule_page(yielded_count)
+            yield from page_emails
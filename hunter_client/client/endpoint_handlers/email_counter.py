@@ -1,6 +1,8 @@
 """This module contains handler class implementation for the `email-count` endpoint of the Hunter API."""
 
 from hunter_client.client.endpoint_handlers.base import AbstractBaseEndpointHandler
+from hunter_client.services.response_models import EmailCounterResponse
+from hunter_client.services.response_models.validation import ValidationLevel
 
 
 class EmailCounter(AbstractBaseEndpointHandler):
@@ -22,4 +24,21 @@ class EmailCounter(AbstractBaseEndpointHandler):
         Returns:
             dict: Raw JSON response from the wrapped API endpoint (`.../email-count`).
         """
-        return self.make_request('GET', domain=target_domain).json()
+        return self.request_json('GET', domain=target_domain)
+
+    def count_emails(
+        self,
+        target_domain: str,
+        validation_level: ValidationLevel | None = None,
+    ) -> EmailCounterResponse:
+        """
+        Count the number of emails associated with a given domain, validating the response from its raw body.
+
+        Args:
+            target_domain (str): The domain to count emails for.
+            validation_level (ValidationLevel | None): The depth of validation, or None to use the client's default.
+
+        Returns:
+            EmailCounterResponse: Validated response from the wrapped API endpoint (`.../email-count`).
+        """
+        return self.request_model(EmailCounterResponse, 'GET', validation_level, domain=target_domain)
@@ -1,6 +1,8 @@
 """This module contains handler class implementation for the `email-verifier` endpoint of the Hunter API."""
 
 from hunter_client.client.endpoint_handlers.base import AbstractBaseEndpointHandler
+from hunter_client.services.response_models import EmailVerifierResponse
+from hunter_client.services.response_models.validation import ValidationLevel
 
 
 class EmailVerifier(AbstractBaseEndpointHandler):
@@ -22,4 +24,21 @@ class EmailVerifier(AbstractBaseEndpointHandler):
         Returns:
             dict: Raw JSON response from the wrapped API endpoint (`.../email-verifier`).
         """
-        return self.make_request('GET', email=email).json()
+        return self.request_json('GET', email=email)
+
+    def verify_email(
+        self,
+        email: str,
+        validation_level: ValidationLevel | None = None,
+    ) -> EmailVerifierResponse:
+        """
+        Verify the status of an email address, validating the response straight from its raw body.
+
+        Args:
+            email (str): The email address to verify.
+            validation_level (ValidationLevel | None): The depth of validation, or None to use the client's default.
+
+        Returns:
+            EmailVerifierResponse: Validated response from the wrapped API endpoint (`.../email-verifier`).
+        """
+        return self.request_model(EmailVerifierResponse, 'GET', validation_level, email=email)
@@ -0,0 +1,234 @@
+"""
+This module defines how the client reports metrics about the requests it sends to the Hunter API.
+
+Clients accept a `MetricsRecorder`, which is told when every request to an endpoint starts and how it finished:
+with a response, whose status code, latency and size are reported, or with a transport error. `InProcessMetrics`
+is a recorder aggregating per-endpoint counters, latency histograms and in-flight gauges in memory; its state can be
+exported with `hunter_client.client.prometheus.render_prometheus_text`. Other recorders may forward the events to
+any metrics system instead.
+"""
+
+import bisect
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Callable
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class MetricsRecorder(ABC):
+    """
+    Abstract base class for the recorders of the metrics of the requests sent by a client.
+
+    Recorders are called from every thread and task sending requests, so they must be thread-safe. Latencies are
+    measured by the endpoint handlers with the `clock` of the recorder.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        """
+        Initialize the recorder.
+
+        Args:
+            clock (Callable[[], float]): The clock measuring the latencies, in seconds.
+        """
+        self.clock = clock
+
+    @abstractmethod
+    def request_started(self, endpoint: str) -> None:
+        """
+        Record that a request to an endpoint was sent.
+
+        Args:
+            endpoint (str): The URL path of the endpoint, e.g. `/email-verifier`.
+        """
+
+    @abstractmethod
+    def request_finished(self, endpoint: str, status_code: int, latency: float, received_bytes: int) -> None:
+        """
+        Record that a response to a request was received.
+
+        Args:
+            endpoint (str): The URL path of the endpoint.
+            status_code (int): The status code of the response.
+            latency (float): The time from sending the request to receiving the whole response, in seconds.
+            received_bytes (int): The size of the body of the response.
+        """
+
+    @abstractmethod
+    def request_failed(self, endpoint: str, latency: float) -> None:
+        """
+        Record that a request failed without a response, e.g. because of a connection error or a timeout.
+
+        Args:
+            endpoint (str): The URL path of the endpoint.
+            latency (float): The time from sending the request to the failure, in seconds.
+        """
+
+
+@dataclass
+class LatencyHistogram(object):
+    """
+    A histogram of latencies with fixed bucket bounds.
+
+    Attributes:
+        bounds (tuple[float, ...]): The upper bounds of the buckets, in seconds, in increasing order.
+        bucket_counts (list[int]): The number of observations per bucket, with one more bucket for the overflow.
+        total (float): The sum of all observed latencies, in seconds.
+        count (int): The number of observations.
+    """
+
+    bounds: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+    bucket_counts: list[int] = field(default_factory=list)
+    total: float = 0
+    count: int = 0
+
+    def __post_init__(self) -> None:
+        """Create the empty buckets, unless they were given."""
+        if not self.bucket_counts:
+            self.bucket_counts = [0] * (len(self.bounds) + 1)  # noqa: WPS435
+
+    def observe(self, latency: float) -> None:
+        """
+        Add an observation to the histogram.
+
+        Args:
+            latency (float): The observed latency, in seconds.
+        """
+        self.bucket_counts[bisect.bisect_left(self.bounds, latency)] += 1
+        self.total += latency
+        self.count += 1
+
+    def cumulative_counts(self) -> list[int]:
+        """
+        Return the number of observations less than or equal to every bound, and the total number of observations.
+
+        Returns:
+            list[int]: The cumulative counts, one per bound and a last one for all observations.
+        """
+        cumulative_counts = []
+        running_count = 0
+        for bucket_count in self.bucket_counts:
+            running_count += bucket_count
+            cumulative_counts.append(running_count)
+        return cumulative_counts
+
+
+@dataclass
+class EndpointMetrics(object):
+    """
+    The metrics of the requests sent to an endpoint.
+
+    Attributes:
+        requests (int): The number of requests sent.
+        responses_by_status (dict[int, int]): The number of responses received, by status code.
+        failures (int): The number of requests failed without a response.
+        received_bytes (int): The total size of the bodies of the responses.
+        in_flight (int): The number of requests sent and not yet finished.
+        latency (LatencyHistogram): The latencies of the finished requests, with or without a response.
+    """
+
+    requests: int = 0
+    responses_by_status: dict[int, int] = field(default_factory=dict)
+    failures: int = 0
+    received_bytes: int = 0
+    in_flight: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+
+class InProcessMetrics(MetricsRecorder):
+    """A thread-safe recorder aggregating the metrics of every endpoint in memory."""
+
+    def __init__(
+        self,
+        latency_buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """
+        Initialize the recorder with no metrics.
+
+        Args:
+            latency_buckets (tuple[float, ...]): The upper bounds of the buckets of the latency histograms, in seconds.
+            clock (Callable[[], float]): The clock measuring the latencies, in seconds.
+        """
+        super().__init__(clock)
+        self._latency_buckets = latency_buckets
+        self._endpoints: dict[str, EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def request_started(self, endpoint: str) -> None:
+        """
+        Record that a request to an endpoint was sent.
+
+        Args:
+            endpoint (str): The URL path of the endpoint, e.g. `/email-verifier`.
+        """
+        with self._lock:
+            endpoint_metrics = self._endpoint_metrics(endpoint)
+            endpoint_metrics.requests += 1
+            endpoint_metrics.in_flight += 1
+
+    def request_finished(self, endpoint: str, status_code: int, latency: float, received_bytes: int) -> None:
+        """
+        Record that a response to a request was received.
+
+        Args:
+            endpoint (str): The URL path of the endpoint.
+            status_code (int): The status code of the response.
+            latency (float): The time from sending the request to receiving the whole response, in seconds.
+            received_bytes (int): The size of the body of the response.
+        """
+        with self._lock:
+            endpoint_metrics = self._endpoint_metrics(endpoint)
+            endpoint_metrics.in_flight -= 1
+            endpoint_metrics.latency.observe(latency)
+            endpoint_metrics.received_bytes += received_bytes
+            responses_by_status = endpoint_metrics.responses_by_status
+            responses_by_status[status_code] = responses_by_status.get(status_code, 0) + 1
+
+    def request_failed(self, endpoint: str, latency: float) -> None:
+        """
+        Record that a request failed without a response, e.g. because of a connection error or a timeout.
+
+        Args:
+            endpoint (str): The URL path of the endpoint.
+            latency (float): The time from sending the request to the failure, in seconds.
+        """
+        with self._lock:
+            endpoint_metrics = self._endpoint_metrics(endpoint)
+            endpoint_metrics.in_flight -= 1
+            endpoint_metrics.latency.observe(latency)
+            endpoint_metrics.failures += 1
+
+    def snapshot(self) -> dict[str, EndpointMetrics]:
+        """
+        Return a consistent copy of the metrics of every endpoint requested so far.
+
+        Returns:
+            dict[str, EndpointMetrics]: The metrics, keyed by the URL paths of the endpoints.
+        """
+        with self._lock:
+            return {
+                endpoint: EndpointMetrics(
+                    requests=endpoint_metrics.requests,
+                    responses_by_status=dict(endpoint_metrics.responses_by_status),
+                    failures=endpoint_metrics.failures,
+                    received_bytes=endpoint_metrics.received_bytes,
+                    in_flight=endpoint_metrics.in_flight,
+                    latency=LatencyHistogram(
+                        bounds=endpoint_metrics.latency.bounds,
+                        bucket_counts=list(endpoint_metrics.latency.bucket_counts),
+                        total=endpoint_metrics.latency.total,
+                        count=endpoint_metrics.latency.count,
+                    ),
+                )
+                for endpoint, endpoint_metrics in self._endpoints.items()
+            }
+
+    def _endpoint_metrics(self, endpoint: str) -> EndpointMetrics:
+        endpoint_metrics = self._endpoints.get(endpoint)
+        if endpoint_metrics is None:
+            endpoint_metrics = EndpointMetrics(latency=LatencyHistogram(bounds=self._latency_buckets))
+            self._endpoints[endpoint] = endpoint_metrics
+        return endpoint_metrics
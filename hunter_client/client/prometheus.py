@@ -0,0 +1,124 @@
+"""
+This module exports the metrics aggregated by `InProcessMetrics` in the Prometheus text exposition format.
+
+The rendered text can be served from any HTTP endpoint scraped by Prometheus, or written to a file picked up by
+the textfile collector of the node exporter.
+"""
+
+from functools import partial
+from operator import attrgetter
+from typing import Callable, Iterator, NamedTuple
+
+from hunter_client.client.metrics import EndpointMetrics, InProcessMetrics
+
+METRIC_PREFIX = 'hunter_client'
+
+_RenderSamples = Callable[[str, str, EndpointMetrics], Iterator[str]]
+
+
+class _MetricFamily(NamedTuple):
+    name: str
+    metric_type: str
+    help_text: str
+    render_samples: _RenderSamples
+
+    def lines(self, snapshot: list[tuple[str, EndpointMetrics]]) -> Iterator[str]:
+        full_name = '{0}_{1}'.format(METRIC_PREFIX, self.name)
+        yield '# HELP {0} {1}'.format(full_name, self.help_text)
+        yield '# TYPE {0} {1}'.format(full_name, self.metric_type)  # noqa: WPS354
+        for endpoint, endpoint_metrics in snapshot:
+            yield from self.render_samples(full_name, endpoint, endpoint_metrics)
+
+
+def render_prometheus_text(metrics: InProcessMetrics) -> str:
+    """
+    Render a snapshot of the metrics of every endpoint in the Prometheus text exposition format.
+
+    Args:
+        metrics (InProcessMetrics): The recorder aggregating the metrics.
+
+    Returns:
+        str: The metrics, one sample per line, ending with a newline.
+    """
+    snapshot = sorted(metrics.snapshot().items())
+    lines = [line for metric_family in _METRIC_FAMILIES for line in metric_family.lines(snapshot)]
+    return '{0}\n'.format('\n'.join(lines))
+
+
+def _sample(metric_name: str, labels: dict[str, str], sample_value: float) -> str:
+    rendered_labels = ','.join(
+        '{0}="{1}"'.format(label_name, label_value) for label_name, label_value in labels.items()
+    )
+    return '{0}{{{1}}} {2}'.format(metric_name, rendered_labels, sample_value)
+
+
+def _scalar_samples(
+    read_value: Callable[[EndpointMetrics], int],
+    metric_name: str,
+    endpoint: str,
+    endpoint_metrics: EndpointMetrics,
+) -> Iterator[str]:
+    yield _sample(metric_name, {'endpoint': endpoint}, read_value(endpoint_metrics))
+
+
+def _response_samples(metric_name: str, endpoint: str, endpoint_metrics: EndpointMetrics) -> Iterator[str]:
+    yield from (
+        _sample(metric_name, {'endpoint': endpoint, 'status': str(status_code)}, responses_count)
+        for status_code, responses_count in sorted(endpoint_metrics.responses_by_status.items())
+    )
+
+
+def _latency_samples(metric_name: str, endpoint: str, endpoint_metrics: EndpointMetrics) -> Iterator[str]:
+    histogram = endpoint_metrics.latency
+    yield from (
+        _sample('{0}_bucket'.format(metric_name), {'endpoint': endpoint, 'le': bucket_label}, cumulative_count)
+        for bucket_label, cumulative_count in zip(_bucket_labels(histogram.bounds), histogram.cumulative_counts())
+    )
+    yield from (
+        _sample('{0}_{1}'.format(metric_name, suffix), {'endpoint': endpoint}, total)
+        for suffix, total in (('sum', histogram.total), ('count', histogram.count))
+    )
+
+
+def _bucket_labels(bounds: tuple[float, ...]) -> list[str]:
+    return [*(repr(float(bound)) for bound in bounds), '+Inf']
+
+
+_METRIC_FAMILIES = (  # noqa: WPS407
+    _MetricFamily(
+        'requests_total',
+        'counter',
+        'Requests sent to the Hunter API.',
+        partial(_scalar_samples, attrgetter('requests')),
+    ),
+    _MetricFamily(
+        'responses_total',
+        'counter',
+        'Responses received from the Hunter API, by status code.',
+        _response_samples,
+    ),
+    _MetricFamily(
+        'request_failures_total',
+        'counter',
+        'Requests to the Hunter API failed without a response.',
+        partial(_scalar_samples, attrgetter('failures')),
+    ),
+    _MetricFamily(
+        'request_duration_seconds',
+        'histogram',
+        'Latency of requests to the Hunter API.',
+        _latency_samples,
+    ),
+    _MetricFamily(
+        'received_bytes_total',
+        'counter',
+        'Bytes of response bodies received from the Hunter API.',
+        partial(_scalar_samples, attrgetter('received_bytes')),
+    ),
+    _MetricFamily(
+        'requests_in_flight',
+        'gauge',
+        'Requests to the Hunter API sent and not yet finished.',
+        partial(_scalar_samples, attrgetter('in_flight')),
+    ),
+)
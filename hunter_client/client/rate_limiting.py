@@ -0,0 +1,135 @@
+"""
+This module provides a client-side rate limiter for the requests sent to the Hunter API.
+
+The limiter is built from token buckets: a global one shared by all endpoints and optional per-endpoint ones. Every
+request reserves a token from each bucket that applies to it and, if a bucket is empty, waits until its token is
+refilled. Reservations are handed out in order, so concurrent callers are paced evenly instead of failing with
+429 responses. A single limiter may be shared by several clients, threads and asynchronous tasks.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Callable, Mapping
+
+
+class TokenBucket(object):
+    """
+    A thread-safe token bucket refilled at a constant rate.
+
+    Tokens are reserved rather than taken: the bucket may go into debt, and every reservation reports how long its
+    owner has to wait until the token it reserved is actually refilled. This keeps waiting callers in order and
+    avoids polling.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize a full token bucket.
+
+        Args:
+            rate (float): The number of tokens refilled per second.
+            capacity (float): The maximum number of tokens the bucket holds, i.e. the allowed burst size.
+            clock (Callable[[], float]): A monotonic clock returning the current time in seconds.
+
+        Raises:
+            ValueError: If `rate` or `capacity` is not positive.
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError('Token bucket rate and capacity must be positive, got {0} and {1}.'.format(rate, capacity))
+        self._rate = rate
+        self._capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._refilled_at = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Reserve a single token.
+
+        Returns:
+            float: The number of seconds to wait before the reserved token may be used.
+        """
+        with self._lock:
+            now = self._clock()
+            refilled_tokens = (now - self._refilled_at) * self._rate
+            self._tokens = min(self._capacity, self._tokens + refilled_tokens)
+            self._refilled_at = now
+            self._tokens -= 1
+            return max(0, -self._tokens / self._rate)
+
+
+class RateLimiter(object):
+    """
+    Client-side rate limiter with a global budget and optional per-endpoint budgets.
+
+    Endpoints are identified by their URL path, as declared by the endpoint handlers (e.g. `/email-verifier`).
+    A request to an endpoint is delayed until both the global budget and the budget of that endpoint allow it.
+    """
+
+    def __init__(  # noqa: WPS211
+        self,
+        requests_per_second: float | None = None,
+        endpoint_requests_per_second: Mapping[str, float] | None = None,
+        burst_size: float = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialize the rate limiter.
+
+        Args:
+            requests_per_second (float | None): The global budget, or None for no global limit.
+            endpoint_requests_per_second (Mapping[str, float] | None): The budgets of individual endpoints.
+            burst_size (float): The number of requests that may be sent at once after a quiet period.
+            clock (Callable[[], float]): A monotonic clock returning the current time in seconds.
+            sleep (Callable[[float], None]): The function used to wait in the blocking `acquire` method.
+        """
+        self._global_bucket = None
+        if requests_per_second is not None:
+            self._global_bucket = TokenBucket(requests_per_second, burst_size, clock)
+        self._endpoint_buckets = {
+            endpoint_url_path: TokenBucket(endpoint_rate, burst_size, clock)
+            for endpoint_url_path, endpoint_rate in (endpoint_requests_per_second or {}).items()
+        }
+        self._sleep = sleep
+
+    def acquire(self, endpoint_url_path: str) -> None:
+        """
+        Block the calling thread until a request to the given endpoint may be sent.
+
+        Args:
+            endpoint_url_path (str): The URL path of the endpoint the request is sent to.
+        """
+        delay = self.reserve(endpoint_url_path)
+        if delay > 0:
+            self._sleep(delay)
+
+    async def acquire_async(self, endpoint_url_path: str) -> None:
+        """
+        Suspend the calling task until a request to the given endpoint may be sent.
+
+        Args:
+            endpoint_url_path (str): The URL path of the endpoint the request is sent to.
+        """
+        delay = self.reserve(endpoint_url_path)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def reserve(self, endpoint_url_path: str) -> float:
+        """
+        Reserve the right to send a request to the given endpoint.
+
+        Args:
+            endpoint_url_path (str): The URL path of the endpoint the request is sent to.
+
+        Returns:
+            float: The number of seconds to wait before the request may be sent.
+        """
+        buckets = [self._global_bucket, self._endpoint_buckets.get(endpoint_url_path)]
+        return max((bucket.reserve() for bucket in buckets if bucket is not None), default=0)
@@ -0,0 +1,132 @@
+"""
+This module provides a cache of the raw bodies of the responses of the Hunter API.
+
+A client given a `ResponseCache` looks up every GET call of an endpoint handler in it before sending the request,
+and stores the body of every successful response in it, so that repeated domain searches, email lookups, email
+counts and verifications are served locally until they expire. The bodies are cached before parsing, which lets
+the raw and typed handler methods share the same entries. Entries are kept in any `ResultsStorage`, keyed by the
+endpoint and the normalized query parameters of the call, and expire after a time-to-live configured per endpoint.
+"""
+
+import time
+from datetime import timedelta
+from typing import Callable, Mapping, TypedDict
+from urllib.parse import urlencode
+
+from hunter_client.services.cache_stats import CacheStats
+from hunter_client.storages.interface import ResultsStorage
+
+_CACHEABLE_METHODS = frozenset(('GET',))
+
+
+class CachedResponse(TypedDict):
+    """
+    The body of a response of the Hunter API, as kept in the storage of a response cache.
+
+    The entry is a plain dictionary, so that it can be kept in any storage, including JSON-serializing ones.
+
+    Attributes:
+        body (str): The body of the response, decoded from UTF-8.
+        expires_at (float): The time the entry expires at, in seconds since the epoch.
+    """
+
+    body: str
+    expires_at: float
+
+
+def response_cache_key(method: str, endpoint: str, query_params: Mapping[str, object]) -> str:
+    """
+    Build the key of a call regardless of the order of its query parameters.
+
+    Args:
+        method (str): The HTTP method of the call.
+        endpoint (str): The URL path of the called endpoint, e.g. `/domain-search`.
+        query_params (Mapping[str, object]): The query parameters of the call.
+
+    Returns:
+        str: The key, e.g. `GET /email-finder?domain=example.com&first_name=John&last_name=Doe`.
+    """
+    return '{0} {1}?{2}'.format(method, endpoint, urlencode(sorted(query_params.items())))
+
+
+class ResponseCache(object):
+    """
+    A cache of the raw bodies of successful responses, with a time-to-live per endpoint.
+
+    A single cache may be shared by several clients, threads and asynchronous tasks, as long as its storage is.
+
+    Attributes:
+        stats (CacheStats): Lookups of cacheable calls that were served from the cache (hits) and that were not.
+    """
+
+    def __init__(
+        self,
+        storage: ResultsStorage[str, CachedResponse],
+        endpoint_ttls: Mapping[str, timedelta] | None = None,
+        default_ttl: timedelta | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        The time-to-live of the responses of each endpoint is keyed by the URL path of the endpoint, e.g.
+        `{'/domain-search': timedelta(days=7)}`. Responses of endpoints without a time-to-live are not cached.
+
+        Args:
+            storage (ResultsStorage[str, CachedResponse]): The storage of the cached responses.
+            endpoint_ttls (Mapping[str, timedelta] | None): The time-to-live of the responses of each endpoint.
+            default_ttl (timedelta | None): The time-to-live of the responses of the other endpoints, if any.
+            clock (Callable[[], float]): A clock returning the current time in seconds since the epoch.
+        """
+        self._storage = storage
+        self._endpoint_ttls = dict(endpoint_ttls or {})
+        self._default_ttl = default_ttl
+        self._clock = clock
+        self.stats = CacheStats()
+
+    def lookup(self, method: str, endpoint: str, query_params: Mapping[str, object]) -> bytes | None:
+        """
+        Look up the body of a fresh cached response to a call.
+
+        Args:
+            method (str): The HTTP method of the call.
+            endpoint (str): The URL path of the called endpoint.
+            query_params (Mapping[str, object]): The query parameters of the call.
+
+        Returns:
+            bytes | None: The cached body, or None if the call is not cacheable or has no fresh cached response.
+        """
+        if self._ttl(method, endpoint) is None:
+            return None
+        cache_key = response_cache_key(method, endpoint, query_params)
+        cached_response = self._storage.get(cache_key)
+        if cached_response is not None and cached_response['expires_at'] <= self._clock():
+            self._storage.delete(cache_key)
+            cached_response = None
+        if cached_response is None:
+            self.stats.record_miss()
+            return None
+        self.stats.record_hit()
+        return cached_response['body'].encode()
+
+    def store(self, method: str, endpoint: str, query_params: Mapping[str, object], raw_body: bytes) -> None:
+        """
+        Cache the body of a successful response to a call, if the call is cacheable.
+
+        Args:
+            method (str): The HTTP method of the call.
+            endpoint (str): The URL path of the called endpoint.
+            query_params (Mapping[str, object]): The query parameters of the call.
+            raw_body (bytes): The body of the response.
+        """
+        ttl = self._ttl(method, endpoint)
+        if ttl is None:
+            return
+        expires_at = self._clock() + ttl.total_seconds()
+        cached_response = CachedResponse(body=raw_body.decode(), expires_at=expires_at)
+        self._storage.set(response_cache_key(method, endpoint, query_params), cached_response)
+
+    def _ttl(self, method: str, endpoint: str) -> timedelta | None:
+        if method not in _CACHEABLE_METHODS:
+            return None
+        return self._endpoint_ttls.get(endpoint, self._default_ttl)
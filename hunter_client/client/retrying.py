@@ -0,0 +1,164 @@
+"""
+This module provides the retry policy applied to transient failures of the Hunter API.
+
+When the API answers with a status code that signals a transient condition (rate limiting or an unavailable
+upstream), the request is sent again after a delay. The delay is taken from the `Retry-After` header if the API
+provides one, and otherwise grows exponentially with random jitter. Retries stop after a maximum number of attempts,
+once a total deadline would be exceeded, or when the API asks to wait longer than the backoff cap. Requests with
+non-idempotent methods are only retried on 429 responses, because those are rejected before any processing happens.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from typing import Callable, Mapping, Protocol
+
+_DEFAULT_RETRYABLE_STATUS_CODES = frozenset((
+    HTTPStatus.TOO_MANY_REQUESTS,
+    HTTPStatus.BAD_GATEWAY,
+    HTTPStatus.SERVICE_UNAVAILABLE,
+    HTTPStatus.GATEWAY_TIMEOUT,
+))
+_IDEMPOTENT_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'))
+_DEFAULT_BACKOFF_BASE = timedelta(seconds=0.5)
+_DEFAULT_BACKOFF_CAP = timedelta(seconds=30)  # noqa: WPS432
+
+
+class RetryableResponse(Protocol):
+    """The parts of an HTTP response (of either `requests` or `httpx`) that the retry policy looks at."""
+
+    @property
+    def status_code(self) -> int:
+        """The HTTP status code of the response."""
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """The HTTP headers of the response."""
+
+
+@dataclass
+class RetryStats(object):
+    """
+    Thread-safe counters describing the retries performed under a retry policy.
+
+    Attributes:
+        retries (int): The number of requests sent again after a transient failure.
+        waited_seconds (float): The total time spent waiting before retries.
+        exhausted (int): The number of transient failures given up on because of the attempt or time limits.
+    """
+
+    retries: int = 0
+    waited_seconds: float = 0
+    exhausted: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def record_retry(self, delay: float) -> None:
+        """Record a retry scheduled after the given delay."""
+        with self._lock:
+            self.retries += 1
+            self.waited_seconds += delay
+
+    def record_exhausted(self) -> None:
+        """Record a transient failure that is not retried anymore."""
+        with self._lock:
+            self.exhausted += 1
+
+
+class RetryPolicy(object):
+    """
+    Policy deciding whether and when a request that failed with a transient status code is sent again.
+
+    A single policy may be shared by several clients, threads and asynchronous tasks; its `stats` then aggregate the
+    retries of all of them.
+    """
+
+    def __init__(  # noqa: WPS211
+        self,
+        max_attempts: int = 4,
+        max_elapsed: timedelta | None = None,
+        backoff_base: timedelta = _DEFAULT_BACKOFF_BASE,
+        backoff_cap: timedelta = _DEFAULT_BACKOFF_CAP,
+        retryable_status_codes: frozenset[int] = _DEFAULT_RETRYABLE_STATUS_CODES,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialize the retry policy.
+
+        Args:
+            max_attempts (int): The maximum number of times a request is sent, including the first attempt.
+            max_elapsed (timedelta | None): The deadline for all attempts of a request, or None for no deadline.
+            backoff_base (timedelta): The upper bound of the delay before the first retry.
+            backoff_cap (timedelta): The upper bound of the delay before any retry, including a `Retry-After` one.
+            retryable_status_codes (frozenset[int]): The status codes considered to be transient failures.
+            clock (Callable[[], float]): A monotonic clock returning the current time in seconds.
+            sleep (Callable[[float], None]): The function used by blocking clients to wait before a retry.
+
+        Raises:
+            ValueError: If `max_attempts` is not a positive integer.
+        """
+        if max_attempts < 1:
+            raise ValueError('`max_attempts` must be a positive integer, got {0}.'.format(max_attempts))
+        self._max_attempts = max_attempts
+        self._max_elapsed = max_elapsed
+        self._backoff_base = backoff_base.total_seconds()
+        self._backoff_cap = backoff_cap.total_seconds()
+        self._retryable_status_codes = retryable_status_codes
+        self.clock = clock
+        self.sleep = sleep
+        self.stats = RetryStats()
+
+    def next_delay(self, method: str, response: RetryableResponse, attempt: int, started_at: float) -> float | None:
+        """
+        Decide whether a request should be sent again after receiving the given response.
+
+        Args:
+            method (str): The HTTP method of the request.
+            response (RetryableResponse): The response received for the last attempt.
+            attempt (int): The number of the last attempt, starting from 1.
+            started_at (float): The time of the first attempt, as returned by the policy's clock.
+
+        Returns:
+            float | None: The number of seconds to wait before the next attempt, or None if it should not be sent.
+        """
+        if not self._is_retryable(method, response.status_code):
+            return None
+        delay = self._retry_after(response)
+        if delay is None:
+            delay = self._jittered_backoff(attempt)
+        is_over_deadline = (
+            self._max_elapsed is not None
+            and self.clock() - started_at + delay > self._max_elapsed.total_seconds()
+        )
+        if attempt >= self._max_attempts or is_over_deadline or delay > self._backoff_cap:
+            self.stats.record_exhausted()
+            return None
+        self.stats.record_retry(delay)
+        return delay
+
+    def _is_retryable(self, method: str, status_code: int) -> bool:
+        if status_code not in self._retryable_status_codes:
+            return False
+        return method.upper() in _IDEMPOTENT_METHODS or status_code == HTTPStatus.TOO_MANY_REQUESTS
+
+    def _jittered_backoff(self, attempt: int) -> float:
+        backoff_bound = min(self._backoff_cap, self._backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, backoff_bound)  # noqa: S311
+
+    def _retry_after(self, response: RetryableResponse) -> float | None:
+        retry_after_header = response.headers.get('Retry-After')
+        if retry_after_header is None:
+            return None
+        if retry_after_header.strip().isdigit():
+            return float(retry_after_header)
+        try:
+            retry_at = parsedate_to_datetime(retry_after_header)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0, (retry_at - datetime.now(timezone.utc)).total_seconds())
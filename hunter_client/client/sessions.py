@@ -0,0 +1,78 @@
+"""
+This module provides helpers for managing the HTTP sessions used by `HunterClient` under concurrent load.
+
+A `requests.Session` keeps a pool of connections per host. By default the pool holds 10 connections and, when more
+threads send requests at once, the extra connections are opened and then discarded instead of being reused. The
+helpers defined here create sessions whose pool matches the expected number of concurrent workers, so that every
+connection is returned to the pool and reused. They also allow to give every thread its own session, which removes
+any contention on a shared session.
+"""
+
+import threading
+from typing import Callable
+from weakref import WeakSet
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def create_pooled_session(pool_size: int) -> requests.Session:
+    """
+    Create an HTTP session keeping up to `pool_size` connections to a host alive.
+
+    The session only talks to the Hunter API, so a single per-host pool is kept. Requests sent while all pooled
+    connections are busy still go through, but their connections are closed afterwards instead of being kept alive.
+
+    Args:
+        pool_size (int): The maximum number of connections kept per host, usually the number of worker threads.
+
+    Returns:
+        requests.Session: The HTTP session.
+    """
+    http_session = requests.Session()
+    http_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    http_session.mount('https://', http_adapter)
+    http_session.mount('http://', http_adapter)
+    return http_session
+
+
+class ThreadLocalSessions(object):
+    """
+    Lazily created HTTP sessions, one per thread that asks for a session.
+
+    The session of a thread is released together with the thread, so short-lived worker pools do not leak sessions.
+    """
+
+    def __init__(self, session_factory: Callable[[], requests.Session]) -> None:
+        """
+        Initialize the per-thread sessions.
+
+        Args:
+            session_factory (Callable[[], requests.Session]): The function creating the session of a new thread.
+        """
+        self._session_factory = session_factory
+        self._thread_local = threading.local()
+        self._created_sessions: WeakSet[requests.Session] = WeakSet()
+        self._lock = threading.Lock()
+
+    def get(self) -> requests.Session:
+        """
+        Return the session of the calling thread, creating it on first use.
+
+        Returns:
+            requests.Session: The HTTP session of the calling thread.
+        """
+        http_session = getattr(self._thread_local, 'http_session', None)
+        if http_session is None:
+            http_session = self._session_factory()
+            self._thread_local.http_session = http_session
+            with self._lock:
+                self._created_sessions.add(http_session)
+        return http_session
+
+    def close(self) -> None:
+        """Close the sessions of all threads."""
+        with self._lock:
+            for http_session in list(self._created_sessions):
+                http_session.close()
+            self._created_sessions.clear()
@@ -0,0 +1,205 @@
+"""
+This module provides an optional breakdown of the time every call of the Hunter API spends in each of its phases.
+
+A client given a `CallTimer` splits every call of an endpoint handler into the phases listed by `CallPhase`: waiting
+for the rate limiter, waiting for the API to answer, downloading the body, backing off before retries, and decoding or
+validating the body. The timings of every call are reported as a `CallTimings` record, and those of calls slower than
+a threshold are additionally reported as slow calls, which are logged by default.
+
+The stopwatch of the call in progress is kept in a context variable, so that concurrent calls made from different
+threads or asynchronous tasks are timed separately without threading the stopwatch through every handler method.
+"""
+
+import enum
+import logging
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, ContextManager, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+class CallPhase(enum.Enum):
+    """
+    The phases of a call of the Hunter API.
+
+    Attributes:
+        QUEUE: Formatting the request, waiting for the rate limiter and running the request hooks.
+        WAIT: Sending the request and waiting for the response headers, including connection setup.
+        DOWNLOAD: Receiving the response body.
+        RETRY_BACKOFF: Waiting before sending the request again after a transient failure.
+        DECODE: Decoding the JSON body into a dict.
+        VALIDATE: Validating the raw body into a response model.
+    """
+
+    QUEUE = 'queue'  # noqa: WPS115
+    WAIT = 'wait'  # noqa: WPS115
+    DOWNLOAD = 'download'  # noqa: WPS115
+    RETRY_BACKOFF = 'retry_backoff'  # noqa: WPS115
+    DECODE = 'decode'  # noqa: WPS115
+    VALIDATE = 'validate'  # noqa: WPS115
+
+
+@dataclass(frozen=True)
+class CallTimings(object):
+    """
+    The time a call of the Hunter API spent in each of its phases.
+
+    Attributes:
+        endpoint (str): The URL path of the called endpoint, e.g. `/email-verifier`.
+        method (str): The HTTP method of the call.
+        phases (dict[CallPhase, float]): The time spent in each phase the call went through, summed over retries.
+        total (float): The time the whole call took, in seconds.
+        error (str | None): The name of the exception the call failed with, or None if it succeeded.
+    """
+
+    endpoint: str
+    method: str
+    phases: dict[CallPhase, float]
+    total: float
+    error: str | None = None
+
+    def describe(self) -> str:
+        """
+        Describe the timings in a single line.
+
+        Returns:
+            str: The call, its total time and the time of each of its phases, e.g.
+                `GET /email-verifier took 1.204s (queue 0.001s, wait 1.150s, download 0.050s, validate 0.003s)`.
+        """
+        phase_times = ', '.join(
+            '{0} {1:.3f}s'.format(phase.value, phase_time) for phase, phase_time in self.phases.items()
+        )
+        outcome = '' if self.error is None else ' and failed with {0}'.format(self.error)
+        return '{0} {1} took {2:.3f}s{3} ({4})'.format(self.method, self.endpoint, self.total, outcome, phase_times)
+
+
+class _CallStopwatch(object):
+    def __init__(self, clock: Callable[[], float]) -> None:
+        self._clock = clock
+        self._started_at = clock()
+        self._lap_started_at = self._started_at
+        self._phases: dict[CallPhase, float] = {}
+
+    def lap(self, phase: CallPhase) -> None:
+        lap_started_at = self._lap_started_at
+        self._lap_started_at = self._clock()
+        lap_time = self._lap_started_at - lap_started_at
+        self._phases[phase] = self._phases.get(phase, 0) + lap_time
+
+    def stop(self, endpoint: str, method: str, error: str | None) -> CallTimings:
+        total = self._clock() - self._started_at
+        return CallTimings(endpoint, method, dict(self._phases), total, error)
+
+
+_current_stopwatch: ContextVar[_CallStopwatch | None] = ContextVar('_current_stopwatch', default=None)
+
+
+def is_call_timed() -> bool:
+    """
+    Tell whether the call in progress in the current thread or task is timed.
+
+    Returns:
+        bool: True if a `CallTimer` is timing the call in progress.
+    """
+    return _current_stopwatch.get() is not None
+
+
+def end_phase(phase: CallPhase) -> None:
+    """
+    Attribute the time elapsed since the end of the previous phase of the call in progress to the given phase.
+
+    Does nothing if the call in progress is not timed.
+
+    Args:
+        phase (CallPhase): The phase that has just ended.
+    """
+    stopwatch = _current_stopwatch.get()
+    if stopwatch is not None:
+        stopwatch.lap(phase)
+
+
+class CallTimer(object):
+    """
+    Timer of the phases of the calls of the Hunter API made by a client.
+
+    A single timer may be shared by several clients, threads and asynchronous tasks.
+    """
+
+    def __init__(
+        self,
+        on_call: Callable[[CallTimings], None] | None = None,
+        slow_call_threshold: float | None = None,
+        on_slow_call: Callable[[CallTimings], None] | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """
+        Initialize the timer.
+
+        Args:
+            on_call (Callable[[CallTimings], None] | None): The callback receiving the timings of every call, if any.
+            slow_call_threshold (float | None): The time in seconds from which a call is slow, or None for never.
+            on_slow_call (Callable[[CallTimings], None] | None): The callback receiving slow calls, or None to log them.
+            clock (Callable[[], float]): The clock measuring the phases, in seconds.
+        """
+        self.on_call = on_call
+        self.slow_call_threshold = slow_call_threshold
+        self.on_slow_call = on_slow_call or self._log_slow_call
+        self.clock = clock
+
+    @contextmanager
+    def time_call(self, endpoint: str, method: str) -> Iterator[None]:
+        """
+        Time the phases of a call and report them once the call is over, whether it succeeded or not.
+
+        Calls nested in a timed call, e.g. `make_request` called by `request_json`, are timed as part of it.
+
+        Args:
+            endpoint (str): The URL path of the called endpoint.
+            method (str): The HTTP method of the call.
+
+        Yields:
+            None: Once the stopwatch of the call is running.
+        """
+        if is_call_timed():
+            yield
+            return
+        stopwatch = _CallStopwatch(self.clock)
+        stopwatch_token = _current_stopwatch.set(stopwatch)
+        error = None
+        try:
+            yield
+        except Exception as exception:
+            error = type(exception).__name__
+            raise
+        finally:
+            _current_stopwatch.reset(stopwatch_token)
+            self._report(stopwatch.stop(endpoint, method, error))
+
+    def _report(self, timings: CallTimings) -> None:
+        if self.on_call is not None:
+            self.on_call(timings)
+        if self.slow_call_threshold is not None and timings.total >= self.slow_call_threshold:
+            self.on_slow_call(timings)
+
+    def _log_slow_call(self, timings: CallTimings) -> None:
+        logger.warning('Slow Hunter API call: {0}'.format(timings.describe()))
+
+
+def timed_call(call_timer: CallTimer | None, endpoint: str, method: str) -> ContextManager[None]:
+    """
+    Time the phases of a call with the given timer, if any.
+
+    Args:
+        call_timer (CallTimer | None): The timer of the calls of a client, or None if its calls are not timed.
+        endpoint (str): The URL path of the called endpoint.
+        method (str): The HTTP method of the call.
+
+    Returns:
+        ContextManager[None]: The context of the timed call.
+    """
+    if call_timer is None:
+        return nullcontext()
+    return call_timer.time_call(endpoint, method)
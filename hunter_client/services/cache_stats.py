@@ -0,0 +1,40 @@
+"""This module provides counters describing how effectively a service cache avoids calls to the Hunter.io API."""
+
+import threading
+from dataclasses import dataclass, field
+
+
+@dataclass
+class CacheStats(object):
+    """
+    Thread-safe hit and miss counters of a cache sitting in front of the Hunter.io API.
+
+    Attributes:
+        hits (int): The number of lookups answered from the cache without an API call.
+        misses (int): The number of lookups that had to fall through to the API.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    @property
+    def lookups(self) -> int:
+        """Return the total number of recorded lookups."""
+        return self.hits + self.misses
+
+    @property
+    def hit_ratio(self) -> float:
+        """Return the share of lookups answered from the cache, or 0.0 if nothing was looked up yet."""
+        lookups = self.lookups
+        return self.hits / lookups if lookups else 0
+
+    def record_hit(self) -> None:
+        """Record a lookup answered from the cache."""
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self) -> None:
+        """Record a lookup that had to fall through to the API."""
+        with self._lock:
+            self.misses += 1
@@ -0,0 +1,97 @@
+"""
+This module provides the canonicalization of email addresses, so that the variants of a mailbox share a single key.
+
+Addresses arrive with surrounding whitespace, upper case domains or internationalized domains, e.g.
+`John@Example.COM ` or `john@bücher.example`. The `EmailCanonicalizer` trims them, lowercases their domain and encodes
+it with IDNA. The local part is case-sensitive in general, so it is kept as is, unless a provider rule for the domain
+says otherwise: such rules may also drop the dots or the `+tag` suffix of the local part and map domain aliases to a
+single domain, e.g. `John.Doe+news@googlemail.com` to `johndoe@gmail.com`.
+"""
+
+from dataclasses import dataclass
+from typing import Iterable
+
+
+@dataclass(frozen=True)
+class ProviderRule(object):
+    """
+    The rules a mail provider applies to the local part of the addresses of its domains.
+
+    Attributes:
+        domains (frozenset[str]): The lowercase domains of the provider.
+        canonical_domain (str | None): The domain all the domains of the provider are mapped to, if any.
+        ignores_case (bool): Whether the provider treats the local part as case-insensitive.
+        ignores_dots (bool): Whether the provider ignores the dots in the local part.
+        subaddress_separator (str | None): The separator of the ignored suffix of the local part, if any.
+    """
+
+    domains: frozenset[str]
+    canonical_domain: str | None = None
+    ignores_case: bool = True
+    ignores_dots: bool = False
+    subaddress_separator: str | None = '+'
+
+    def canonical_local_part(self, local_part: str) -> str:
+        """
+        Return the canonical form of the local part of an address of the provider.
+
+        Args:
+            local_part (str): The local part, i.e. everything before the `@`.
+
+        Returns:
+            str: The local part with the ignored case, dots and suffix removed.
+        """
+        if self.subaddress_separator is not None:
+            local_part = local_part.split(self.subaddress_separator, 1)[0]
+        if self.ignores_dots:
+            local_part = local_part.replace('.', '')
+        return local_part.lower() if self.ignores_case else local_part
+
+
+GMAIL_RULE = ProviderRule(frozenset(('gmail.com', 'googlemail.com')), canonical_domain='gmail.com', ignores_dots=True)
+OUTLOOK_RULE = ProviderRule(frozenset(('outlook.com', 'hotmail.com', 'live.com')))
+DEFAULT_PROVIDER_RULES = (GMAIL_RULE, OUTLOOK_RULE)
+
+
+class EmailCanonicalizer(object):
+    """A canonicalizer of email addresses, with optional provider-specific rules."""
+
+    def __init__(self, provider_rules: Iterable[ProviderRule] = ()) -> None:
+        """
+        Initialize the canonicalizer.
+
+        Args:
+            provider_rules (Iterable[ProviderRule]): The rules of the providers to apply, e.g. `DEFAULT_PROVIDER_RULES`.
+        """
+        self._provider_rules = {domain: rule for rule in provider_rules for domain in rule.domains}
+
+    def canonicalize(self, email: str) -> str:
+        """
+        Return the canonical form of an email address.
+
+        Strings that are not addresses at all, e.g. without an `@`, are only trimmed, so that the API rejects them.
+
+        Args:
+            email (str): The email address.
+
+        Returns:
+            str: The canonical email address.
+        """
+        local_part, at_sign, domain = email.strip().rpartition('@')
+        if not at_sign or not local_part:
+            return email.strip()
+        domain = _ascii_domain(domain.lower().rstrip('.'))
+        provider_rule = self._provider_rules.get(domain)
+        if provider_rule is not None:
+            local_part = provider_rule.canonical_local_part(local_part)
+            domain = provider_rule.canonical_domain or domain
+        return '{0}@{1}'.format(local_part, domain)
+
+
+def _ascii_domain(domain: str) -> str:
+    if domain.isascii():
+        return domain
+    try:
+        return domain.encode('idna').decode('ascii')
+    except UnicodeError:
+        return domain
@@ -0,0 +1,129 @@
+"""
+This module provides an append-only journal of the items a batch run has completed, so that the run can be resumed.
+
+A batch run records the key of every item once its result is stored, one JSON line per item. When a run that crashed
+halfway is started again with the same journal, the completed items are loaded back in a single sequential read and
+skipped, as long as their result is still in the results storage, so that no API credits are spent on them twice.
+A line torn by the crash is discarded, since its item was not known to be completed.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from types import TracebackType
+
+
+class CheckpointJournal(object):  # noqa: WPS214
+    """
+    A thread-safe, append-only journal of completed items, kept in a JSON Lines file.
+
+    Attributes:
+        path (Path): The path to the journal file.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], sync_every: int = 100) -> None:
+        """
+        Open (and create if needed) the journal and load the items it lists as completed.
+
+        Args:
+            path (str | os.PathLike[str]): The path to the journal file.
+            sync_every (int): The number of records after which the journal is synced to the disk.
+
+        Raises:
+            ValueError: If `sync_every` is not a positive integer.
+        """
+        if sync_every < 1:
+            raise ValueError('`sync_every` must be a positive integer, got {0}.'.format(sync_every))
+        self.path = Path(path)
+        self._sync_every = sync_every
+        self._unsynced_records = 0
+        self._lock = threading.Lock()
+        self._completed_items = self._load_completed_items()
+        self._journal_file = self.path.open('a', encoding='utf-8')
+
+    def __enter__(self) -> 'CheckpointJournal':
+        """Enter the context of the journal."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit the context of the journal, syncing and closing it."""
+        self.close()
+
+    @property
+    def completed_count(self) -> int:
+        """Return the number of items completed so far, including the ones completed by earlier runs."""
+        with self._lock:
+            return len(self._completed_items)
+
+    def is_completed(self, item_key: str) -> bool:
+        """
+        Tell whether an item was completed, by this run or an earlier one.
+
+        Args:
+            item_key (str): The key of the item, e.g. an email or a domain.
+
+        Returns:
+            bool: Whether the journal lists the item as completed.
+        """
+        with self._lock:
+            return item_key in self._completed_items
+
+    def record_completed(self, item_key: str) -> None:
+        """
+        Record an item as completed. The result of the item must already be stored.
+
+        Args:
+            item_key (str): The key of the item, e.g. an email or a domain.
+        """
+        with self._lock:
+            if item_key in self._completed_items:
+                return
+            self._completed_items.add(item_key)
+            self._journal_file.write('{0}\n'.format(json.dumps(item_key)))
+            self._journal_file.flush()
+            self._unsynced_records += 1
+            if self._unsynced_records >= self._sync_every:
+                self._sync()
+
+    def close(self) -> None:
+        """Sync the journal to the disk and close it."""
+        with self._lock:
+            if not self._journal_file.closed:
+                self._sync()
+                self._journal_file.close()
+
+    def _sync(self) -> None:
+        os.fsync(self._journal_file.fileno())
+        self._unsynced_records = 0
+
+    def _load_completed_items(self) -> set[str]:
+        completed_items: set[str] = set()
+        if not self.path.exists():
+            return completed_items
+        valid_length = 0
+        with self.path.open('rb') as journal_file:
+            for raw_line in journal_file:
+                item_key = _parse_record(raw_line)
+                if item_key is None:
+                    break
+                completed_items.add(item_key)
+                valid_length += len(raw_line)
+        if valid_length < self.path.stat().st_size:
+            os.truncate(self.path, valid_length)
+        return completed_items
+
+
+def _parse_record(raw_line: bytes) -> str | None:
+    if not raw_line.endswith(b'\n'):
+        return None
+    try:
+        item_key = json.loads(raw_line)
+    except ValueError:
+        return None
+    return item_key if isinstance(item_key, str) else None
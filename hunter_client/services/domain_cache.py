@@ -0,0 +1,152 @@
+"""
+This module provides a cache of the domain-wide facts the Hunter.io API returns along with per-email results.
+
+Every `/email-verifier` response tells whether the domain of the email is disposable, a webmail, accepts all emails
+and has MX records, and every `/domain-search` response tells the same except for the MX records. The
+`DomainAttributesCache` keeps those facts per domain for a time-to-live, so that emails at a domain known to be
+disposable or to have no MX records are resolved as invalid locally, without spending an API call on each of them.
+"""
+
+import time
+from datetime import timedelta
+from typing import Callable, TypedDict
+
+from hunter_client.services.cache_stats import CacheStats
+from hunter_client.services.response_models.data import DomainSearcherResponseData, EmailVerifierResponseData
+from hunter_client.storages.interface import ResultsStorage
+
+_DEFAULT_DOMAIN_ATTRIBUTES_TTL = timedelta(days=1)
+
+
+class DomainAttributes(TypedDict):
+    """
+    The domain-wide facts learned from the Hunter.io API, as kept in the storage of a domain attributes cache.
+
+    The entry is a plain dictionary, so that it can be kept in any storage, including JSON-serializing ones. Facts
+    the API did not report are None.
+
+    Attributes:
+        disposable (bool | None): Whether the domain is a disposable email service.
+        webmail (bool | None): Whether the domain is a webmail service.
+        accept_all (bool | None): Whether the mail server of the domain accepts all emails.
+        mx_records (bool | None): Whether the domain has MX records.
+        expires_at (float): The time the entry expires at, in seconds since the epoch.
+    """
+
+    disposable: bool | None
+    webmail: bool | None
+    accept_all: bool | None
+    mx_records: bool | None
+    expires_at: float
+
+
+class DomainAttributesCache(object):
+    """
+    A cache of the domain-wide facts returned by the Hunter.io API, which resolves some emails without calling it.
+
+    Attributes:
+        stats (CacheStats): Lookups resolved from the domain facts (hits) and lookups that were not (misses).
+    """
+
+    def __init__(
+        self,
+        storage: ResultsStorage[str, DomainAttributes],
+        ttl: timedelta = _DEFAULT_DOMAIN_ATTRIBUTES_TTL,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            storage (ResultsStorage[str, DomainAttributes]): The storage of the domain facts, keyed by domain.
+            ttl (timedelta): The time the facts about a domain are trusted for.
+            clock (Callable[[], float]): A clock returning the current time in seconds since the epoch.
+        """
+        self._storage = storage
+        self._ttl = ttl.total_seconds()
+        self._clock = clock
+        self.stats = CacheStats()
+
+    def attributes(self, domain: str) -> DomainAttributes | None:
+        """
+        Return the unexpired facts known about a domain.
+
+        Args:
+            domain (str): The domain.
+
+        Returns:
+            DomainAttributes | None: The facts about the domain, or None if none are known.
+        """
+        domain_attributes = self._storage.get(domain.lower())
+        if domain_attributes is not None and domain_attributes['expires_at'] <= self._clock():
+            self._storage.delete(domain.lower())
+            return None
+        return domain_attributes
+
+    def local_verdict(self, domain: str) -> bool | None:
+        """
+        Resolve the validity of the emails at a domain from its facts alone, where they settle it.
+
+        Args:
+            domain (str): The domain of the emails.
+
+        Returns:
+            bool | None: False if the domain is known to be disposable or to have no MX records, otherwise None.
+        """
+        domain_attributes = self.attributes(domain)
+        if domain_attributes is None or not _rules_out_emails(domain_attributes):
+            self.stats.record_miss()
+            return None
+        self.stats.record_hit()
+        return False
+
+    def remember_verification(self, domain: str, verification_data: EmailVerifierResponseData) -> None:
+        """
+        Remember the domain facts returned along with the verification of an email at the domain.
+
+        Args:
+            domain (str): The domain of the verified email.
+            verification_data (EmailVerifierResponseData): The `data` part of the `/email-verifier` response.
+        """
+        self._remember(
+            domain,
+            disposable=verification_data.disposable,
+            webmail=verification_data.webmail,
+            accept_all=verification_data.accept_all,
+            mx_records=verification_data.mx_records,
+        )
+
+    def remember_domain_search(self, domain_search_data: DomainSearcherResponseData) -> None:
+        """
+        Remember the domain facts returned by a domain search. Known MX records facts are kept, as it has none.
+
+        Args:
+            domain_search_data (DomainSearcherResponseData): The `data` part of the `/domain-search` response.
+        """
+        self._remember(
+            domain_search_data.domain,
+            disposable=domain_search_data.disposable,
+            webmail=domain_search_data.webmail,
+            accept_all=domain_search_data.accept_all,
+            mx_records=None,
+        )
+
+    def _remember(self, domain: str, **reported_facts: bool | None) -> None:
+        known_attributes = self.attributes(domain)
+        domain_attributes = DomainAttributes(
+            disposable=None,
+            webmail=None,
+            accept_all=None,
+            mx_records=None,
+            expires_at=self._clock() + self._ttl,
+        )
+        for fact_name in ('disposable', 'webmail', 'accept_all', 'mx_records'):
+            reported_fact = reported_facts[fact_name]
+            if reported_fact is None and known_attributes is not None:
+                reported_fact = known_attributes[fact_name]
+            domain_attributes[fact_name] = reported_fact
+        self._storage.set(domain.lower(), domain_attributes)
+
+
+def _rules_out_emails(domain_attributes: DomainAttributes) -> bool:
+    return domain_attributes['disposable'] is True or domain_attributes['mx_records'] is False
@@ -0,0 +1,106 @@
+"""This module provides a domain harvesting service that collects the emails of domains from the Hunter.io API."""
+
+from typing import Iterable, Iterator
+
+import requests
+
+from hunter_client.client import HunterClient
+from hunter_client.services.checkpoints import CheckpointJournal
+from hunter_client.services.negative_cache import NegativeResultCache
+from hunter_client.storages.interface import ResultsStorage
+
+DomainHarvestResult = tuple[str, list[str]]
+
+
+class PersistentDomainHarvestingService(object):
+    """
+    A service that collects all the emails of domains using the Hunter.io API and stores them per domain.
+
+    Every domain is searched page by page, and its emails are stored once all of its pages are read. Bulk harvests
+    can keep a checkpoint journal, so that a run that crashed is resumed without searching the domains it completed
+    again.
+
+    Domains the API rejects with a client error, e.g. because they do not exist, can be remembered in a negative
+    cache, so that they fail fast with a `KnownBadInputError` until the rejection expires.
+    """
+
+    def __init__(  # noqa: WPS211
+        self,
+        hunter_api_key: str,
+        results_storage: ResultsStorage[str, list[str]],
+        hunter_client: HunterClient | None = None,
+        page_size: int = 100,
+        negative_cache: NegativeResultCache | None = None,
+    ) -> None:
+        """
+        Initialize the domain harvesting service.
+
+        Args:
+            hunter_api_key (str): The API key for accessing the Hunter.io API.
+            results_storage (ResultsStorage[str, list[str]]): Storage system for saving the emails of each domain.
+            hunter_client (HunterClient | None): A preconfigured client to use instead of a default one.
+            page_size (int): The number of emails requested per page of domain search results.
+            negative_cache (NegativeResultCache | None): The cache of recently rejected domains, if any.
+        """
+        self._hunter_client = hunter_client or HunterClient(api_key=hunter_api_key)
+        self._results_storage = results_storage
+        self._page_size = page_size
+        self._negative_cache = negative_cache
+
+    def harvest_and_store_domain_emails(self, domain: str) -> list[str]:
+        """
+        Collect all the emails of the given domain and store them.
+
+        With a negative cache, a domain recently rejected by the API fails without calling it again.
+
+        Args:
+            domain (str): The domain to collect the emails of.
+
+        Returns:
+            list[str]: The emails of the domain, in the order returned by the API.
+        """
+        if self._negative_cache is not None:
+            self._negative_cache.raise_if_known_bad(domain)
+        try:
+            domain_emails = self._search_domain_emails(domain)
+        except requests.HTTPError as error:
+            if self._negative_cache is not None:
+                self._negative_cache.remember_failure(domain, error)
+            raise
+        self._results_storage.set(domain, domain_emails)
+        return domain_emails
+
+    def harvest_many(
+        self,
+        domains: Iterable[str],
+        journal: CheckpointJournal | None = None,
+    ) -> Iterator[DomainHarvestResult]:
+        """
+        Collect and store the emails of the given domains, one domain at a time.
+
+        With a checkpoint journal, every harvested domain is recorded in it once its emails are stored, and domains
+        the journal lists as completed, e.g. by an earlier run that crashed, are answered from the results storage
+        without calling the API, unless their emails are no longer stored.
+
+        Args:
+            domains (Iterable[str]): The domains to collect the emails of.
+            journal (CheckpointJournal | None): The journal of the run, to resume it from, if any.
+
+        Yields:
+            DomainHarvestResult: The domain and its emails.
+        """
+        for domain in domains:
+            stored_emails = None
+            if journal is not None and journal.is_completed(domain):
+                stored_emails = self._results_storage.get(domain)
+            if stored_emails is None:
+                stored_emails = self.harvest_and_store_domain_emails(domain)
+                if journal is not None:
+                    journal.record_completed(domain)
+            yield domain, stored_emails
+
+    def _search_domain_emails(self, domain: str) -> list[str]:
+        return [
+            email.value
+            for email in self._hunter_client.domain_searcher.iterate_emails_by_domain(domain, self._page_size)
+        ]
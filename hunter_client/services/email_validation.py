@@ -1,41 +1,320 @@
 """This module provides an email validation service that integrates with the Hunter.io API."""
 
-from hunter_client.client import HunterClient
-from hunter_client.services.response_models import EmailVerifierResponse
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import Callable, Iterable, Iterator
+
+import requests
+
+from hunter_client.client import CallPriority, HunterClient, call_priority, current_priority
+from hunter_client.services.cache_stats import CacheStats
+from hunter_client.services.canonicalization import EmailCanonicalizer
+from hunter_client.services.checkpoints import CheckpointJournal
+from hunter_client.services.domain_cache import DomainAttributesCache
+from hunter_client.services.negative_cache import NegativeResultCache
 from hunter_client.storages.interface import ResultsStorage
 
+EmailValidationResult = tuple[str, bool]
+EmailValidationOutcome = tuple[str, bool | Exception]
+SubmitValidation = Callable[[str], Future[EmailValidationResult]]
+
 
-class PersistentEmailValidationService(object):
+class PersistentEmailValidationService(object):  # noqa: WPS214
     """
     A service that validates email addresses using the Hunter.io API and stores the validation results.
 
     This service provides an interface to validate emails for their validity against the Hunter.io API and
     automatically persists the results using a specified storage mechanism. It is designed to facilitate
     applications where tracking and caching of email validation results are required.
+
+    In read-through mode the storage is also consulted before calling the API, so that an email which already has a
+    stored verdict costs no API credits. Stored verdicts can be given a maximum age, in which case the time of every
+    verification is kept in a separate storage and verdicts older than that age are verified again.
+
+    Emails the API rejects with a client error, e.g. because they are malformed, can be remembered in a negative
+    cache, so that they fail fast with a `KnownBadInputError` until the rejection expires.
+
+    Bulk validations can keep a checkpoint journal, so that a run that crashed is resumed without validating the
+    emails it completed again.
+
+    With an email canonicalizer, every email is canonicalized before it is looked up, validated and stored, so that
+    the variants of a mailbox, e.g. `John@Example.COM ` and `John@example.com`, share a single stored verdict.
+
+    With a domain attributes cache, the domain-wide facts of every verification are remembered, and emails at a
+    domain known to be disposable or to have no MX records are stored as invalid without calling the API.
     """
 
-    def __init__(self, hunter_api_key: str, results_storage: ResultsStorage[str, bool]) -> None:
+    _in_flight_validations_per_worker = 2
+    _deduplicated_validations_per_worker = 32
+
+    def __init__(  # noqa: WPS211
+        self,
+        hunter_api_key: str,
+        results_storage: ResultsStorage[str, bool],
+        read_through: bool = False,
+        max_result_age: timedelta | None = None,
+        verification_times_storage: ResultsStorage[str, datetime] | None = None,
+        hunter_client: HunterClient | None = None,
+        negative_cache: NegativeResultCache | None = None,
+        canonicalizer: EmailCanonicalizer | None = None,
+        domain_cache: DomainAttributesCache | None = None,
+    ) -> None:
         """
         Initialize the email validation service.
 
         Args:
             hunter_api_key (str): The API key for accessing the Hunter.io API.
             results_storage (ResultsStorage[str, bool]): Storage system for saving validation results.
+            read_through (bool): Whether to answer from `results_storage` before calling the API.
+            max_result_age (timedelta | None): The age after which a stored verdict goes stale, or None for never.
+            verification_times_storage (ResultsStorage[str, datetime] | None): Storage for verification times.
+            hunter_client (HunterClient | None): A preconfigured client to use instead of a default one.
+            negative_cache (NegativeResultCache | None): The cache of recently rejected emails, if any.
+            canonicalizer (EmailCanonicalizer | None): The canonicalizer of the emails, or None to use them as given.
+            domain_cache (DomainAttributesCache | None): The cache of the facts about the domains of emails, if any.
+
+        Raises:
+            ValueError: If `max_result_age` is given without `verification_times_storage`.
         """
-        self._hunter_client = HunterClient(api_key=hunter_api_key)
+        if max_result_age is not None and verification_times_storage is None:
+            raise ValueError('`verification_times_storage` is required to enforce `max_result_age`.')
+        self._hunter_client = hunter_client or HunterClient(api_key=hunter_api_key)
         self._results_storage = results_storage
+        self._read_through = read_through
+        self._max_result_age = max_result_age
+        self._verification_times_storage = verification_times_storage
+        self._negative_cache = negative_cache
+        self._canonicalizer = canonicalizer
+        self._domain_cache = domain_cache
+        self.cache_stats = CacheStats()
 
-    def validate_and_store_email_status(self, email: str) -> bool:
+    def validate_and_store_email_status(self, email: str, force_refresh: bool = False) -> bool:
         """
         Validate the given email and store the result.
 
+        In read-through mode a fresh stored verdict is returned without calling the API, unless `force_refresh`
+        is set. Forced refreshes are not counted in `cache_stats`. With a negative cache, an email recently rejected
+        by the API fails without calling it again, unless `force_refresh` is set. So does an email at a domain the
+        domain attributes cache rules out, which is stored as invalid.
+
         Args:
             email (str): The email address to validate.
+            force_refresh (bool): Whether to call the API even if a fresh verdict is stored.
 
         Returns:
             bool: Whether the email address is valid or not.
         """
-        email_verifier_raw_response = self._hunter_client.email_verifier.check_if_email_is_valid(email)
-        email_verifier_response = EmailVerifierResponse.model_validate(email_verifier_raw_response)
-        self._results_storage.set(email, email_verifier_response.is_valid)
+        canonical_email = self._canonical_email(email)
+        if self._negative_cache is not None and not force_refresh:
+            self._negative_cache.raise_if_known_bad(canonical_email)
+        if self._read_through and not force_refresh:
+            stored_status = self._fresh_stored_status(canonical_email)
+            if stored_status is not None:
+                self.cache_stats.record_hit()
+                return stored_status
+            self.cache_stats.record_miss()
+        is_valid = None if force_refresh else self._local_verdict(canonical_email)
+        if is_valid is None:
+            is_valid = self._verify_email(canonical_email)
+        self._results_storage.set(canonical_email, is_valid)
+        if self._verification_times_storage is not None:
+            self._verification_times_storage.set(canonical_email, datetime.now(timezone.utc))
+        return is_valid
+
+    def validate_many(  # noqa: WPS211
+        self,
+        emails: Iterable[str],
+        max_concurrency: int = 8,
+        ordered: bool = True,
+        force_refresh: bool = False,
+        journal: CheckpointJournal | None = None,
+        fail_fast: bool = False,
+    ) -> Iterator[EmailValidationOutcome]:
+        """
+        Validate the given emails concurrently and store the results.
+
+        The emails are consumed lazily and only a bounded number of validations is in flight at any moment, so
+        the input may be an arbitrarily long stream. Each verdict is written to the results storage as soon as it
+        is known, exactly as `validate_and_store_email_status` does. The worker threads make their calls with the
+        priority of the `call_priority` context the iterator is consumed in.
+
+        A failed validation, e.g. of a malformed email the API rejects, is yielded with its exception in place of
+        the verdict, so that one bad email does not stop the others. With `fail_fast`, the exception is raised from
+        the returned iterator instead, and the remaining pending validations are cancelled.
+
+        Duplicate emails, or emails with the same canonical form, share the validation of their last occurrence
+        among the most recent unique emails of the call, whose number is bounded by `max_concurrency`, so that memory
+        stays constant however long the stream is. Canonical emails are the ones stored and recorded in the journal,
+        while the yielded results keep the emails as given.
+
+        With a checkpoint journal, every validated email is recorded in it once its verdict is stored, and emails
+        the journal lists as completed, e.g. by an earlier run that crashed, are answered from the results storage
+        without calling the API, even with `force_refresh`, unless their verdict is no longer stored.
+
+        Args:
+            emails (Iterable[str]): The email addresses to validate.
+            max_concurrency (int): The maximum number of worker threads talking to the Hunter.io API.
+            ordered (bool): Whether to yield the results in the order of the input emails, or as they complete.
+            force_refresh (bool): Whether to call the API even for emails with a fresh stored verdict.
+            journal (CheckpointJournal | None): The journal of the run, to resume it from, if any.
+            fail_fast (bool): Whether to stop at the first failed validation instead of yielding its exception.
+
+        Yields:
+            EmailValidationOutcome: The email address and whether it is valid or not, or why it failed validation.
+        """
+        if max_concurrency < 1:
+            raise ValueError('`max_concurrency` must be a positive integer, got {0}.'.format(max_concurrency))
+        max_in_flight = max_concurrency * self._in_flight_validations_per_worker
+        executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix='email-validation')
+        submit_validation = _DeduplicatingSubmitter(
+            partial(self._submit_validation, executor, force_refresh=force_refresh, journal=journal),
+            self._canonical_email,
+            max_concurrency * self._deduplicated_validations_per_worker,
+            fail_fast,
+        )
+        try:  # noqa: WPS501
+            if ordered:
+                yield from self._validate_in_order(submit_validation, iter(emails), max_in_flight)
+            else:
+                yield from self._validate_as_completed(submit_validation, iter(emails), max_in_flight)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _canonical_email(self, email: str) -> str:
+        return email if self._canonicalizer is None else self._canonicalizer.canonicalize(email)
+
+    def _local_verdict(self, email: str) -> bool | None:
+        if self._domain_cache is None:
+            return None
+        return self._domain_cache.local_verdict(_domain_of(email))
+
+    def _verify_email(self, email: str) -> bool:
+        try:
+            email_verifier_response = self._hunter_client.email_verifier.verify_email(email)
+        except requests.HTTPError as error:
+            if self._negative_cache is not None:
+                self._negative_cache.remember_failure(email, error)
+            raise
+        if self._domain_cache is not None:
+            self._domain_cache.remember_verification(_domain_of(email), email_verifier_response.data)
         return email_verifier_response.is_valid
+
+    def _fresh_stored_status(self, email: str) -> bool | None:
+        stored_status = self._results_storage.get(email)
+        if stored_status is None or self._max_result_age is None or self._verification_times_storage is None:
+            return stored_status
+        verified_at = self._verification_times_storage.get(email)
+        if verified_at is None:
+            return None
+        is_fresh = datetime.now(timezone.utc) - verified_at <= self._max_result_age
+        return stored_status if is_fresh else None
+
+    def _submit_validation(
+        self,
+        executor: ThreadPoolExecutor,
+        email: str,
+        force_refresh: bool,
+        journal: CheckpointJournal | None,
+    ) -> Future[EmailValidationResult]:
+        stored_status = None
+        if journal is not None and journal.is_completed(email):
+            stored_status = self._results_storage.get(email)
+        if stored_status is None:
+            return executor.submit(self._validate_and_checkpoint, current_priority(), email, force_refresh, journal)
+        completed_validation: Future[EmailValidationResult] = Future()
+        completed_validation.set_result((email, stored_status))
+        return completed_validation
+
+    def _validate_and_checkpoint(
+        self,
+        priority: CallPriority,
+        email: str,
+        force_refresh: bool,
+        journal: CheckpointJournal | None,
+    ) -> EmailValidationResult:
+        with call_priority(priority):
+            is_valid = self.validate_and_store_email_status(email, force_refresh)
+        if journal is not None:
+            journal.record_completed(email)
+        return email, is_valid
+
+    def _validate_in_order(
+        self,
+        submit_validation: '_DeduplicatingSubmitter',
+        emails: Iterator[str],
+        max_in_flight: int,
+    ) -> Iterator[EmailValidationOutcome]:
+        in_flight: deque[Future[EmailValidationOutcome]] = deque()
+        for email in emails:
+            in_flight.append(submit_validation(email))
+            if len(in_flight) >= max_in_flight:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+    def _validate_as_completed(
+        self,
+        submit_validation: '_DeduplicatingSubmitter',
+        emails: Iterator[str],
+        max_in_flight: int,
+    ) -> Iterator[EmailValidationOutcome]:
+        in_flight: set[Future[EmailValidationOutcome]] = set()
+        for email in emails:
+            in_flight.add(submit_validation(email))
+            if len(in_flight) >= max_in_flight:
+                completed, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                yield from (future.result() for future in completed)
+        yield from (future.result() for future in wait(in_flight).done)
+
+
+class _DeduplicatingSubmitter(object):
+    def __init__(
+        self,
+        submit_validation: SubmitValidation,
+        canonicalize: Callable[[str], str],
+        max_remembered: int,
+        fail_fast: bool,
+    ) -> None:
+        self._submit_validation = submit_validation
+        self._canonicalize = canonicalize
+        self._max_remembered = max_remembered
+        self._fail_fast = fail_fast
+        self._submitted: OrderedDict[str, Future[EmailValidationResult]] = OrderedDict()
+
+    def __call__(self, email: str) -> Future[EmailValidationOutcome]:
+        canonical_email = self._canonicalize(email)
+        shared_validation = self._submitted.get(canonical_email)
+        if shared_validation is None:
+            shared_validation = self._submit_validation(canonical_email)
+            self._submitted[canonical_email] = shared_validation
+            if len(self._submitted) > self._max_remembered:
+                self._submitted.popitem(last=False)
+        else:
+            self._submitted.move_to_end(canonical_email)
+        validation: Future[EmailValidationOutcome] = Future()
+        shared_validation.add_done_callback(partial(_relabel_result, email, validation, self._fail_fast))
+        return validation
+
+
+def _relabel_result(
+    email: str,
+    validation: Future[EmailValidationOutcome],
+    fail_fast: bool,
+    shared_validation: Future[EmailValidationResult],
+) -> None:
+    if shared_validation.cancelled():
+        validation.cancel()
+        return
+    validation_error = shared_validation.exception()
+    if validation_error is None:
+        validation.set_result((email, shared_validation.result()[1]))
+    elif fail_fast or not isinstance(validation_error, Exception):
+        validation.set_exception(validation_error)
+    else:
+        validation.set_result((email, validation_error))
+
+
+def _domain_of(email: str) -> str:
+    return email.rpartition('@')[2]
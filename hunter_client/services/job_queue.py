@@ -0,0 +1,233 @@
+"""
+This module provides an in-process queue of email validation jobs, served by a pool of worker threads.
+
+Jobs are submitted in one of two classes. Interactive jobs, e.g. validations requested by a user waiting for the
+verdict, are always taken before batch jobs, and a number of workers only ever take interactive jobs, so that they
+stay fast while bulk validations soak up the remaining capacity. Each class has a bounded queue of its own: once it
+is full, submitting another job of that class blocks until a worker takes a queued job, which slows down producers
+of bulk work instead of letting the queue grow without limit. Every submitted job is represented by a future.
+
+The jobs of each class are made with a call priority of their own, so that a credit tracker of the client of the
+service keeps credits for interactive validations once its budgets run low.
+"""
+
+import enum
+import threading
+from collections import deque
+from concurrent.futures import Future
+from types import MappingProxyType
+from typing import Mapping, NamedTuple
+
+from hunter_client.client.credits import CallPriority, call_priority
+from hunter_client.services.email_validation import PersistentEmailValidationService
+
+
+class JobClass(enum.Enum):
+    """
+    The class of an email validation job.
+
+    Attributes:
+        INTERACTIVE: Jobs someone is waiting for, taken before any batch job.
+        BATCH: Bulk jobs, taken when no interactive job is queued.
+    """
+
+    INTERACTIVE = 'interactive'  # noqa: WPS115
+    BATCH = 'batch'  # noqa: WPS115
+
+
+JOB_CALL_PRIORITIES: Mapping[JobClass, CallPriority] = MappingProxyType({
+    JobClass.INTERACTIVE: CallPriority.HIGH,
+    JobClass.BATCH: CallPriority.LOW,
+})
+
+
+class QueueFullError(Exception):
+    """
+    Raised when a job cannot be queued because the queue of its class stays full for longer than allowed.
+
+    Attributes:
+        job_class (JobClass): The class of the job.
+    """
+
+    def __init__(self, job_class: JobClass) -> None:
+        """
+        Initialize the error.
+
+        Args:
+            job_class (JobClass): The class of the job.
+        """
+        super().__init__('The queue of {0} validation jobs is full.'.format(job_class.value))
+        self.job_class = job_class
+
+
+class _QueuedJob(NamedTuple):
+    email: str
+    job_class: JobClass
+    force_refresh: bool
+    future: 'Future[bool]'
+
+
+class ValidationJobQueue(object):  # noqa: WPS214
+    """
+    A bounded priority queue of email validation jobs, served by a pool of worker threads.
+
+    The queue starts its workers when created and must be shut down, either explicitly or by using it as a context
+    manager, to stop them.
+    """
+
+    def __init__(  # noqa: WPS211
+        self,
+        service: PersistentEmailValidationService,
+        workers: int = 8,
+        interactive_workers: int = 1,
+        max_queued_interactive: int = 100,
+        max_queued_batch: int = 1000,
+    ) -> None:
+        """
+        Initialize the queue and start its workers.
+
+        Args:
+            service (PersistentEmailValidationService): The service validating and storing the emails.
+            workers (int): The total number of worker threads.
+            interactive_workers (int): The number of the workers that only ever take interactive jobs.
+            max_queued_interactive (int): The maximum number of interactive jobs waiting for a worker.
+            max_queued_batch (int): The maximum number of batch jobs waiting for a worker.
+
+        Raises:
+            ValueError: If there are no workers left for batch jobs, or a queue has no room at all.
+        """
+        if interactive_workers < 0 or interactive_workers >= workers:
+            raise ValueError(
+                '`interactive_workers` must leave workers for batch jobs, got {0} of {1}.'.format(
+                    interactive_workers,
+                    workers,
+                ),
+            )
+        if max_queued_interactive < 1 or max_queued_batch < 1:
+            raise ValueError('Every queue must have room for at least one job.')
+        self._service = service
+        self._capacities = {JobClass.INTERACTIVE: max_queued_interactive, JobClass.BATCH: max_queued_batch}
+        self._queued: dict[JobClass, deque[_QueuedJob]] = {job_class: deque() for job_class in JobClass}
+        self._condition = threading.Condition()
+        self._is_shut_down = False
+        self._workers = [
+            threading.Thread(
+                target=self._work,
+                args=((JobClass.INTERACTIVE,) if worker_index < interactive_workers else tuple(JobClass),),
+                name='validation-job-worker-{0}'.format(worker_index),
+                daemon=True,
+            )
+            for worker_index in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def __enter__(self) -> 'ValidationJobQueue':
+        """Return the queue itself."""
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        """Shut the queue down once its queued jobs are done."""
+        self.shutdown()
+
+    def submit(
+        self,
+        email: str,
+        job_class: JobClass = JobClass.BATCH,
+        force_refresh: bool = False,
+        timeout: float | None = None,
+    ) -> 'Future[bool]':
+        """
+        Queue the validation of an email, waiting for room in the queue of its class if it is full.
+
+        Args:
+            email (str): The email address to validate.
+            job_class (JobClass): The class of the job.
+            force_refresh (bool): Whether to call the API even if a fresh verdict is stored.
+            timeout (float | None): The number of seconds to wait for room in the queue, or None to wait forever.
+
+        Returns:
+            Future[bool]: The future of whether the email address is valid or not.
+
+        Raises:
+            QueueFullError: If the queue of the class stays full for longer than `timeout`.
+            RuntimeError: If the queue is shut down.
+        """
+        queued_job = _QueuedJob(email, job_class, force_refresh, Future())
+        with self._condition:
+            has_room = self._condition.wait_for(lambda: self._accepts(job_class), timeout)
+            if self._is_shut_down:
+                raise RuntimeError('Cannot submit validation jobs to a shut down queue.')
+            if not has_room:
+                raise QueueFullError(job_class)
+            self._queued[job_class].append(queued_job)
+            self._condition.notify_all()
+        return queued_job.future
+
+    def queued_jobs(self, job_class: JobClass) -> int:
+        """
+        Return the number of jobs of a class waiting for a worker.
+
+        Args:
+            job_class (JobClass): The class of the jobs.
+
+        Returns:
+            int: The number of queued jobs.
+        """
+        with self._condition:
+            return len(self._queued[job_class])
+
+    def shutdown(self, wait: bool = True, cancel_queued: bool = False) -> None:
+        """
+        Stop accepting jobs and stop the workers once the queued jobs are done.
+
+        Args:
+            wait (bool): Whether to block until the workers have stopped.
+            cancel_queued (bool): Whether to cancel the queued jobs instead of running them.
+        """
+        with self._condition:
+            self._is_shut_down = True
+            if cancel_queued:
+                self._cancel_queued_jobs()
+            self._condition.notify_all()
+        if wait:
+            for worker in self._workers:
+                worker.join()
+
+    def _accepts(self, job_class: JobClass) -> bool:
+        queue_length = len(self._queued[job_class])
+        return self._is_shut_down or queue_length < self._capacities[job_class]
+
+    def _serves(self, served_classes: tuple[JobClass, ...]) -> bool:
+        return self._is_shut_down or any(self._queued[job_class] for job_class in served_classes)
+
+    def _cancel_queued_jobs(self) -> None:
+        for queued_jobs in self._queued.values():
+            for queued_job in queued_jobs:
+                queued_job.future.cancel()
+            queued_jobs.clear()
+
+    def _work(self, served_classes: tuple[JobClass, ...]) -> None:
+        queued_job = self._next_job(served_classes)
+        while queued_job is not None:
+            if queued_job.future.set_running_or_notify_cancel():
+                self._run(queued_job)
+            queued_job = self._next_job(served_classes)
+
+    def _next_job(self, served_classes: tuple[JobClass, ...]) -> _QueuedJob | None:
+        with self._condition:
+            self._condition.wait_for(lambda: self._serves(served_classes))
+            for job_class in served_classes:
+                if self._queued[job_class]:
+                    self._condition.notify_all()
+                    return self._queued[job_class].popleft()
+        return None
+
+    def _run(self, queued_job: _QueuedJob) -> None:
+        try:
+            with call_priority(JOB_CALL_PRIORITIES[queued_job.job_class]):
+                is_valid = self._service.validate_and_store_email_status(queued_job.email, queued_job.force_refresh)
+        except Exception as validation_error:
+            queued_job.future.set_exception(validation_error)
+        else:
+            queued_job.future.set_result(is_valid)
@@ -0,0 +1,133 @@
+"""
+This module provides a cache of the inputs the Hunter.io API recently rejected with a client error.
+
+Inputs such as malformed emails or nonexistent domains are answered by the API with a 4xx status code, which does not
+change on a retry. The `NegativeResultCache` remembers those rejections for a short time-to-live in a storage of its
+own, separate from the storage of positive verdicts, so that a known-bad input fails immediately with a
+`KnownBadInputError` instead of costing another API call. Client errors caused by the account rather than by the
+input, such as a missing API key or an exhausted quota, are never cached.
+"""
+
+import time
+from datetime import timedelta
+from http import HTTPStatus
+from typing import Callable, TypedDict
+
+import requests
+
+from hunter_client.services.cache_stats import CacheStats
+from hunter_client.storages.interface import ResultsStorage
+
+NEGATIVELY_CACHED_STATUS_CODES = frozenset((
+    HTTPStatus.BAD_REQUEST,
+    HTTPStatus.NOT_FOUND,
+    HTTPStatus.UNPROCESSABLE_ENTITY,
+    HTTPStatus.UNAVAILABLE_FOR_LEGAL_REASONS,
+))
+_DEFAULT_NEGATIVE_RESULT_TTL = timedelta(hours=1)
+
+
+class NegativeResult(TypedDict):
+    """
+    A client error the Hunter.io API answered an input with, as kept in the storage of a negative cache.
+
+    The entry is a plain dictionary, so that it can be kept in any storage, including JSON-serializing ones.
+
+    Attributes:
+        status_code (int): The status code of the rejected request.
+        expires_at (float): The time the entry expires at, in seconds since the epoch.
+    """
+
+    status_code: int
+    expires_at: float
+
+
+class KnownBadInputError(requests.HTTPError):
+    """
+    Raised instead of calling the Hunter.io API for an input it recently rejected with a client error.
+
+    It subclasses `requests.HTTPError`, so code handling the original rejection handles the cached one as well.
+
+    Attributes:
+        key (str): The rejected input.
+        status_code (int): The status code the input was rejected with.
+    """
+
+    def __init__(self, key: str, status_code: int) -> None:
+        """
+        Initialize the error.
+
+        Args:
+            key (str): The rejected input.
+            status_code (int): The status code the input was rejected with.
+        """
+        super().__init__('{0} was recently rejected by the Hunter API with status {1}.'.format(key, status_code))
+        self.key = key
+        self.status_code = status_code
+
+
+class NegativeResultCache(object):
+    """
+    A cache of the inputs recently rejected by the Hunter.io API with a client error.
+
+    Attributes:
+        stats (CacheStats): Lookups that found a rejection (hits) and lookups that did not (misses).
+    """
+
+    def __init__(
+        self,
+        storage: ResultsStorage[str, NegativeResult],
+        ttl: timedelta = _DEFAULT_NEGATIVE_RESULT_TTL,
+        cached_status_codes: frozenset[int] = NEGATIVELY_CACHED_STATUS_CODES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            storage (ResultsStorage[str, NegativeResult]): The storage of the rejections, separate from verdicts.
+            ttl (timedelta): The time a rejection is remembered for.
+            cached_status_codes (frozenset[int]): The status codes of the rejections worth remembering.
+            clock (Callable[[], float]): A clock returning the current time in seconds since the epoch.
+        """
+        self._storage = storage
+        self._ttl = ttl.total_seconds()
+        self._cached_status_codes = cached_status_codes
+        self._clock = clock
+        self.stats = CacheStats()
+
+    def raise_if_known_bad(self, key: str) -> None:
+        """
+        Fail fast for an input that was recently rejected.
+
+        Args:
+            key (str): The input about to be sent to the API.
+
+        Raises:
+            KnownBadInputError: If the input was rejected less than the time-to-live ago.
+        """
+        negative_result = self._storage.get(key)
+        if negative_result is not None and negative_result['expires_at'] <= self._clock():
+            self._storage.delete(key)
+            negative_result = None
+        if negative_result is None:
+            self.stats.record_miss()
+            return
+        self.stats.record_hit()
+        raise KnownBadInputError(key, negative_result['status_code'])
+
+    def remember_failure(self, key: str, error: requests.HTTPError) -> None:
+        """
+        Remember the rejection of an input, if it was caused by the input itself.
+
+        Args:
+            key (str): The input sent to the API.
+            error (requests.HTTPError): The error the request for the input failed with.
+        """
+        if error.response is None or error.response.status_code not in self._cached_status_codes:
+            return
+        negative_result = NegativeResult(
+            status_code=error.response.status_code,
+            expires_at=self._clock() + self._ttl,
+        )
+        self._storage.set(key, negative_result)
@@ -2,7 +2,9 @@
 
 from datetime import date
 
-from pydantic import BaseModel, EmailStr, HttpUrl
+from pydantic import BaseModel, HttpUrl
+
+from hunter_client.services.response_models.validation import TrustableEmailStr
 
 
 class InformationSource(BaseModel):
@@ -25,7 +27,7 @@ class EmailVerificationInfo(BaseModel):
 class EmailInfo(BaseModel):
     """Represents detailed information about an email address as it is declared in the Hunter API."""
 
-    value: EmailStr  # noqa: WPS110
+    value: TrustableEmailStr  # noqa: WPS110
     type: str | None
     confidence: int | None
     sources: list[InformationSource]
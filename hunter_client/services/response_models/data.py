@@ -1,6 +1,6 @@
 """This module defines models that represent the `data` part of the response bodies returned by the Hunter API."""
 
-from pydantic import BaseModel, EmailStr, HttpUrl
+from pydantic import BaseModel, HttpUrl
 
 from hunter_client.services.response_models.components import (
     EmailCountsPerDepartmentData,
@@ -9,6 +9,7 @@ from hunter_client.services.response_models.components import (
     EmailVerificationInfo,
     InformationSource,
 )
+from hunter_client.services.response_models.validation import TrustableEmailStr
 
 
 class DomainSearcherResponseData(BaseModel):
@@ -42,7 +43,7 @@ class DomainAndNameSearcherResponseData(BaseModel):
 
     first_name: str | None
     last_name: str | None
-    email: EmailStr | None
+    email: TrustableEmailStr | None
     score: int | None
     domain: str
     accept_all: bool | None
@@ -61,7 +62,7 @@ class EmailVerifierResponseData(BaseModel):
     status: str
     result: str  # noqa: WPS110
     score: int | None
-    email: EmailStr
+    email: TrustableEmailStr
     regexp: bool | None
     gibberish: bool | None
     disposable: bool | None
@@ -1,6 +1,8 @@
 """This module defines models that represent the `params` part of the models defined in `meta.py`."""
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel
+
+from hunter_client.services.response_models.validation import TrustableEmailStr
 
 
 class DomainSearcherResponseMetaInfoParams(BaseModel):
@@ -27,7 +29,7 @@ class DomainAndNameSearcherResponseMetaInfoParams(BaseModel):
 class EmailVerifierResponseMetaInfoParams(BaseModel):
     """Represents the `meta.params` part of a response from the `/email-verifier` Hunter API endpoint."""
 
-    email: EmailStr
+    email: TrustableEmailStr
 
 
 class EmailCounterResponseMetaInfoParams(BaseModel):
@@ -0,0 +1,88 @@
+"""
+This module defines compact records representing parts of the responses returned by the Hunter API.
+
+The records are slotted dataclasses built straight from decoded JSON without any validation. They are used by the
+raw validation level, where a domain may list thousands of emails and the memory and CPU cost of full pydantic
+models matter more than type coercion. Dates are kept as the ISO-formatted strings returned by the API.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class SourceRecord(object):
+    """Compact counterpart of `InformationSource`."""
+
+    domain: str
+    uri: str
+    extracted_on: str
+    last_seen_on: str
+    still_on_page: bool
+
+    @classmethod
+    def from_json(cls, source_json: dict) -> 'SourceRecord':
+        """
+        Build the record from a decoded entry of a `sources` list.
+
+        Args:
+            source_json (dict): The decoded source.
+
+        Returns:
+            SourceRecord: The record.
+        """
+        return cls(
+            domain=source_json['domain'],
+            uri=source_json['uri'],
+            extracted_on=source_json['extracted_on'],
+            last_seen_on=source_json['last_seen_on'],
+            still_on_page=source_json['still_on_page'],
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class EmailRecord(object):  # noqa: WPS230
+    """Compact counterpart of `EmailInfo`, with the verification information flattened into it."""
+
+    value: str  # noqa: WPS110
+    type: str | None
+    confidence: int | None
+    sources: tuple[SourceRecord, ...]
+    first_name: str | None
+    last_name: str | None
+    position: str | None
+    seniority: str | None
+    department: str | None
+    linkedin: str | None
+    twitter: str | None
+    phone_number: str | None
+    verification_date: str | None
+    verification_status: str | None
+
+    @classmethod
+    def from_json(cls, email_json: dict) -> 'EmailRecord':
+        """
+        Build the record from a decoded entry of the `data.emails` list of a `/domain-search` response.
+
+        Args:
+            email_json (dict): The decoded email.
+
+        Returns:
+            EmailRecord: The record.
+        """
+        verification_json = email_json['verification']
+        return cls(
+            value=email_json['value'],
+            type=email_json['type'],
+            confidence=email_json['confidence'],
+            sources=tuple(SourceRecord.from_json(source_json) for source_json in email_json['sources']),
+            first_name=email_json['first_name'],
+            last_name=email_json['last_name'],
+            position=email_json['position'],
+            seniority=email_json['seniority'],
+            department=email_json['department'],
+            linkedin=email_json['linkedin'],
+            twitter=email_json['twitter'],
+            phone_number=email_json['phone_number'],
+            verification_date=verification_json['date'],
+            verification_status=verification_json['status'],
+        )
@@ -0,0 +1,55 @@
+"""
+This module defines how deeply the responses of the Hunter API are validated.
+
+Full validation of large responses is dominated by the validation of email addresses, which runs a complete syntax
+and internationalized domain name check for every address. Responses coming straight from the Hunter API can be
+trusted to contain well-formed addresses, so the trusted level skips that check and keeps the addresses as they were
+returned. The raw level skips pydantic altogether and is used where responses are turned into compact records.
+"""
+
+from enum import Enum
+from typing import Annotated
+
+from pydantic import AfterValidator, ValidationInfo
+from pydantic.networks import validate_email
+
+_TRUSTED_CONTEXT_KEY = 'trusted'
+
+
+class ValidationLevel(Enum):
+    """
+    The depth of validation applied to the responses of the Hunter API.
+
+    Attributes:
+        STRICT: Full pydantic validation of every field, including email addresses.
+        TRUSTED: Pydantic validation that trusts email addresses returned by the API instead of revalidating them.
+        RAW: No pydantic validation; where supported, responses are turned into compact slotted records.
+    """
+
+    STRICT = 'strict'  # noqa: WPS115
+    TRUSTED = 'trusted'  # noqa: WPS115
+    RAW = 'raw'  # noqa: WPS115
+
+
+def validation_context(validation_level: ValidationLevel) -> dict[str, bool]:
+    """
+    Build the pydantic validation context implementing the given validation level.
+
+    The raw level falls back to the trusted context wherever a pydantic model is still built.
+
+    Args:
+        validation_level (ValidationLevel): The validation level.
+
+    Returns:
+        dict[str, bool]: The context to pass to the `model_validate*` methods of the response models.
+    """
+    return {_TRUSTED_CONTEXT_KEY: validation_level is not ValidationLevel.STRICT}
+
+
+def _validate_email_unless_trusted(email: str, validation_info: ValidationInfo) -> str:
+    if validation_info.context and validation_info.context.get(_TRUSTED_CONTEXT_KEY):
+        return email
+    return validate_email(email)[1]
+
+
+TrustableEmailStr = Annotated[str, AfterValidator(_validate_email_unless_trusted)]
@@ -10,11 +10,12 @@ Classes:
     DummyStorage: A simple in-memory storage system for key-value pairs.
 
 Usage:
-    Instantiate the DummyStorage class and use its get, set, and delete methods to interact with the in-memory
-    key-value store. It can serve as a stand-in for more complex storage systems during development or testing.
+    Instantiate the DummyStorage class and use its get, set, and delete methods (or their batch variants) to interact
+    with the in-memory key-value store. It can serve as a stand-in for more complex storage systems during development
+    or testing.
 """
 
-from typing import Generic
+from typing import Generic, Iterable, Mapping
 
 from hunter_client.storages.interface import Key, ResultsStorage, ValueToStore
 
@@ -68,3 +69,34 @@ class DummyStorage(ResultsStorage, Generic[Key, ValueToStore]):
             key (Key): The key for which to remove the value.
         """
         self._repository.pop(key, None)
+
+    def get_many(self, keys: Iterable[Key]) -> dict[Key, ValueToStore]:  # noqa: WPS615
+        """
+        Retrieve the values associated with the specified keys.
+
+        Args:
+            keys (Iterable[Key]): The keys for which to retrieve the values.
+
+        Returns:
+            dict[Key, ValueToStore]: The values associated with the keys. Keys that do not exist are left out.
+        """
+        return {key: self._repository[key] for key in keys if key in self._repository}
+
+    def set_many(self, entries: Mapping[Key, ValueToStore]) -> None:  # noqa: WPS615
+        """
+        Set the values for the specified keys.
+
+        Args:
+            entries (Mapping[Key, ValueToStore]): The keys and the values to store for them.
+        """
+        self._repository.update(entries)
+
+    def delete_many(self, keys: Iterable[Key]) -> None:
+        """
+        Remove the values associated with the specified keys.
+
+        Args:
+            keys (Iterable[Key]): The keys for which to remove the values.
+        """
+        for key in keys:
+            self._repository.pop(key, None)
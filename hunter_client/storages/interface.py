@@ -7,7 +7,9 @@ implementation with different types. The keys are constrained to be hashable to
 typical storage systems like dictionaries.
 
 The class provides abstract methods that must be implemented by any concrete subclass: get, set, and delete.
-These methods define the standard interface for interacting with the storage system.
+These methods define the standard interface for interacting with the storage system. The class also provides the
+batch methods get_many, set_many, and delete_many, which fall back to the single-key methods by default and may be
+overridden by storages that can handle many keys in one round-trip or transaction.
 
 Classes:
     ResultsStorage: An abstract base class for creating storage systems for key-value pairs.
@@ -18,7 +20,7 @@ Usage:
 """
 
 from abc import ABC, abstractmethod
-from typing import Generic, Hashable, TypeVar
+from typing import Generic, Hashable, Iterable, Mapping, TypeVar
 
 Key = TypeVar('Key', bound=Hashable)
 ValueToStore = TypeVar('ValueToStore')
@@ -41,6 +43,9 @@ class ResultsStorage(ABC, Generic[Key, ValueToStore]):
         get(key): Retrieves the value associated with the given key.
         set(key, value_to_store): Sets the value for a given key.
         delete(key): Removes the value associated with the given key.
+        get_many(keys): Retrieves the values associated with the given keys.
+        set_many(entries): Sets the values for the given keys.
+        delete_many(keys): Removes the values associated with the given keys.
     """
 
     @abstractmethod
@@ -73,3 +78,40 @@ class ResultsStorage(ABC, Generic[Key, ValueToStore]):
         Args:
             key (Key): The key for which to remove the value.
         """
+
+    def get_many(self, keys: Iterable[Key]) -> dict[Key, ValueToStore]:  # noqa: WPS615
+        """
+        Retrieve the values associated with the specified keys.
+
+        Args:
+            keys (Iterable[Key]): The keys for which to retrieve the values.
+
+        Returns:
+            dict[Key, ValueToStore]: The values associated with the keys. Keys that do not exist are left out.
+        """
+        found_entries = {}
+        for key in keys:
+            value_to_store = self.get(key)
+            if value_to_store is not None:
+                found_entries[key] = value_to_store
+        return found_entries
+
+    def set_many(self, entries: Mapping[Key, ValueToStore]) -> None:  # noqa: WPS615
+        """
+        Set the values for the specified keys.
+
+        Args:
+            entries (Mapping[Key, ValueToStore]): The keys and the values to store for them.
+        """
+        for key, value_to_store in entries.items():
+            self.set(key, value_to_store)
+
+    def delete_many(self, keys: Iterable[Key]) -> None:
+        """
+        Remove the values associated with the specified keys.
+
+        Args:
+            keys (Iterable[Key]): The keys for which to remove the values.
+        """
+        for key in keys:
+            self.delete(key)
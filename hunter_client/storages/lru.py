@@ -0,0 +1,149 @@
+"""
+This module provides a bounded in-memory implementation of the ResultsStorage interface.
+
+The LRUStorage class defined here keeps at most a fixed number of entries, evicting the least recently used one
+when a new key is added to a full storage. Entries may also expire after a time-to-live, either a storage-wide
+default or one given per entry. All operations take constant time and are safe to use from multiple threads,
+which makes this storage suitable for long-running validation workers.
+
+Classes:
+    LRUStorageStats: Counters describing how the storage has been used.
+    LRUStorage: A bounded in-memory storage system with LRU eviction and per-entry expiry.
+
+Usage:
+    Instantiate the LRUStorage class with the maximum number of entries and, optionally, a default time-to-live,
+    then use its get, set, and delete methods like with any other ResultsStorage implementation.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Callable, Generic
+
+from hunter_client.storages.interface import Key, ResultsStorage, ValueToStore
+
+
+@dataclass
+class LRUStorageStats(object):
+    """
+    Counters describing how an LRUStorage has been used.
+
+    Attributes:
+        hits (int): The number of `get` calls that found a live entry.
+        misses (int): The number of `get` calls that found no entry or an expired one.
+        evictions (int): The number of entries dropped to make room for new keys.
+        expirations (int): The number of entries dropped because their time-to-live had passed.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+class LRUStorage(ResultsStorage, Generic[Key, ValueToStore]):
+    """
+    A bounded, thread-safe in-memory implementation of the ResultsStorage interface.
+
+    Entries are kept in recency order. Reading or writing a key marks it as the most recently used one, and adding a
+    key to a full storage evicts the least recently used entry. Expired entries are dropped lazily when they are
+    read, or when they reach the least recently used end of the storage.
+
+    Type Variables:
+        Key: The type of the keys used in the storage. Must be hashable.
+        ValueToStore: The type of the values to be stored.
+
+    Attributes:
+        stats (LRUStorageStats): Usage counters of the storage.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl: timedelta | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the `LRUStorage` with an empty repository.
+
+        Args:
+            max_entries (int): The maximum number of entries to keep.
+            ttl (timedelta | None): The default time-to-live of the entries, or None for entries that never expire.
+            clock (Callable[[], float]): A monotonic clock returning the current time in seconds.
+
+        Raises:
+            ValueError: If `max_entries` is not a positive integer.
+        """
+        if max_entries < 1:
+            raise ValueError('`max_entries` must be a positive integer, got {0}.'.format(max_entries))
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._clock = clock
+        self._repository: OrderedDict[Key, tuple[ValueToStore, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = LRUStorageStats()
+
+    def __len__(self) -> int:
+        """Return the number of entries currently held, including expired ones not dropped yet."""
+        return len(self._repository)
+
+    def get(self, key: Key) -> ValueToStore | None:
+        """
+        Retrieve the value associated with the specified key.
+
+        Args:
+            key (Key): The key for which to retrieve the value.
+
+        Returns:
+            ValueToStore | None: The value associated with the key, or None if the key does not exist or expired.
+        """
+        with self._lock:
+            entry = self._repository.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            value_to_store, expires_at = entry
+            if expires_at is not None and expires_at <= self._clock():
+                del self._repository[key]  # noqa: WPS420
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._repository.move_to_end(key)
+            self.stats.hits += 1
+            return value_to_store
+
+    def set(self, key: Key, value_to_store: ValueToStore, ttl: timedelta | None = None) -> None:
+        """
+        Set the value for the specified key, evicting the least recently used entry if the storage is full.
+
+        Args:
+            key (Key): The key for which to set the value.
+            value_to_store (ValueToStore): The value to store.
+            ttl (timedelta | None): The time-to-live of this entry, or None to use the storage-wide default.
+        """
+        entry_ttl = ttl if ttl is not None else self._ttl
+        with self._lock:
+            expires_at = None if entry_ttl is None else self._clock() + entry_ttl.total_seconds()
+            self._repository[key] = (value_to_store, expires_at)
+            self._repository.move_to_end(key)
+            if len(self._repository) > self._max_entries:
+                self._drop_least_recently_used()
+
+    def delete(self, key: Key) -> None:
+        """
+        Remove the value associated with the specified key.
+
+        Args:
+            key (Key): The key for which to remove the value.
+        """
+        with self._lock:
+            self._repository.pop(key, None)
+
+    def _drop_least_recently_used(self) -> None:
+        _, (_, expires_at) = self._repository.popitem(last=False)
+        if expires_at is not None and expires_at <= self._clock():
+            self.stats.expirations += 1
+        else:
+            self.stats.evictions += 1
@@ -0,0 +1,207 @@
+"""
+This module provides a persistent implementation of the ResultsStorage interface backed by SQLite.
+
+The SQLiteStorage class defined here keeps its entries in a single-table SQLite database, so that validation results
+survive process restarts. The database runs in write-ahead logging mode and writes are grouped into transactions
+of a configurable size, which keeps the write throughput high even for tens of millions of entries.
+
+Classes:
+    SQLiteStorage: A persistent storage system for string keys and JSON-serializable values.
+
+Usage:
+    Instantiate the SQLiteStorage class with a path to the database file and use its get, set, and delete methods
+    like with any other ResultsStorage implementation. Call `close` (or use the storage as a context manager) when
+    done, so that the last batch of writes is committed.
+"""
+
+import json
+import sqlite3
+import threading
+from os import PathLike
+from types import TracebackType
+from typing import Any, Callable, Generic, Iterable, Mapping
+
+from hunter_client.storages.interface import ResultsStorage, ValueToStore
+
+_SCHEMA_STATEMENT = (
+    'CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY NOT NULL, value TEXT NOT NULL) WITHOUT ROWID'
+)
+_SELECT_STATEMENT = 'SELECT value FROM results WHERE key = ?'
+_SELECT_MANY_STATEMENT_TEMPLATE = 'SELECT key, value FROM results WHERE key IN ({0})'
+_UPSERT_STATEMENT = (
+    'INSERT INTO results (key, value) VALUES (?, ?) ON CONFLICT (key) DO UPDATE SET value = excluded.value'
+)
+_DELETE_STATEMENT = 'DELETE FROM results WHERE key = ?'
+
+
+class SQLiteStorage(ResultsStorage[str, ValueToStore], Generic[ValueToStore]):  # noqa: WPS214
+    """
+    A persistent implementation of the ResultsStorage interface backed by an SQLite database file.
+
+    Values are serialized to text, as JSON by default. Writes are executed immediately on a single shared connection
+    but committed in batches of `commit_batch_size` statements, so reads through this storage always see them,
+    while other processes only see them once the batch is committed. Writes that were not committed yet are lost if
+    the process crashes, so `commit_batch_size` trades durability for throughput.
+
+    The results table is clustered on its primary key, so every lookup is a single index search. All statements are
+    constant strings, so the connection reuses their prepared form from its statement cache. The batch methods run
+    one statement per chunk of keys instead of one per key.
+
+    Type Variables:
+        ValueToStore: The type of the values to be stored.
+    """
+
+    _max_keys_per_select = 500
+
+    def __init__(  # noqa: WPS211
+        self,
+        database_path: str | PathLike[str],
+        commit_batch_size: int = 1000,
+        serialize: Callable[[ValueToStore], str] = json.dumps,
+        deserialize: Callable[[str], Any] = json.loads,
+    ) -> None:
+        """
+        Open (and create if needed) the database and prepare it for use.
+
+        Args:
+            database_path (str | PathLike[str]): The path to the SQLite database file.
+            commit_batch_size (int): The number of writes to group into a single transaction.
+            serialize (Callable[[ValueToStore], str]): The function turning a value into its stored text.
+            deserialize (Callable[[str], Any]): The function turning stored text back into a value.
+
+        Raises:
+            ValueError: If `commit_batch_size` is not a positive integer.
+        """
+        if commit_batch_size < 1:
+            raise ValueError('`commit_batch_size` must be a positive integer, got {0}.'.format(commit_batch_size))
+        self._commit_batch_size = commit_batch_size
+        self._serialize = serialize
+        self._deserialize = deserialize
+        self._uncommitted_writes = 0
+        self._lock = threading.Lock()
+        self._is_closed = False
+        self._connection = sqlite3.connect(database_path, check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode = WAL')
+        self._connection.execute('PRAGMA synchronous = NORMAL')
+        self._connection.execute(_SCHEMA_STATEMENT)
+        self._connection.commit()
+
+    def __enter__(self) -> 'SQLiteStorage[ValueToStore]':
+        """Enter the context of the storage."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit the context of the storage, committing pending writes and closing the database."""
+        self.close()
+
+    def get(self, key: str) -> ValueToStore | None:
+        """
+        Retrieve the value associated with the specified key.
+
+        Args:
+            key (str): The key for which to retrieve the value.
+
+        Returns:
+            ValueToStore | None: The value associated with the key, or None if the key does not exist.
+        """
+        with self._lock:
+            row = self._connection.execute(_SELECT_STATEMENT, (key,)).fetchone()
+        return None if row is None else self._deserialize(row[0])
+
+    def set(self, key: str, value_to_store: ValueToStore) -> None:
+        """
+        Set the value for the specified key.
+
+        Args:
+            key (str): The key for which to set the value.
+            value_to_store (ValueToStore): The value to store.
+        """
+        serialized_value = self._serialize(value_to_store)
+        with self._lock:
+            self._connection.execute(_UPSERT_STATEMENT, (key, serialized_value))
+            self._register_uncommitted_writes(1)
+
+    def delete(self, key: str) -> None:
+        """
+        Remove the value associated with the specified key.
+
+        Args:
+            key (str): The key for which to remove the value.
+        """
+        with self._lock:
+            self._connection.execute(_DELETE_STATEMENT, (key,))
+            self._register_uncommitted_writes(1)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, ValueToStore]:  # noqa: WPS615
+        """
+        Retrieve the values associated with the specified keys.
+
+        Args:
+            keys (Iterable[str]): The keys for which to retrieve the values.
+
+        Returns:
+            dict[str, ValueToStore]: The values associated with the keys. Keys that do not exist are left out.
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        rows: list[tuple[str, str]] = []
+        with self._lock:
+            for chunk_start in range(0, len(unique_keys), self._max_keys_per_select):
+                rows.extend(self._select_chunk(unique_keys, chunk_start))
+        return {key: self._deserialize(serialized_value) for key, serialized_value in rows}
+
+    def set_many(self, entries: Mapping[str, ValueToStore]) -> None:  # noqa: WPS615
+        """
+        Set the values for the specified keys in a single batch of writes.
+
+        Args:
+            entries (Mapping[str, ValueToStore]): The keys and the values to store for them.
+        """
+        serialized_entries = [(key, self._serialize(entries[key])) for key in entries]
+        with self._lock:
+            self._connection.executemany(_UPSERT_STATEMENT, serialized_entries)
+            self._register_uncommitted_writes(len(serialized_entries))
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        """
+        Remove the values associated with the specified keys in a single batch of writes.
+
+        Args:
+            keys (Iterable[str]): The keys for which to remove the values.
+        """
+        key_rows = [(key,) for key in keys]
+        with self._lock:
+            self._connection.executemany(_DELETE_STATEMENT, key_rows)
+            self._register_uncommitted_writes(len(key_rows))
+
+    def flush(self) -> None:
+        """Commit all pending writes."""
+        with self._lock:
+            self._commit()
+
+    def close(self) -> None:
+        """Commit all pending writes and close the database connection. Closing it again does nothing."""
+        with self._lock:
+            if self._is_closed:
+                return
+            self._commit()
+            self._connection.close()
+            self._is_closed = True
+
+    def _select_chunk(self, keys: list[str], chunk_start: int) -> list[tuple[str, str]]:
+        keys_chunk = keys[chunk_start:chunk_start + self._max_keys_per_select]
+        placeholders = ', '.join('?' for _ in keys_chunk)
+        return self._connection.execute(_SELECT_MANY_STATEMENT_TEMPLATE.format(placeholders), keys_chunk).fetchall()
+
+    def _register_uncommitted_writes(self, writes_count: int) -> None:
+        self._uncommitted_writes += writes_count
+        if self._uncommitted_writes >= self._commit_batch_size:
+            self._commit()
+
+    def _commit(self) -> None:
+        self._connection.commit()
+        self._uncommitted_writes = 0
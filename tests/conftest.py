@@ -1,13 +1,25 @@
+from functools import partial
+from http import HTTPStatus
 from typing import Generator
 
+import httpx
 import pytest
 import requests_mock
 
-from hunter_client.client import HunterClient
+from hunter_client.client import AsyncHunterClient, HunterClient
 from hunter_client.services.email_validation import PersistentEmailValidationService
 from hunter_client.storages.dummy import DummyStorage
-from tests.mock_responses.failed import *  # noqa: F401, F403, WPS347, WPS440
-from tests.mock_responses.successful import *  # noqa: F401, F403, WPS347, WPS440
+from tests.fakes import FakeClock
+from tests.mock_responses import failed, successful
+
+domain_search_successful_response = pytest.fixture(successful.domain_search_successful_response)
+domain_and_name_search_successful_response = pytest.fixture(successful.domain_and_name_search_successful_response)
+email_verification_successful_response = pytest.fixture(successful.email_verification_successful_response)
+email_count_successful_response = pytest.fixture(successful.email_count_successful_response)
+domain_search_failed_response = pytest.fixture(failed.domain_search_failed_response)
+domain_and_name_search_failed_response = pytest.fixture(failed.domain_and_name_search_failed_response)
+email_verification_failed_response = pytest.fixture(failed.email_verification_failed_response)
+email_count_failed_response = pytest.fixture(failed.email_count_failed_response)
 
 
 @pytest.fixture
@@ -15,6 +27,11 @@ def hunter_client() -> HunterClient:
     return HunterClient(api_key='not_really_an_api_key')
 
 
+@pytest.fixture
+def fake_clock() -> FakeClock:
+    return FakeClock()
+
+
 @pytest.fixture
 def dummy_emails_by_domain_storage() -> DummyStorage[str, list[str]]:
     return DummyStorage[str, list[str]]()
@@ -39,3 +56,25 @@ def persistent_email_validation_service(
 def requests_mocker() -> Generator[requests_mock.Mocker, None, None]:
     with requests_mock.Mocker() as mocker:
         yield mocker
+
+
+@pytest.fixture
+def async_mocked_responses() -> dict[str, dict]:
+    return {}
+
+
+def respond_with_mocked_json(mocked_responses: dict[str, dict], request: httpx.Request) -> httpx.Response:
+    for mocked_url, mocked_json in mocked_responses.items():
+        parsed_mocked_url = httpx.URL(mocked_url)
+        if parsed_mocked_url.path == request.url.path and parsed_mocked_url.params == request.url.params:
+            return httpx.Response(HTTPStatus.OK, json=mocked_json)
+    return httpx.Response(HTTPStatus.NOT_FOUND, json={'errors': [{'id': 'not_found'}]})
+
+
+@pytest.fixture
+def async_hunter_client(async_mocked_responses: dict[str, dict]) -> AsyncHunterClient:  # noqa: WPS442
+    transport = httpx.MockTransport(partial(respond_with_mocked_json, async_mocked_responses))
+    return AsyncHunterClient(
+        api_key='not_really_an_api_key',
+        http_session=httpx.AsyncClient(transport=transport),
+    )
@@ -0,0 +1,62 @@
+"""Fake implementations of collaborators used by the tests."""
+
+import threading
+
+import requests
+
+
+class FakeClock(object):
+    """A manually advanced clock for testing time-to-live expiry."""
+
+    def __init__(self) -> None:
+        """Start the clock at zero."""
+        self.now: float = 0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        """Return the current fake time in seconds."""
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """Record the requested sleep and advance the clock past it."""
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class ScriptedClock(object):
+    """A clock returning scripted readings, one per call, for testing measured latencies."""
+
+    def __init__(self, *readings: float) -> None:
+        """Script the readings of the clock."""
+        self._readings = iter(readings)
+
+    def __call__(self) -> float:
+        """Return the next scripted reading in seconds."""
+        return next(self._readings)
+
+
+class GatedResponse(object):
+    """A mocked JSON response that holds the request until the test releases it."""
+
+    def __init__(self, body: dict) -> None:
+        """Prepare the body of the response."""
+        self.body = body
+        self.started = threading.Event()
+        self.released = threading.Event()
+
+    def __call__(self, _request: object, _context: object) -> dict:
+        """Signal that the request started, wait for the release and return the body."""
+        self.started.set()
+        self.released.wait(timeout=5)
+        return self.body
+
+
+class ClosureRecordingSession(requests.Session):
+    """An HTTP session recording whether it was closed."""
+
+    closed = False
+
+    def close(self) -> None:
+        """Record the closure and close the session."""
+        self.closed = True
+        super().close()
@@ -1,7 +1,6 @@
-import pytest
+"""This module builds payloads of failed Hunter API responses, used by test fixtures and the stand-in server."""
 
 
-@pytest.fixture
 def domain_search_failed_response() -> dict:
     return {
         'data': {
@@ -42,7 +41,6 @@ def domain_search_failed_response() -> dict:
     }
 
 
-@pytest.fixture
 def domain_and_name_search_failed_response() -> dict:
     return {
         'data': {
@@ -76,7 +74,6 @@ def domain_and_name_search_failed_response() -> dict:
     }
 
 
-@pytest.fixture
 def email_verification_failed_response() -> dict:
     return {
         'data': {
@@ -103,7 +100,6 @@ def email_verification_failed_response() -> dict:
     }
 
 
-@pytest.fixture
 def email_count_failed_response() -> dict:
     return {
         'data': {
@@ -1,7 +1,6 @@
-import pytest
+"""This module builds payloads of successful Hunter API responses, used by test fixtures and the stand-in server."""
 
 
-@pytest.fixture
 def domain_search_successful_response() -> dict:
     return {
         'data': {
@@ -104,7 +103,6 @@ def domain_search_successful_response() -> dict:
     }
 
 
-@pytest.fixture
 def domain_and_name_search_successful_response() -> dict:
     return {
         'data': {
@@ -146,7 +144,6 @@ def domain_and_name_search_successful_response() -> dict:
     }
 
 
-@pytest.fixture
 def email_verification_successful_response() -> dict:
     return {
         'data': {
@@ -181,7 +178,6 @@ def email_verification_successful_response() -> dict:
     }
 
 
-@pytest.fixture
 def email_count_successful_response() -> dict:
     return {
         'data': {
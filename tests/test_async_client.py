@@ -0,0 +1,91 @@
+import asyncio
+
+import httpx
+import pytest
+
+from hunter_client.client import AsyncHunterClient
+
+CONCURRENT_REQUESTS_COUNT = 50
+
+
+async def verify_concurrently(client: AsyncHunterClient, emails: list[str]) -> list[dict]:
+    async with client:
+        return await asyncio.gather(*[client.email_verifier.check_if_email_is_valid(email) for email in emails])
+
+
+def test_async_search_emails_by_domain(
+    async_hunter_client: AsyncHunterClient,
+    async_mocked_responses: dict[str, dict],
+    domain_search_successful_response: dict,
+) -> None:
+    async_mocked_responses['https://api.hunter.io/v2/domain-search?domain=example.com'] = (
+        domain_search_successful_response
+    )
+
+    response = asyncio.run(async_hunter_client.domain_searcher.search_emails_by_domain('example.com'))
+
+    assert response == domain_search_successful_response
+
+
+def test_async_search_email_by_domain_and_name(
+    async_hunter_client: AsyncHunterClient,
+    async_mocked_responses: dict[str, dict],
+    domain_and_name_search_successful_response: dict,
+) -> None:
+    async_mocked_responses['https://api.hunter.io/v2/email-finder?domain=example.com&first_name=John&last_name=Doe'] = (
+        domain_and_name_search_successful_response
+    )
+
+    response = asyncio.run(
+        async_hunter_client.domain_and_name_searcher.search_email_by_domain_and_name('example.com', 'John', 'Doe'),
+    )
+
+    assert response == domain_and_name_search_successful_response
+
+
+def test_async_get_email_status(
+    async_hunter_client: AsyncHunterClient,
+    async_mocked_responses: dict[str, dict],
+    email_verification_successful_response: dict,
+) -> None:
+    async_mocked_responses['https://api.hunter.io/v2/email-verifier?email=test@example.com'] = (
+        email_verification_successful_response
+    )
+
+    response = asyncio.run(async_hunter_client.email_verifier.check_if_email_is_valid('test@example.com'))
+
+    assert response == email_verification_successful_response
+
+
+def test_async_count_emails_of_a_domain(
+    async_hunter_client: AsyncHunterClient,
+    async_mocked_responses: dict[str, dict],
+    email_count_successful_response: dict,
+) -> None:
+    async_mocked_responses['https://api.hunter.io/v2/email-count?domain=example.com'] = (
+        email_count_successful_response
+    )
+
+    response = asyncio.run(async_hunter_client.email_counter.count_emails_by_domain('example.com'))
+
+    assert response == email_count_successful_response
+
+
+def test_async_many_requests_in_flight(
+    async_hunter_client: AsyncHunterClient,
+    async_mocked_responses: dict[str, dict],
+    email_verification_successful_response: dict,
+) -> None:
+    async_mocked_responses['https://api.hunter.io/v2/email-verifier?email=test@example.com'] = (
+        email_verification_successful_response
+    )
+    emails = ['test@example.com' for _ in range(CONCURRENT_REQUESTS_COUNT)]
+
+    responses = asyncio.run(verify_concurrently(async_hunter_client, emails))
+
+    assert responses == [email_verification_successful_response for _ in range(CONCURRENT_REQUESTS_COUNT)]
+
+
+def test_async_error_status_raises(async_hunter_client: AsyncHunterClient) -> None:
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(async_hunter_client.email_counter.count_emails_by_domain('unmocked.com'))
@@ -0,0 +1,112 @@
+import asyncio
+import logging
+from http import HTTPStatus
+
+import pytest
+import requests
+import requests_mock
+
+from hunter_client.client import AsyncHunterClient, CallPhase, CallTimer, CallTimings, HunterClient, RetryPolicy
+from tests.fakes import FakeClock, ScriptedClock
+
+EMAIL_COUNT_URL = 'https://api.hunter.io/v2/email-count?domain=example.com'
+VERIFIER_URL = 'https://api.hunter.io/v2/email-verifier?email=test@example.com'
+
+
+def test_typed_call_phases_are_timed(
+    requests_mocker: requests_mock.Mocker,
+    email_verification_successful_response: dict,
+) -> None:
+    requests_mocker.get(VERIFIER_URL, json=email_verification_successful_response)
+    timed_calls: list[CallTimings] = []
+    clock = ScriptedClock(0, 1, 3, 4, 5, 6)
+    call_timer = CallTimer(on_call=timed_calls.append, clock=clock)
+    hunter_client = HunterClient(api_key='not_really_an_api_key', call_timer=call_timer)
+
+    hunter_client.email_verifier.verify_email('test@example.com')
+
+    assert timed_calls == [
+        CallTimings(
+            endpoint='/email-verifier',
+            method='GET',
+            phases={CallPhase.QUEUE: 1, CallPhase.WAIT: 2, CallPhase.DOWNLOAD: 1, CallPhase.VALIDATE: 1},
+            total=6,
+        ),
+    ]
+
+
+def test_slow_calls_are_reported(
+    requests_mocker: requests_mock.Mocker,
+    email_count_successful_response: dict,
+) -> None:
+    requests_mocker.get(EMAIL_COUNT_URL, json=email_count_successful_response)
+    slow_calls: list[CallTimings] = []
+    fast_call_readings = (0, 0, 0, 0, 0, 1)
+    slow_call_readings = (2, 2, 2, 2, 2, 4)
+    call_timer = CallTimer(
+        slow_call_threshold=2,
+        on_slow_call=slow_calls.append,
+        clock=ScriptedClock(*fast_call_readings, *slow_call_readings),
+    )
+    hunter_client = HunterClient(api_key='not_really_an_api_key', call_timer=call_timer)
+
+    hunter_client.email_counter.count_emails_by_domain('example.com')
+    hunter_client.email_counter.count_emails_by_domain('example.com')
+
+    assert [slow_call.total for slow_call in slow_calls] == [2]
+    assert CallPhase.DECODE in slow_calls[0].phases
+
+
+def test_slow_calls_are_logged_by_default(
+    requests_mocker: requests_mock.Mocker,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    requests_mocker.get(EMAIL_COUNT_URL, status_code=HTTPStatus.UNAUTHORIZED)
+    hunter_client = HunterClient(api_key='not_really_an_api_key', call_timer=CallTimer(slow_call_threshold=0))
+
+    with caplog.at_level(logging.WARNING):
+        with pytest.raises(requests.HTTPError):
+            hunter_client.email_counter.count_emails_by_domain('example.com')
+
+    assert 'Slow Hunter API call: GET /email-count took' in caplog.text
+    assert 'failed with HTTPError' in caplog.text
+
+
+def test_retry_backoff_is_timed(
+    requests_mocker: requests_mock.Mocker,
+    email_count_successful_response: dict,
+) -> None:
+    requests_mocker.get(
+        EMAIL_COUNT_URL,
+        [
+            {'status_code': HTTPStatus.TOO_MANY_REQUESTS, 'headers': {'Retry-After': '2'}},
+            {'json': email_count_successful_response},
+        ],
+    )
+    clock = FakeClock()
+    timed_calls: list[CallTimings] = []
+    hunter_client = HunterClient(
+        api_key='not_really_an_api_key',
+        retry_policy=RetryPolicy(clock=clock, sleep=clock.sleep),
+        call_timer=CallTimer(on_call=timed_calls.append, clock=clock),
+    )
+
+    hunter_client.email_counter.count_emails_by_domain('example.com')
+
+    assert timed_calls[0].phases[CallPhase.RETRY_BACKOFF] == 2
+    assert timed_calls[0].total == 2
+
+
+def test_async_call_phases_are_timed(
+    async_hunter_client: AsyncHunterClient,
+    async_mocked_responses: dict[str, dict],
+    email_verification_successful_response: dict,
+) -> None:
+    async_mocked_responses[VERIFIER_URL] = email_verification_successful_response
+    timed_calls: list[CallTimings] = []
+    async_hunter_client.call_timer = CallTimer(on_call=timed_calls.append)
+
+    asyncio.run(async_hunter_client.email_verifier.check_if_email_is_valid('test@example.com'))
+
+    expected_phases = [CallPhase.QUEUE, CallPhase.WAIT, CallPhase.DOWNLOAD, CallPhase.DECODE]
+    assert list(timed_calls[0].phases) == expected_phases
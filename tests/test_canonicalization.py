@@ -0,0 +1,82 @@
+import re
+
+import pytest
+import requests_mock
+
+from hunter_client.services.canonicalization import DEFAULT_PROVIDER_RULES, EmailCanonicalizer
+from hunter_client.services.email_validation import PersistentEmailValidationService
+from hunter_client.storages.dummy import DummyStorage
+
+ANY_VERIFIER_URL = re.compile('/v2/email-verifier')
+MORE_THAN_DEDUPLICATION_WINDOW = 40
+
+
+@pytest.mark.parametrize(('email', 'canonical_email'), [
+    (' John@Example.COM. ', 'John@example.com'),
+    ('john+news@example.com', 'john+news@example.com'),
+    ('john@bücher.example', 'john@xn--bcher-kva.example'),
+    ('John.Doe+news@GoogleMail.com', 'johndoe@gmail.com'),
+    ('John.Doe+news@hotmail.com', 'john.doe@hotmail.com'),
+    ('malformed ', 'malformed'),
+])
+def test_emails_are_canonicalized(email: str, canonical_email: str) -> None:
+    email_canonicalizer = EmailCanonicalizer(DEFAULT_PROVIDER_RULES)
+
+    assert email_canonicalizer.canonicalize(email) == canonical_email
+    assert email_canonicalizer.canonicalize(canonical_email) == canonical_email
+
+
+def test_duplicates_in_batch_are_validated_once(
+    requests_mocker: requests_mock.Mocker,
+    dummy_emails_validity_storage: DummyStorage[str, bool],
+    email_verification_successful_response: dict,
+) -> None:
+    requests_mocker.get(ANY_VERIFIER_URL, json=email_verification_successful_response)
+    validation_service = PersistentEmailValidationService(
+        'not_really_an_api_key',
+        dummy_emails_validity_storage,
+        read_through=False,
+        canonicalizer=EmailCanonicalizer(DEFAULT_PROVIDER_RULES),
+    )
+    emails = ['John.Doe@gmail.com', 'johndoe+news@googlemail.com', 'jane@example.com', 'John.Doe@gmail.com']
+
+    validation_results = list(validation_service.validate_many(emails, max_concurrency=2))
+
+    assert validation_results == [(email, True) for email in emails]
+    assert requests_mocker.call_count == 2
+    assert dummy_emails_validity_storage.get('johndoe@gmail.com') is True
+
+
+def test_canonical_email_is_sent_and_stored(
+    requests_mocker: requests_mock.Mocker,
+    dummy_emails_validity_storage: DummyStorage[str, bool],
+    email_verification_successful_response: dict,
+) -> None:
+    requests_mocker.get(ANY_VERIFIER_URL, json=email_verification_successful_response)
+    validation_service = PersistentEmailValidationService(
+        'not_really_an_api_key',
+        dummy_emails_validity_storage,
+        read_through=True,
+        canonicalizer=EmailCanonicalizer(),
+    )
+
+    assert validation_service.validate_and_store_email_status(' John@Example.COM ') is True
+    assert validation_service.validate_and_store_email_status('John@example.com') is True
+    assert requests_mocker.call_count == 1
+    assert requests_mocker.request_history[0].url.endswith('email=John%40example.com')  # noqa: WPS323
+    assert dummy_emails_validity_storage.get('John@example.com') is True
+
+
+def test_deduplication_window_is_bounded(
+    requests_mocker: requests_mock.Mocker,
+    dummy_emails_validity_storage: DummyStorage[str, bool],
+    email_verification_successful_response: dict,
+) -> None:
+    requests_mocker.get(ANY_VERIFIER_URL, json=email_verification_successful_response)
+    validation_service = PersistentEmailValidationService('not_really_an_api_key', dummy_emails_validity_storage)
+    unique_emails = ['user{0}@example.com'.format(user_number) for user_number in range(MORE_THAN_DEDUPLICATION_WINDOW)]
+
+    validation_results = list(validation_service.validate_many(unique_emails * 2, max_concurrency=1))
+
+    assert validation_results == [(email, True) for email in unique_emails * 2]
+    assert requests_mocker.call_count == len(validation_results)
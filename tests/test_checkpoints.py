@@ -0,0 +1,90 @@
+import re
+from pathlib import Path
+
+import requests_mock
+
+from hunter_client.services.checkpoints import CheckpointJournal
+from hunter_client.services.domain_harvesting import PersistentDomainHarvestingService
+from hunter_client.services.email_validation import PersistentEmailValidationService
+from hunter_client.storages.dummy import DummyStorage
+
+ANY_VERIFIER_URL = re.compile('/v2/email-verifier')
+
+
+def test_journal_is_reloaded_on_restart(tmp_path: Path) -> None:
+    journal_path = tmp_path / 'run.journal'
+    with CheckpointJournal(journal_path) as first_journal:
+        first_journal.record_completed('john@example.com')
+        first_journal.record_completed('john@example.com')
+
+    with CheckpointJournal(journal_path) as second_journal:
+        second_journal.record_completed('jane@example.com')
+        assert second_journal.is_completed('john@example.com')
+        assert second_journal.completed_count == 2
+
+    assert journal_path.read_text().splitlines() == ['"john@example.com"', '"jane@example.com"']
+
+
+def test_torn_record_is_discarded(tmp_path: Path) -> None:
+    journal_path = tmp_path / 'run.journal'
+    journal_path.write_text('"john@example.com"\n"jane@exa')
+
+    with CheckpointJournal(journal_path) as journal:
+        assert not journal.is_completed('jane@exa')
+        journal.record_completed('jane@example.com')
+
+    assert journal_path.read_text() == '"john@example.com"\n"jane@example.com"\n'
+
+
+def test_resumed_validation_skips_completed_items(
+    requests_mocker: requests_mock.Mocker,
+    persistent_email_validation_service: PersistentEmailValidationService,
+    email_verification_successful_response: dict,
+    tmp_path: Path,
+) -> None:
+    requests_mocker.get(ANY_VERIFIER_URL, json=email_verification_successful_response)
+    emails = ['john@example.com', 'jane@example.com', 'paul@example.com']
+    with CheckpointJournal(tmp_path / 'run.journal') as crashed_run_journal:
+        list(persistent_email_validation_service.validate_many(emails[:2], journal=crashed_run_journal))
+
+    with CheckpointJournal(tmp_path / 'run.journal') as journal:
+        validation_results = list(persistent_email_validation_service.validate_many(emails, journal=journal))
+
+    assert validation_results == [(email, True) for email in emails]
+    assert requests_mocker.call_count == 3
+
+
+def test_unstored_completed_emails_are_redone(
+    requests_mocker: requests_mock.Mocker,
+    email_verification_successful_response: dict,
+    tmp_path: Path,
+) -> None:
+    requests_mocker.get(ANY_VERIFIER_URL, json=email_verification_successful_response)
+    journal_path = tmp_path / 'run.journal'
+    journal_path.write_text('"john@example.com"\n')
+    validation_service = PersistentEmailValidationService('not_really_an_api_key', DummyStorage[str, bool]())
+
+    with CheckpointJournal(journal_path) as journal:
+        validation_results = list(validation_service.validate_many(['john@example.com'], journal=journal))
+
+    assert validation_results == [('john@example.com', True)]
+    assert requests_mocker.call_count == 1
+
+
+def test_resumed_harvest_skips_completed_domains(
+    requests_mocker: requests_mock.Mocker,
+    dummy_emails_by_domain_storage: DummyStorage[str, list[str]],
+    domain_search_successful_response: dict,
+    tmp_path: Path,
+) -> None:
+    requests_mocker.get(re.compile('/v2/domain-search'), json=domain_search_successful_response)
+    harvesting_service = PersistentDomainHarvestingService('not_really_an_api_key', dummy_emails_by_domain_storage)
+    with CheckpointJournal(tmp_path / 'run.journal') as crashed_run_journal:
+        next(harvesting_service.harvest_many(['example.com', 'example.org'], journal=crashed_run_journal))
+
+    with CheckpointJournal(tmp_path / 'run.journal') as journal:
+        harvest_results = dict(harvesting_service.harvest_many(['example.com', 'example.org'], journal=journal))
+
+    assert harvest_results['example.com'] == ['contact@example.com', 'info@example.com']
+    assert dummy_emails_by_domain_storage.get('example.org') == harvest_results['example.org']
+    assert requests_mocker.call_count == 2
@@ -0,0 +1,117 @@
+import io
+import json
+import re
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+import requests_mock
+
+from hunter_client.cli.__main__ import main
+from hunter_client.cli.progress import ThroughputReporter
+from hunter_client.cli.readers import InputFormat, detect_input_format, read_emails
+from hunter_client.cli.writers import ValidationOutcome
+from tests.fakes import FakeClock
+
+MALFORMED_EMAIL_URL = 'https://api.hunter.io/v2/email-verifier?email=malformed'
+
+
+@pytest.mark.parametrize(('input_name', 'input_format'), [
+    ('emails.csv', InputFormat.CSV),
+    ('emails.JSONL', InputFormat.JSONL),
+    ('emails.ndjson', InputFormat.JSONL),
+    ('<stdin>', InputFormat.CSV),
+])
+def test_input_format_is_detected(input_name: str, input_format: InputFormat) -> None:
+    assert detect_input_format(input_name) is input_format
+
+
+def test_emails_are_read_from_csv_and_json_lines() -> None:
+    csv_lines = ['name,email\n', 'John, john@example.com \n', 'Nobody,\n', 'Jane,jane@example.com\n']
+    json_lines = ['{"email": "john@example.com"}\n', '\n', '"jane@example.com"\n', '{"name": "Nobody"}\n']
+
+    assert list(read_emails(csv_lines, InputFormat.CSV)) == ['john@example.com', 'jane@example.com']
+    assert list(read_emails(['john@example.com\n'], InputFormat.CSV, has_header=False)) == ['john@example.com']
+    assert list(read_emails(json_lines, InputFormat.JSONL)) == ['john@example.com', 'jane@example.com']
+    with pytest.raises(ValueError, match='Line 2 of the JSON Lines input is not valid JSON'):
+        list(read_emails(['"john@example.com"\n', '{\n'], InputFormat.JSONL))
+
+
+def test_outcomes_are_streamed_with_failures(
+    requests_mocker: requests_mock.Mocker,
+    email_verification_successful_response: dict,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    requests_mocker.get(re.compile('/v2/email-verifier'), json=email_verification_successful_response)
+    requests_mocker.get(MALFORMED_EMAIL_URL, status_code=HTTPStatus.BAD_REQUEST)
+    input_path = tmp_path / 'emails.jsonl'
+    input_path.write_text('{"email": "john@example.com"}\n{"email": "malformed"}\n{"email": "jane@example.com"}\n')
+    output_path = tmp_path / 'outcomes.jsonl'
+
+    main([str(input_path), '--output', str(output_path), '--api-key=not_really_an_api_key', '--workers=2'])
+
+    output_lines = output_path.read_text().splitlines()
+    outcomes = [ValidationOutcome(**json.loads(output_line)) for output_line in output_lines]
+    assert [outcome.email for outcome in outcomes] == ['john@example.com', 'malformed', 'jane@example.com']
+    assert [outcome.is_valid for outcome in outcomes] == [True, None, True]
+    assert outcomes[1].error is not None
+    assert re.search(r'validated 3 emails, 1 failed, [\d.]+ emails/s\n$', capsys.readouterr().err)
+
+
+def test_outcomes_can_be_written_as_csv(
+    requests_mocker: requests_mock.Mocker,
+    email_verification_successful_response: dict,
+    tmp_path: Path,
+) -> None:
+    requests_mocker.get(re.compile('/v2/email-verifier'), json=email_verification_successful_response)
+    input_path = tmp_path / 'emails.csv'
+    input_path.write_text('contact\njohn@example.com\n')
+    output_path = tmp_path / 'outcomes.csv'
+
+    main([
+        str(input_path),
+        '--column=contact',
+        '--output={0}'.format(output_path),
+        '--output-format=csv',
+        '--api-key=not_really_an_api_key',
+    ])
+
+    assert output_path.read_text().splitlines() == ['email,is_valid,error', 'john@example.com,True,']
+
+
+def test_invalid_command_lines_are_rejected(tmp_path: Path) -> None:
+    input_path = tmp_path / 'emails.csv'
+    input_path.write_text('name\nJohn\n')
+
+    with pytest.raises(SystemExit, match='error: The CSV input has no `email` column.'):
+        main([str(input_path), '--api-key', 'not_really_an_api_key'])
+    with pytest.raises(SystemExit):
+        main([str(input_path), '--api-key=not_really_an_api_key', '--progress-interval=0'])
+
+
+def test_zero_interval_reports_every_new_instant(fake_clock: FakeClock) -> None:
+    progress_stream = io.StringIO()
+    throughput_reporter = ThroughputReporter(progress_stream, interval=0, clock=fake_clock)
+
+    throughput_reporter.record(ValidationOutcome('john@example.com', is_valid=True))
+    fake_clock.now = 2
+    throughput_reporter.record(ValidationOutcome('jane@example.com', is_valid=True))
+
+    assert progress_stream.getvalue() == 'validated 2 emails, 0 failed, 1.0 emails/s\r'
+
+
+def test_throughput_is_reported_periodically(fake_clock: FakeClock) -> None:
+    progress_stream = io.StringIO()
+    throughput_reporter = ThroughputReporter(progress_stream, interval=1, clock=fake_clock)
+
+    for elapsed_seconds in (0.5, 1, 1.5, 4):  # noqa: WPS432
+        fake_clock.now = elapsed_seconds
+        throughput_reporter.record(ValidationOutcome('john@example.com', is_valid=True))
+    throughput_reporter.finish()
+
+    assert progress_stream.getvalue() == ''.join((
+        'validated 2 emails, 0 failed, 2.0 emails/s\r',
+        'validated 4 emails, 0 failed, 0.7 emails/s\r',
+        'validated 4 emails, 0 failed, 1.0 emails/s\n',
+    ))
@@ -0,0 +1,101 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from http import HTTPStatus
+
+import httpx
+import pytest
+import requests_mock
+
+from hunter_client.client import AsyncHunterClient, AsyncRequestCoalescer, HunterClient, RequestCoalescer
+
+FOLLOWERS_COUNT = 4
+POLL_INTERVAL_SECONDS = 0.001
+
+
+def respond_once_followers_wait(request_coalescer: RequestCoalescer, response_json: dict, *_: object) -> dict:
+    while request_coalescer.stats.followers < FOLLOWERS_COUNT:
+        time.sleep(POLL_INTERVAL_SECONDS)
+    return response_json
+
+
+async def respond_slowly(
+    sent_requests: list[httpx.Request],
+    response_json: dict,
+    request: httpx.Request,
+) -> httpx.Response:
+    sent_requests.append(request)
+    await asyncio.sleep(POLL_INTERVAL_SECONDS)
+    return httpx.Response(HTTPStatus.OK, json=response_json)
+
+
+async def count_concurrently(async_hunter_client: AsyncHunterClient, domains: list[str]) -> list[dict]:
+    return await asyncio.gather(*[
+        async_hunter_client.email_counter.count_emails_by_domain(domain) for domain in domains
+    ])
+
+
+def fail_to_fetch(request_coalescer: RequestCoalescer, fetch_error: BaseException, followers_count: int = 0) -> None:
+    while request_coalescer.stats.followers < followers_count:
+        time.sleep(POLL_INTERVAL_SECONDS)
+    raise fetch_error
+
+
+def test_identical_requests_are_coalesced(
+    requests_mocker: requests_mock.Mocker,
+    email_verification_successful_response: dict,
+) -> None:
+    request_coalescer = RequestCoalescer()
+    requests_mocker.get(
+        'https://api.hunter.io/v2/email-verifier?email=test@example.com',
+        json=partial(respond_once_followers_wait, request_coalescer, email_verification_successful_response),
+    )
+    hunter_client = HunterClient(api_key='not_really_an_api_key', request_coalescer=request_coalescer)
+
+    with ThreadPoolExecutor(max_workers=FOLLOWERS_COUNT + 1) as executor:
+        responses = list(executor.map(
+            lambda _: hunter_client.email_verifier.check_if_email_is_valid('test@example.com'),
+            range(FOLLOWERS_COUNT + 1),
+        ))
+
+    assert requests_mocker.call_count == 1
+    assert all(response is responses[0] for response in responses)
+    assert responses[0] == email_verification_successful_response
+
+
+def test_coalesced_failures_are_shared_not_cached() -> None:
+    request_coalescer = RequestCoalescer()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        aborted_fetch = partial(fail_to_fetch, request_coalescer, KeyboardInterrupt(), followers_count=1)
+        leader = executor.submit(request_coalescer.coalesce, 'key', aborted_fetch)
+        while request_coalescer.stats.leaders < 1:
+            time.sleep(POLL_INTERVAL_SECONDS)
+        with pytest.raises(KeyboardInterrupt):
+            request_coalescer.coalesce('key', partial(fail_to_fetch, request_coalescer, LookupError('boom')))
+    with pytest.raises(KeyboardInterrupt):
+        leader.result()
+
+    with pytest.raises(LookupError, match='boom'):
+        request_coalescer.coalesce('key', partial(fail_to_fetch, request_coalescer, LookupError('boom')))
+    assert request_coalescer.coalesce('key', lambda: 'recovered') == 'recovered'
+
+
+def test_async_identical_requests_are_coalesced(email_count_successful_response: dict) -> None:
+    sent_requests: list[httpx.Request] = []
+    request_coalescer = AsyncRequestCoalescer()
+    async_hunter_client = AsyncHunterClient(
+        api_key='not_really_an_api_key',
+        http_session=httpx.AsyncClient(
+            transport=httpx.MockTransport(partial(respond_slowly, sent_requests, email_count_successful_response)),
+        ),
+        request_coalescer=request_coalescer,
+    )
+    domains = ['example.com' for _ in range(FOLLOWERS_COUNT + 1)]
+
+    responses = asyncio.run(count_concurrently(async_hunter_client, domains))
+
+    assert len(sent_requests) == 1
+    assert responses == [email_count_successful_response for _ in domains]
+    assert request_coalescer.stats.followers == FOLLOWERS_COUNT
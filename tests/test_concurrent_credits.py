@@ -0,0 +1,68 @@
+import re
+import threading
+import time
+from datetime import timedelta
+from http import HTTPStatus
+
+import requests_mock
+
+from hunter_client.client import CallPriority, CreditBudget, CreditTracker, HunterClient, call_priority
+from hunter_client.services.email_validation import PersistentEmailValidationService
+from hunter_client.storages.dummy import DummyStorage
+
+POLL_INTERVAL_SECONDS = 0.001
+
+
+def test_in_flight_reservations_defer_calls() -> None:
+    per_minute_budget = CreditBudget(2, timedelta(minutes=1))
+    credit_tracker = CreditTracker([per_minute_budget], max_deferral=timedelta(minutes=5))
+    in_flight_reservation = credit_tracker.admit('/domain-search')
+    admitted_reservations = []
+    deferred_call = threading.Thread(
+        target=lambda: admitted_reservations.append(credit_tracker.admit('/domain-search')),
+    )
+
+    deferred_call.start()
+    while credit_tracker.stats.deferrals < 1 and deferred_call.is_alive():
+        time.sleep(POLL_INTERVAL_SECONDS)
+    credit_tracker.settle(in_flight_reservation, HTTPStatus.INTERNAL_SERVER_ERROR)
+    deferred_call.join()
+
+    assert len(admitted_reservations) == 1
+    assert credit_tracker.stats.rejections == 0
+
+
+def test_domain_search_prefetch_keeps_priority(
+    requests_mocker: requests_mock.Mocker,
+    domain_search_successful_response: dict,
+) -> None:
+    requests_mocker.get(re.compile('/v2/domain-search'), json=domain_search_successful_response)
+    credit_tracker = CreditTracker([CreditBudget.per_job(1)])
+    hunter_client = HunterClient(api_key='not_really_an_api_key', credit_tracker=credit_tracker)
+
+    with call_priority(CallPriority.HIGH):
+        emails = list(
+            hunter_client.domain_searcher.iterate_emails_by_domain('example.com', max_results=1, prefetch=True),
+        )
+
+    assert len(emails) == 1
+    assert credit_tracker.stats.spent == 1
+
+
+def test_bulk_validation_keeps_priority(
+    requests_mocker: requests_mock.Mocker,
+    email_verification_successful_response: dict,
+) -> None:
+    requests_mocker.get(re.compile('/v2/email-verifier'), json=email_verification_successful_response)
+    credit_tracker = CreditTracker([CreditBudget.per_job(0.5)])
+    validation_service = PersistentEmailValidationService(
+        'not_really_an_api_key',
+        DummyStorage[str, bool](),
+        hunter_client=HunterClient(api_key='not_really_an_api_key', credit_tracker=credit_tracker),
+    )
+
+    with call_priority(CallPriority.HIGH):
+        validation_results = list(validation_service.validate_many(['john@example.com']))
+
+    assert validation_results == [('john@example.com', True)]
+    assert credit_tracker.stats.spent_by_endpoint == {'/email-verifier': 0.5}
@@ -0,0 +1,148 @@
+import asyncio
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+import requests
+import requests_mock
+
+from hunter_client.client import AsyncHunterClient, HunterClient
+from hunter_client.client.credits import (
+    CallPriority,
+    CreditBudget,
+    CreditBudgetExceededError,
+    CreditTracker,
+    call_priority,
+)
+from tests.fakes import FakeClock
+
+DOMAIN_SEARCH_URL = 'https://api.hunter.io/v2/domain-search?domain=example.com'
+VERIFIER_URL = 'https://api.hunter.io/v2/email-verifier?email=test@example.com'
+
+
+def search_example_domain(hunter_client: HunterClient) -> None:
+    hunter_client.domain_searcher.search_emails_by_domain('example.com')
+
+
+def test_spent_credits_are_counted_per_endpoint(
+    requests_mocker: requests_mock.Mocker,
+    domain_search_successful_response: dict,
+    email_verification_successful_response: dict,
+    email_count_successful_response: dict,
+) -> None:
+    requests_mocker.get(DOMAIN_SEARCH_URL, json=domain_search_successful_response)
+    requests_mocker.get(VERIFIER_URL, json=email_verification_successful_response)
+    requests_mocker.get('https://api.hunter.io/v2/email-count?domain=example.com', json=email_count_successful_response)
+    credit_tracker = CreditTracker()
+    hunter_client = HunterClient(api_key='not_really_an_api_key', credit_tracker=credit_tracker)
+
+    search_example_domain(hunter_client)
+    hunter_client.email_verifier.check_if_email_is_valid('test@example.com')
+    hunter_client.email_verifier.check_if_email_is_valid('test@example.com')
+    hunter_client.email_counter.count_emails_by_domain('example.com')
+
+    assert credit_tracker.stats.spent_by_endpoint == {'/domain-search': 1, '/email-verifier': 1, '/email-count': 0}
+    assert credit_tracker.stats.spent == 2
+
+
+def test_failed_calls_are_refunded(
+    requests_mocker: requests_mock.Mocker,
+    domain_search_successful_response: dict,
+) -> None:
+    requests_mocker.get(
+        DOMAIN_SEARCH_URL,
+        [{'status_code': HTTPStatus.TOO_MANY_REQUESTS}, {'json': domain_search_successful_response}],
+    )
+    budget = CreditBudget.per_job(1)
+    credit_tracker = CreditTracker([budget], priority_shares=dict.fromkeys(CallPriority, 1))
+    hunter_client = HunterClient(api_key='not_really_an_api_key', credit_tracker=credit_tracker)
+
+    with pytest.raises(requests.HTTPError):
+        search_example_domain(hunter_client)
+    hunter_client.domain_searcher.search_domain('example.com')
+
+    assert credit_tracker.remaining_credits() == {budget: 0}
+    assert credit_tracker.stats.spent == 1
+
+
+def test_low_priority_leaves_headroom(
+    requests_mocker: requests_mock.Mocker,
+    domain_search_successful_response: dict,
+) -> None:
+    requests_mocker.get(DOMAIN_SEARCH_URL, json=domain_search_successful_response)
+    credit_tracker = CreditTracker([CreditBudget.per_job(4)])
+    hunter_client = HunterClient(api_key='not_really_an_api_key', credit_tracker=credit_tracker)
+
+    with call_priority(CallPriority.LOW):
+        for _ in range(3):
+            search_example_domain(hunter_client)
+        with pytest.raises(CreditBudgetExceededError, match='do not allow a low priority call of /domain-search'):
+            search_example_domain(hunter_client)
+    with call_priority(CallPriority.HIGH):
+        search_example_domain(hunter_client)
+
+    assert requests_mocker.call_count == 4
+    assert credit_tracker.stats.rejections == 1
+
+
+def test_calls_are_deferred_until_credits_free_up(
+    requests_mocker: requests_mock.Mocker,
+    domain_search_successful_response: dict,
+    fake_clock: FakeClock,
+) -> None:
+    requests_mocker.get(DOMAIN_SEARCH_URL, json=domain_search_successful_response)
+    credit_tracker = CreditTracker(
+        [CreditBudget.hourly(2)],
+        max_deferral=timedelta(hours=1),
+        clock=fake_clock,
+        sleep=fake_clock.sleep,
+    )
+    hunter_client = HunterClient(api_key='not_really_an_api_key', credit_tracker=credit_tracker)
+
+    with call_priority(CallPriority.HIGH):
+        for elapsed_minutes in (0, 10, 20):
+            fake_clock.now = max(fake_clock.now, timedelta(minutes=elapsed_minutes).total_seconds())
+            search_example_domain(hunter_client)
+
+    assert fake_clock.sleeps == [timedelta(minutes=40).total_seconds()]  # noqa: WPS432
+    assert credit_tracker.stats.deferrals == 1
+
+
+def test_calls_deferred_for_too_long_are_rejected(
+    requests_mocker: requests_mock.Mocker,
+    domain_search_successful_response: dict,
+    fake_clock: FakeClock,
+) -> None:
+    requests_mocker.get(DOMAIN_SEARCH_URL, json=domain_search_successful_response)
+    credit_tracker = CreditTracker(
+        [CreditBudget.daily(1)],
+        max_deferral=timedelta(hours=1),
+        clock=fake_clock,
+        sleep=fake_clock.sleep,
+    )
+    hunter_client = HunterClient(api_key='not_really_an_api_key', credit_tracker=credit_tracker)
+
+    with call_priority(CallPriority.HIGH):
+        hunter_client.domain_searcher.search_domain('example.com')
+        with pytest.raises(CreditBudgetExceededError):
+            search_example_domain(hunter_client)
+
+    assert requests_mocker.call_count == 1
+    assert not fake_clock.sleeps
+
+
+def test_async_client_enforces_credit_budgets(
+    async_hunter_client: AsyncHunterClient,
+    async_mocked_responses: dict[str, dict],
+    domain_search_successful_response: dict,
+) -> None:
+    async_mocked_responses[DOMAIN_SEARCH_URL] = domain_search_successful_response
+    credit_tracker = CreditTracker([CreditBudget.per_job(1)])
+    async_hunter_client.credit_tracker = credit_tracker
+
+    with call_priority(CallPriority.HIGH):
+        asyncio.run(async_hunter_client.domain_searcher.search_emails_by_domain('example.com'))
+        with pytest.raises(CreditBudgetExceededError):
+            asyncio.run(async_hunter_client.domain_searcher.search_emails_by_domain('example.com'))
+
+    assert credit_tracker.stats.spent_by_endpoint == {'/domain-search': 1}
@@ -0,0 +1,78 @@
+import re
+
+import pytest
+import requests_mock
+
+from hunter_client.services.domain_cache import DomainAttributes, DomainAttributesCache
+from hunter_client.services.email_validation import PersistentEmailValidationService
+from hunter_client.services.response_models import DomainSearcherResponse, EmailVerifierResponse
+from hunter_client.storages.dummy import DummyStorage
+from tests.fakes import FakeClock
+
+ANY_VERIFIER_URL = re.compile('/v2/email-verifier')
+DAY_IN_SECONDS = 86400
+
+
+@pytest.fixture
+def domain_cache(fake_clock: FakeClock) -> DomainAttributesCache:
+    return DomainAttributesCache(DummyStorage[str, DomainAttributes](), clock=fake_clock)
+
+
+@pytest.mark.parametrize('domain_facts', [{'disposable': True}, {'mx_records': False}])
+def test_ruled_out_domain_is_resolved_locally(
+    requests_mocker: requests_mock.Mocker,
+    dummy_emails_validity_storage: DummyStorage[str, bool],
+    email_verification_successful_response: dict,
+    domain_cache: DomainAttributesCache,  # noqa: WPS442
+    domain_facts: dict,
+) -> None:
+    email_verification_successful_response['data'].update(status='invalid', **domain_facts)
+    requests_mocker.get(ANY_VERIFIER_URL, json=email_verification_successful_response)
+    validation_service = PersistentEmailValidationService(
+        'not_really_an_api_key',
+        dummy_emails_validity_storage,
+        domain_cache=domain_cache,
+    )
+    emails = ['john@Example.com', 'jane@example.com', 'paul@example.com']
+
+    validation_results = list(validation_service.validate_many(emails, max_concurrency=1))
+
+    assert validation_results == [(email, False) for email in emails]
+    assert requests_mocker.call_count == 1
+    assert dummy_emails_validity_storage.get('paul@example.com') is False
+    assert (domain_cache.stats.hits, domain_cache.stats.misses) == (2, 1)
+
+
+def test_domain_facts_are_merged_and_expire(
+    fake_clock: FakeClock,
+    domain_cache: DomainAttributesCache,  # noqa: WPS442
+    domain_search_successful_response: dict,
+    email_verification_successful_response: dict,
+) -> None:
+    email_verification_successful_response['data']['mx_records'] = False
+    verifier_response = EmailVerifierResponse.model_validate(email_verification_successful_response)
+    domain_cache.remember_verification('example.com', verifier_response.data)
+    domain_cache.remember_domain_search(DomainSearcherResponse.model_validate(domain_search_successful_response).data)
+
+    assert domain_cache.local_verdict('example.com') is False
+    fake_clock.now = DAY_IN_SECONDS
+    assert domain_cache.attributes('example.com') is None
+    assert domain_cache.local_verdict('example.com') is None
+
+
+def test_healthy_domain_is_verified_per_email(
+    requests_mocker: requests_mock.Mocker,
+    dummy_emails_validity_storage: DummyStorage[str, bool],
+    email_verification_successful_response: dict,
+    domain_cache: DomainAttributesCache,  # noqa: WPS442
+) -> None:
+    requests_mocker.get(ANY_VERIFIER_URL, json=email_verification_successful_response)
+    validation_service = PersistentEmailValidationService(
+        'not_really_an_api_key',
+        dummy_emails_validity_storage,
+        domain_cache=domain_cache,
+    )
+
+    assert validation_service.validate_and_store_email_status('john@example.com') is True
+    assert validation_service.validate_and_store_email_status('jane@example.com') is True
+    assert requests_mocker.call_count == 2
@@ -0,0 +1,58 @@
+import copy
+
+import requests_mock
+
+from hunter_client.client import HunterClient
+
+PAGE_SIZE = 1
+
+
+def register_pages(requests_mocker: requests_mock.Mocker, domain_search_response: dict) -> None:
+    for offset, email_info in enumerate(domain_search_response['data']['emails']):
+        page = copy.deepcopy(domain_search_response)
+        page['data']['emails'] = [email_info]
+        page['meta'].update(limit=PAGE_SIZE, offset=offset)
+        requests_mocker.get(
+            'https://api.hunter.io/v2/domain-search?domain=example.com&limit={0}&offset={1}'.format(PAGE_SIZE, offset),
+            json=page,
+        )
+
+
+def test_iterate_emails_by_domain(
+    hunter_client: HunterClient,
+    requests_mocker: requests_mock.Mocker,
+    domain_search_successful_response: dict,
+) -> None:
+    register_pages(requests_mocker, domain_search_successful_response)
+
+    emails = hunter_client.domain_searcher.iterate_emails_by_domain('example.com', page_size=PAGE_SIZE)
+
+    assert [email_info.value for email_info in emails] == ['contact@example.com', 'info@example.com']
+    assert requests_mocker.call_count == 2
+
+
+def test_iterate_emails_by_domain_stops_early(
+    hunter_client: HunterClient,
+    requests_mocker: requests_mock.Mocker,
+    domain_search_successful_response: dict,
+) -> None:
+    register_pages(requests_mocker, domain_search_successful_response)
+
+    emails = hunter_client.domain_searcher.iterate_emails_by_domain('example.com', page_size=PAGE_SIZE)
+
+    assert next(emails).value == 'contact@example.com'
+    emails.close()
+    assert requests_mocker.call_count == 1
+
+
+def test_iterate_emails_by_domain_max_results(
+    hunter_client: HunterClient,
+    requests_mocker: requests_mock.Mocker,
+    domain_search_successful_response: dict,
+) -> None:
+    register_pages(requests_mocker, domain_search_successful_response)
+
+    emails = hunter_client.domain_searcher.iterate_emails_by_domain('example.com', page_size=PAGE_SIZE, max_results=1)
+
+    assert [email_info.value for email_info in emails] == ['contact@example.com']
+    assert requests_mocker.call_count == 1
@@ -0,0 +1,150 @@
+import re
+from http import HTTPStatus
+
+import pytest
+import requests
+import requests_mock
+
+from hunter_client.client import CreditBudget, CreditTracker, HunterClient
+from hunter_client.client.credits import CreditBudgetExceededError
+from hunter_client.services.email_validation import PersistentEmailValidationService
+from hunter_client.services.job_queue import JobClass, QueueFullError, ValidationJobQueue
+from hunter_client.storages.dummy import DummyStorage
+from tests.fakes import GatedResponse
+
+ANY_VERIFIER_URL = re.compile('/v2/email-verifier')
+VERIFIER_URL = 'https://api.hunter.io/v2/email-verifier?email={0}'
+
+
+def test_futures_resolve_to_verdicts(
+    requests_mocker: requests_mock.Mocker,
+    persistent_email_validation_service: PersistentEmailValidationService,
+    email_verification_successful_response: dict,
+) -> None:
+    requests_mocker.get(ANY_VERIFIER_URL, json=email_verification_successful_response)
+
+    with ValidationJobQueue(persistent_email_validation_service, workers=2) as job_queue:
+        interactive_job = job_queue.submit('user@example.com', JobClass.INTERACTIVE)
+        batch_jobs = [job_queue.submit('bulk{0}@example.com'.format(index)) for index in range(3)]
+
+    assert interactive_job.result()
+    assert all(batch_job.result() for batch_job in batch_jobs)
+
+
+def test_interactive_jobs_jump_the_queue(
+    requests_mocker: requests_mock.Mocker,
+    persistent_email_validation_service: PersistentEmailValidationService,
+    email_verification_successful_response: dict,
+) -> None:
+    gated_response = GatedResponse(email_verification_successful_response)
+    requests_mocker.get(ANY_VERIFIER_URL, json=gated_response)
+
+    with ValidationJobQueue(persistent_email_validation_service, workers=1, interactive_workers=0) as job_queue:
+        job_queue.submit('first@example.com')
+        gated_response.started.wait(timeout=5)
+        job_queue.submit('bulk@example.com')
+        job_queue.submit('user@example.com', JobClass.INTERACTIVE)
+        gated_response.released.set()
+
+    validated_emails = [request.qs['email'][0] for request in requests_mocker.request_history]
+    assert validated_emails == ['first@example.com', 'user@example.com', 'bulk@example.com']
+
+
+def test_full_queue_pushes_back_on_producers(
+    requests_mocker: requests_mock.Mocker,
+    persistent_email_validation_service: PersistentEmailValidationService,
+    email_verification_successful_response: dict,
+) -> None:
+    gated_response = GatedResponse(email_verification_successful_response)
+    requests_mocker.get(ANY_VERIFIER_URL, json=gated_response)
+
+    job_queue = ValidationJobQueue(
+        persistent_email_validation_service,
+        workers=1,
+        interactive_workers=0,
+        max_queued_batch=1,
+    )
+    with job_queue:
+        job_queue.submit('first@example.com')
+        gated_response.started.wait(timeout=5)
+        job_queue.submit('second@example.com')
+        with pytest.raises(QueueFullError, match='queue of batch validation jobs is full'):
+            job_queue.submit('third@example.com', timeout=0)
+        gated_response.released.set()
+
+    assert requests_mocker.call_count == 2
+
+
+def test_failures_are_set_on_futures(
+    requests_mocker: requests_mock.Mocker,
+    persistent_email_validation_service: PersistentEmailValidationService,
+) -> None:
+    requests_mocker.get(ANY_VERIFIER_URL, status_code=HTTPStatus.BAD_REQUEST)
+
+    with ValidationJobQueue(persistent_email_validation_service, workers=2) as job_queue:
+        failed_job = job_queue.submit('malformed')
+
+    assert isinstance(failed_job.exception(), requests.HTTPError)
+
+
+def test_shutdown_can_cancel_queued_jobs(
+    requests_mocker: requests_mock.Mocker,
+    persistent_email_validation_service: PersistentEmailValidationService,
+    email_verification_successful_response: dict,
+) -> None:
+    gated_response = GatedResponse(email_verification_successful_response)
+    requests_mocker.get(ANY_VERIFIER_URL, json=gated_response)
+    job_queue = ValidationJobQueue(persistent_email_validation_service, workers=1, interactive_workers=0)
+
+    running_job = job_queue.submit('first@example.com')
+    gated_response.started.wait(timeout=5)
+    queued_job = job_queue.submit('second@example.com')
+    job_queue.shutdown(wait=False, cancel_queued=True)
+    gated_response.released.set()
+    job_queue.shutdown()
+
+    assert running_job.result()
+    assert queued_job.cancelled()
+
+
+def test_interactive_workers_skip_batch_jobs(
+    requests_mocker: requests_mock.Mocker,
+    persistent_email_validation_service: PersistentEmailValidationService,
+    email_verification_successful_response: dict,
+) -> None:
+    gated_response = GatedResponse(email_verification_successful_response)
+    requests_mocker.get(VERIFIER_URL.format('bulk@example.com'), json=gated_response)
+    requests_mocker.get(VERIFIER_URL.format('user@example.com'), json=email_verification_successful_response)
+
+    with ValidationJobQueue(persistent_email_validation_service, workers=2, interactive_workers=1) as job_queue:
+        batch_jobs = [job_queue.submit('bulk@example.com') for _ in range(2)]
+        interactive_job = job_queue.submit('user@example.com', JobClass.INTERACTIVE)
+        is_interactive_job_valid = interactive_job.result(timeout=5)
+        gated_response.released.set()
+
+    assert is_interactive_job_valid
+    assert not any(batch_job.exception() for batch_job in batch_jobs)
+
+
+def test_job_classes_spend_credits_by_priority(
+    requests_mocker: requests_mock.Mocker,
+    email_verification_successful_response: dict,
+) -> None:
+    requests_mocker.get(ANY_VERIFIER_URL, json=email_verification_successful_response)
+    validation_service = PersistentEmailValidationService(
+        hunter_api_key='not_really_an_api_key',
+        results_storage=DummyStorage[str, bool](),
+        hunter_client=HunterClient(
+            api_key='not_really_an_api_key',
+            credit_tracker=CreditTracker([CreditBudget.per_job(1)]),
+        ),
+    )
+
+    with ValidationJobQueue(validation_service, workers=1, interactive_workers=0) as job_queue:
+        batch_jobs = [job_queue.submit('bulk{0}@example.com'.format(index)) for index in range(2)]
+        batch_errors = [batch_job.exception() for batch_job in batch_jobs]
+        interactive_job = job_queue.submit('user@example.com', JobClass.INTERACTIVE)
+
+    assert batch_errors[0] is None
+    assert isinstance(batch_errors[1], CreditBudgetExceededError)
+    assert interactive_job.result()
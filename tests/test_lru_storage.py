@@ -0,0 +1,64 @@
+from datetime import timedelta
+
+from hunter_client.storages.lru import LRUStorage, LRUStorageStats
+from tests.fakes import FakeClock
+
+
+def test_lru_storage_evicts_least_recently_used() -> None:
+    lru_storage = LRUStorage[str, bool](max_entries=2)
+
+    lru_storage.set('first@itch.io', value_to_store=True)
+    lru_storage.set('second@itch.io', value_to_store=False)
+    assert lru_storage.get('first@itch.io') is True
+    lru_storage.set('third@itch.io', value_to_store=True)
+
+    assert lru_storage.get('second@itch.io') is None
+    assert lru_storage.get('first@itch.io') is True
+    assert len(lru_storage) == 2
+    assert lru_storage.stats == LRUStorageStats(hits=2, misses=1, evictions=1, expirations=0)
+
+
+def test_lru_storage_expires_entries() -> None:
+    clock = FakeClock()
+    default_ttl = timedelta(minutes=1)
+    lru_storage = LRUStorage[str, bool](max_entries=10, ttl=default_ttl, clock=clock)
+
+    lru_storage.set('default-ttl@itch.io', value_to_store=True)
+    lru_storage.set('short-ttl@itch.io', value_to_store=True, ttl=timedelta(seconds=10))
+    clock.now = 30
+
+    assert lru_storage.get('short-ttl@itch.io') is None
+    assert lru_storage.get('default-ttl@itch.io') is True
+
+    clock.now = 90
+    assert lru_storage.get('default-ttl@itch.io') is None
+    assert lru_storage.stats.expirations == 2
+
+    lru_storage.set('deleted@itch.io', value_to_store=False)
+    lru_storage.delete('deleted@itch.io')
+    assert lru_storage.get('deleted@itch.io') is None
+
+
+def test_lru_storage_default_batch_operations() -> None:
+    lru_storage = LRUStorage[str, bool](max_entries=10)
+
+    lru_storage.set_many({'ceo@itch.io': True, 'john@itch.io': False})
+    assert lru_storage.get_many(['ceo@itch.io', 'john@itch.io', 'nobody@itch.io']) == {
+        'ceo@itch.io': True,
+        'john@itch.io': False,
+    }
+
+    lru_storage.delete_many(['ceo@itch.io'])
+    assert not lru_storage.get_many(['ceo@itch.io'])
+
+
+def test_lru_storage_zero_ttl_expires_at_once() -> None:
+    clock = FakeClock()
+    default_ttl = timedelta(minutes=1)
+    lru_storage = LRUStorage[str, bool](max_entries=10, ttl=default_ttl, clock=clock)
+
+    zero_ttl = timedelta(0)
+    lru_storage.set('expired@itch.io', value_to_store=True, ttl=zero_ttl)
+
+    assert lru_storage.get('expired@itch.io') is None
+    assert lru_storage.stats.expirations == 1
@@ -0,0 +1,103 @@
+import asyncio
+import json
+from http import HTTPStatus
+
+import pytest
+import requests
+import requests_mock
+
+from hunter_client.client import AsyncHunterClient, HunterClient, InProcessMetrics, render_prometheus_text
+from hunter_client.client.metrics import EndpointMetrics, LatencyHistogram
+from tests.fakes import ScriptedClock
+
+EMAIL_COUNT_URL = 'https://api.hunter.io/v2/email-count?domain=example.com'
+VERIFIER_URL = 'https://api.hunter.io/v2/email-verifier?email=test@example.com'
+ERROR_BODY = b'{"errors": [{"id": "authentication_failed"}]}'
+LATENCY_BUCKETS = (0.1, 1)
+
+
+def test_metrics_are_recorded_per_endpoint(
+    requests_mocker: requests_mock.Mocker,
+    email_count_successful_response: dict,
+) -> None:
+    email_count_body = json.dumps(email_count_successful_response).encode()
+    requests_mocker.get(EMAIL_COUNT_URL, content=email_count_body)
+    requests_mocker.get(VERIFIER_URL, status_code=HTTPStatus.UNAUTHORIZED, content=ERROR_BODY)
+    metrics = InProcessMetrics(LATENCY_BUCKETS, clock=ScriptedClock(0, 0.0625, 1, 1.5, 2, 4))  # noqa: WPS432
+    hunter_client = HunterClient(api_key='not_really_an_api_key', metrics=metrics)
+
+    hunter_client.email_counter.count_emails_by_domain('example.com')
+    hunter_client.email_counter.count_emails_by_domain('example.com')
+    with pytest.raises(requests.HTTPError):
+        hunter_client.email_verifier.check_if_email_is_valid('test@example.com')
+
+    assert metrics.snapshot() == {
+        '/email-count': EndpointMetrics(
+            requests=2,
+            responses_by_status={HTTPStatus.OK: 2},
+            received_bytes=2 * len(email_count_body),
+            latency=LatencyHistogram(LATENCY_BUCKETS, bucket_counts=[1, 1, 0], total=0.5625, count=2),  # noqa: WPS432
+        ),
+        '/email-verifier': EndpointMetrics(
+            requests=1,
+            responses_by_status={HTTPStatus.UNAUTHORIZED: 1},
+            received_bytes=len(ERROR_BODY),
+            latency=LatencyHistogram(LATENCY_BUCKETS, bucket_counts=[0, 0, 1], total=2, count=1),
+        ),
+    }
+
+
+def test_transport_errors_are_recorded(requests_mocker: requests_mock.Mocker) -> None:
+    requests_mocker.get(EMAIL_COUNT_URL, exc=requests.ConnectionError)
+    metrics = InProcessMetrics(LATENCY_BUCKETS, clock=ScriptedClock(0, 0.5))
+    hunter_client = HunterClient(api_key='not_really_an_api_key', metrics=metrics)
+
+    with pytest.raises(requests.ConnectionError):
+        hunter_client.email_counter.count_emails_by_domain('example.com')
+
+    assert metrics.snapshot()['/email-count'] == EndpointMetrics(
+        requests=1,
+        failures=1,
+        latency=LatencyHistogram(LATENCY_BUCKETS, bucket_counts=[0, 1, 0], total=0.5, count=1),
+    )
+
+
+def test_async_client_records_metrics(
+    async_hunter_client: AsyncHunterClient,
+    async_mocked_responses: dict[str, dict],
+    email_verification_successful_response: dict,
+) -> None:
+    async_mocked_responses[VERIFIER_URL] = email_verification_successful_response
+    metrics = InProcessMetrics()
+    async_hunter_client.metrics = metrics
+
+    asyncio.run(async_hunter_client.email_verifier.check_if_email_is_valid('test@example.com'))
+
+    verifier_metrics = metrics.snapshot()['/email-verifier']
+    assert verifier_metrics.responses_by_status == {HTTPStatus.OK: 1}
+    assert verifier_metrics.received_bytes > 0
+    assert verifier_metrics.in_flight == 0
+
+
+def test_metrics_are_rendered_for_prometheus(
+    requests_mocker: requests_mock.Mocker,
+    email_count_successful_response: dict,
+) -> None:
+    requests_mocker.get(EMAIL_COUNT_URL, json=email_count_successful_response)
+    metrics = InProcessMetrics(LATENCY_BUCKETS, clock=ScriptedClock(0, 0.5))
+    hunter_client = HunterClient(api_key='not_really_an_api_key', metrics=metrics)
+
+    hunter_client.email_counter.count_emails_by_domain('example.com')
+
+    assert set(render_prometheus_text(metrics).splitlines()) >= {
+        '# TYPE hunter_client_requests_total counter',
+        'hunter_client_requests_total{endpoint="/email-count"} 1',
+        'hunter_client_responses_total{endpoint="/email-count",status="200"} 1',
+        '# TYPE hunter_client_request_duration_seconds histogram',
+        'hunter_client_request_duration_seconds_bucket{endpoint="/email-count",le="0.1"} 0',
+        'hunter_client_request_duration_seconds_bucket{endpoint="/email-count",le="1.0"} 1',
+        'hunter_client_request_duration_seconds_bucket{endpoint="/email-count",le="+Inf"} 1',
+        'hunter_client_request_duration_seconds_sum{endpoint="/email-count"} 0.5',
+        'hunter_client_request_duration_seconds_count{endpoint="/email-count"} 1',
+        'hunter_client_requests_in_flight{endpoint="/email-count"} 0',
+    }
@@ -0,0 +1,118 @@
+import re
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+import requests
+import requests_mock
+
+from hunter_client.services.domain_harvesting import PersistentDomainHarvestingService
+from hunter_client.services.email_validation import PersistentEmailValidationService
+from hunter_client.services.negative_cache import KnownBadInputError, NegativeResult, NegativeResultCache
+from hunter_client.storages.dummy import DummyStorage
+from tests.fakes import FakeClock
+
+MALFORMED_EMAIL_URL = 'https://api.hunter.io/v2/email-verifier?email=malformed'
+
+
+@pytest.fixture
+def negative_cache(fake_clock: FakeClock) -> NegativeResultCache:  # noqa: WPS442
+    negative_results_storage = DummyStorage[str, NegativeResult]()
+    return NegativeResultCache(negative_results_storage, ttl=timedelta(minutes=10), clock=fake_clock)
+
+
+@pytest.fixture
+def service_with_negative_cache(
+    dummy_emails_validity_storage: DummyStorage[str, bool],
+    negative_cache: NegativeResultCache,  # noqa: WPS442
+) -> PersistentEmailValidationService:
+    return PersistentEmailValidationService(
+        hunter_api_key='not_really_an_api_key',
+        results_storage=dummy_emails_validity_storage,
+        negative_cache=negative_cache,
+    )
+
+
+def test_rejected_email_fails_fast(
+    requests_mocker: requests_mock.Mocker,
+    service_with_negative_cache: PersistentEmailValidationService,  # noqa: WPS442
+    negative_cache: NegativeResultCache,  # noqa: WPS442
+    dummy_emails_validity_storage: DummyStorage[str, bool],
+) -> None:
+    requests_mocker.get(MALFORMED_EMAIL_URL, status_code=HTTPStatus.BAD_REQUEST)
+
+    with pytest.raises(requests.HTTPError):
+        service_with_negative_cache.validate_and_store_email_status('malformed')
+    with pytest.raises(KnownBadInputError, match='rejected by the Hunter API with status 400'):
+        service_with_negative_cache.validate_and_store_email_status('malformed')
+
+    assert requests_mocker.call_count == 1
+    assert (negative_cache.stats.hits, negative_cache.stats.misses) == (1, 1)
+    assert dummy_emails_validity_storage.get('malformed') is None
+
+
+def test_rejected_domain_fails_fast(
+    requests_mocker: requests_mock.Mocker,
+    negative_cache: NegativeResultCache,  # noqa: WPS442
+    dummy_emails_by_domain_storage: DummyStorage[str, list[str]],
+) -> None:
+    requests_mocker.get(re.compile('/v2/domain-search'), status_code=HTTPStatus.BAD_REQUEST)
+    harvesting_service = PersistentDomainHarvestingService(
+        'not_really_an_api_key',
+        dummy_emails_by_domain_storage,
+        negative_cache=negative_cache,
+    )
+
+    with pytest.raises(requests.HTTPError):
+        harvesting_service.harvest_and_store_domain_emails('nonexistent.example')
+    with pytest.raises(KnownBadInputError):
+        list(harvesting_service.harvest_many(['nonexistent.example']))
+
+    assert requests_mocker.call_count == 1
+
+
+def test_rejection_expires(
+    requests_mocker: requests_mock.Mocker,
+    service_with_negative_cache: PersistentEmailValidationService,  # noqa: WPS442
+    fake_clock: FakeClock,  # noqa: WPS442
+) -> None:
+    requests_mocker.get(MALFORMED_EMAIL_URL, status_code=HTTPStatus.UNPROCESSABLE_ENTITY)
+
+    with pytest.raises(requests.HTTPError):
+        service_with_negative_cache.validate_and_store_email_status('malformed')
+    fake_clock.now = timedelta(minutes=10).total_seconds()
+    with pytest.raises(requests.HTTPError):
+        service_with_negative_cache.validate_and_store_email_status('malformed')
+
+    assert requests_mocker.call_count == 2
+
+
+@pytest.mark.parametrize('status_code', [HTTPStatus.UNAUTHORIZED, HTTPStatus.TOO_MANY_REQUESTS])
+def test_account_errors_are_not_cached(
+    requests_mocker: requests_mock.Mocker,
+    service_with_negative_cache: PersistentEmailValidationService,  # noqa: WPS442
+    status_code: HTTPStatus,
+) -> None:
+    requests_mocker.get(MALFORMED_EMAIL_URL, status_code=status_code)
+
+    for _ in range(2):
+        with pytest.raises(requests.HTTPError):
+            service_with_negative_cache.validate_and_store_email_status('malformed')
+
+    assert requests_mocker.call_count == 2
+
+
+def test_forced_refresh_bypasses_negative_cache(
+    requests_mocker: requests_mock.Mocker,
+    service_with_negative_cache: PersistentEmailValidationService,  # noqa: WPS442
+    email_verification_successful_response: dict,
+) -> None:
+    requests_mocker.get(
+        'https://api.hunter.io/v2/email-verifier?email=valid@example.com',
+        [{'status_code': HTTPStatus.BAD_REQUEST}, {'json': email_verification_successful_response}],
+    )
+
+    with pytest.raises(requests.HTTPError):
+        service_with_negative_cache.validate_and_store_email_status('valid@example.com')
+
+    assert service_with_negative_cache.validate_and_store_email_status('valid@example.com', force_refresh=True)
@@ -0,0 +1,57 @@
+import pytest
+import requests_mock
+
+from hunter_client.client import HunterClient, RateLimiter
+from hunter_client.client.rate_limiting import TokenBucket
+from tests.fakes import FakeClock
+
+
+def test_token_bucket_paces_reservations() -> None:
+    clock = FakeClock()
+    token_bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+
+    delays = [token_bucket.reserve() for _ in range(4)]
+
+    assert delays == [0, 0, 0.5, 1]
+
+    clock.now = 3
+    assert token_bucket.reserve() == 0
+
+
+def test_token_bucket_rejects_non_positive_rate() -> None:
+    with pytest.raises(ValueError, match='must be positive'):
+        TokenBucket(rate=0)
+
+
+def test_rate_limiter_applies_all_budgets() -> None:
+    clock = FakeClock()
+    rate_limiter = RateLimiter(
+        requests_per_second=10,
+        endpoint_requests_per_second={'/email-verifier': 1},
+        clock=clock,
+    )
+
+    assert rate_limiter.reserve('/email-verifier') == 0
+    assert rate_limiter.reserve('/domain-search') == pytest.approx(0.1)
+    assert rate_limiter.reserve('/email-verifier') == pytest.approx(1)
+
+
+def test_client_requests_are_paced(
+    requests_mocker: requests_mock.Mocker,
+    email_count_successful_response: dict,
+) -> None:
+    requests_mocker.get(
+        'https://api.hunter.io/v2/email-count?domain=example.com',
+        json=email_count_successful_response,
+    )
+    clock = FakeClock()
+    hunter_client = HunterClient(
+        api_key='not_really_an_api_key',
+        rate_limiter=RateLimiter(requests_per_second=4, clock=clock, sleep=clock.sleep),
+    )
+
+    for _ in range(3):
+        hunter_client.email_counter.count_emails_by_domain('example.com')
+
+    assert clock.sleeps == [0.25, 0.25]
+    assert requests_mocker.call_count == 3
@@ -0,0 +1,126 @@
+import asyncio
+from datetime import timedelta
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+import requests
+import requests_mock
+
+from hunter_client.client import AsyncHunterClient, HunterClient, ResponseCache
+from hunter_client.client.response_cache import CachedResponse
+from hunter_client.storages.dummy import DummyStorage
+from hunter_client.storages.sqlite import SQLiteStorage
+from tests.fakes import FakeClock
+
+DOMAIN_SEARCH_URL = 'https://api.hunter.io/v2/domain-search?domain=example.com'
+VERIFIER_URL = 'https://api.hunter.io/v2/email-verifier?email=test@example.com'
+
+
+@pytest.fixture
+def response_cache(fake_clock: FakeClock) -> ResponseCache:  # noqa: WPS442
+    return ResponseCache(
+        DummyStorage[str, CachedResponse](),
+        endpoint_ttls={'/domain-search': timedelta(days=7)},
+        clock=fake_clock,
+    )
+
+
+def test_repeated_lookups_are_served_from_cache(
+    requests_mocker: requests_mock.Mocker,
+    domain_search_successful_response: dict,
+    response_cache: ResponseCache,  # noqa: WPS442
+) -> None:
+    requests_mocker.get(DOMAIN_SEARCH_URL, json=domain_search_successful_response)
+    hunter_client = HunterClient(api_key='not_really_an_api_key', response_cache=response_cache)
+
+    raw_response = hunter_client.domain_searcher.search_emails_by_domain('example.com')
+    typed_response = hunter_client.domain_searcher.search_domain('example.com')
+
+    assert raw_response == domain_search_successful_response
+    assert typed_response.data.domain == domain_search_successful_response['data']['domain']
+    assert requests_mocker.call_count == 1
+    assert (response_cache.stats.hits, response_cache.stats.misses) == (1, 1)
+
+
+def test_endpoints_without_ttl_are_not_cached(
+    requests_mocker: requests_mock.Mocker,
+    email_verification_successful_response: dict,
+    response_cache: ResponseCache,  # noqa: WPS442
+) -> None:
+    requests_mocker.get(VERIFIER_URL, json=email_verification_successful_response)
+    hunter_client = HunterClient(api_key='not_really_an_api_key', response_cache=response_cache)
+
+    for _ in range(2):
+        hunter_client.email_verifier.check_if_email_is_valid('test@example.com')
+
+    assert requests_mocker.call_count == 2
+
+
+def test_cached_responses_expire(
+    requests_mocker: requests_mock.Mocker,
+    domain_search_successful_response: dict,
+    response_cache: ResponseCache,  # noqa: WPS442
+    fake_clock: FakeClock,  # noqa: WPS442
+) -> None:
+    requests_mocker.get(DOMAIN_SEARCH_URL, json=domain_search_successful_response)
+    hunter_client = HunterClient(api_key='not_really_an_api_key', response_cache=response_cache)
+
+    hunter_client.domain_searcher.search_emails_by_domain('example.com')
+    fake_clock.now = timedelta(days=7).total_seconds()
+    hunter_client.domain_searcher.search_emails_by_domain('example.com')
+
+    assert requests_mocker.call_count == 2
+
+
+def test_failed_responses_are_not_cached(
+    requests_mocker: requests_mock.Mocker,
+    domain_search_successful_response: dict,
+    response_cache: ResponseCache,  # noqa: WPS442
+) -> None:
+    requests_mocker.get(
+        DOMAIN_SEARCH_URL,
+        [{'status_code': HTTPStatus.INTERNAL_SERVER_ERROR}, {'json': domain_search_successful_response}],
+    )
+    hunter_client = HunterClient(api_key='not_really_an_api_key', response_cache=response_cache)
+
+    with pytest.raises(requests.HTTPError):
+        hunter_client.domain_searcher.search_emails_by_domain('example.com')
+    hunter_client.domain_searcher.search_emails_by_domain('example.com')
+    hunter_client.domain_searcher.search_emails_by_domain('example.com')
+
+    assert requests_mocker.call_count == 2
+
+
+def test_responses_are_cached_persistently(
+    requests_mocker: requests_mock.Mocker,
+    email_count_successful_response: dict,
+    tmp_path: Path,
+) -> None:
+    requests_mocker.get(
+        'https://api.hunter.io/v2/email-count?domain=example.com',
+        json=email_count_successful_response,
+    )
+    database_path = tmp_path / 'responses.sqlite3'
+    for _ in range(2):
+        with SQLiteStorage[CachedResponse](database_path) as storage:
+            persistent_cache = ResponseCache(storage, default_ttl=timedelta(days=1))
+            hunter_client = HunterClient(api_key='not_really_an_api_key', response_cache=persistent_cache)
+            hunter_client.email_counter.count_emails_by_domain('example.com')
+
+    assert requests_mocker.call_count == 1
+
+
+def test_async_client_uses_response_cache(
+    async_hunter_client: AsyncHunterClient,
+    async_mocked_responses: dict[str, dict],
+    domain_search_successful_response: dict,
+    response_cache: ResponseCache,  # noqa: WPS442
+) -> None:
+    async_mocked_responses[DOMAIN_SEARCH_URL] = domain_search_successful_response
+    async_hunter_client.response_cache = response_cache
+
+    for _ in range(2):
+        asyncio.run(async_hunter_client.domain_searcher.search_emails_by_domain('example.com'))
+
+    assert (response_cache.stats.hits, response_cache.stats.misses) == (1, 1)
@@ -0,0 +1,104 @@
+import asyncio
+from datetime import timedelta
+from http import HTTPStatus
+
+import httpx
+import pytest
+import requests
+import requests_mock
+
+from hunter_client.client import AsyncHunterClient, HunterClient, RetryPolicy
+from tests.fakes import FakeClock
+
+
+@pytest.fixture
+def retry_policy(fake_clock: FakeClock) -> RetryPolicy:  # noqa: WPS442
+    return RetryPolicy(max_attempts=3, clock=fake_clock, sleep=fake_clock.sleep)
+
+
+def test_transient_failure_is_retried(
+    requests_mocker: requests_mock.Mocker,
+    email_count_successful_response: dict,
+    retry_policy: RetryPolicy,  # noqa: WPS442
+    fake_clock: FakeClock,  # noqa: WPS442
+) -> None:
+    requests_mocker.get(
+        'https://api.hunter.io/v2/email-count?domain=example.com',
+        [
+            {'status_code': HTTPStatus.SERVICE_UNAVAILABLE},
+            {'status_code': HTTPStatus.TOO_MANY_REQUESTS, 'headers': {'Retry-After': '2'}},
+            {'json': email_count_successful_response},
+        ],
+    )
+    hunter_client = HunterClient(api_key='not_really_an_api_key', retry_policy=retry_policy)
+
+    response = hunter_client.email_counter.count_emails_by_domain('example.com')
+
+    assert response == email_count_successful_response
+    assert fake_clock.sleeps[1] == 2
+    assert retry_policy.stats.retries == 2
+
+
+def test_retries_stop_after_max_attempts(
+    requests_mocker: requests_mock.Mocker,
+    retry_policy: RetryPolicy,  # noqa: WPS442
+) -> None:
+    requests_mocker.get(
+        'https://api.hunter.io/v2/email-count?domain=example.com',
+        status_code=HTTPStatus.BAD_GATEWAY,
+    )
+    hunter_client = HunterClient(api_key='not_really_an_api_key', retry_policy=retry_policy)
+
+    with pytest.raises(requests.HTTPError):
+        hunter_client.email_counter.count_emails_by_domain('example.com')
+
+    assert requests_mocker.call_count == 3
+    assert (retry_policy.stats.retries, retry_policy.stats.exhausted) == (2, 1)
+
+
+def test_retries_stop_at_deadline(fake_clock: FakeClock) -> None:  # noqa: WPS442
+    deadline_policy = RetryPolicy(max_attempts=10, max_elapsed=timedelta(seconds=5), clock=fake_clock)
+    throttled_response = httpx.Response(HTTPStatus.TOO_MANY_REQUESTS, headers={'Retry-After': '3'})
+
+    assert deadline_policy.next_delay('GET', throttled_response, attempt=1, started_at=0) == 3
+    fake_clock.now = 3
+    assert deadline_policy.next_delay('GET', throttled_response, attempt=2, started_at=0) is None
+
+
+def test_non_idempotent_retried_if_throttled(
+    retry_policy: RetryPolicy,  # noqa: WPS442
+) -> None:
+    unavailable_response = httpx.Response(HTTPStatus.SERVICE_UNAVAILABLE)
+    throttled_response = httpx.Response(HTTPStatus.TOO_MANY_REQUESTS, headers={'Retry-After': '1'})
+
+    assert retry_policy.next_delay('POST', unavailable_response, attempt=1, started_at=0) is None
+    assert retry_policy.next_delay('POST', throttled_response, attempt=1, started_at=0) == 1
+
+
+def test_retry_after_is_honoured_up_to_cap(
+    retry_policy: RetryPolicy,  # noqa: WPS442
+) -> None:
+    throttled_response = httpx.Response(HTTPStatus.TOO_MANY_REQUESTS, headers={'Retry-After': '0'})
+    long_throttled_response = httpx.Response(HTTPStatus.TOO_MANY_REQUESTS, headers={'Retry-After': '3600'})
+
+    assert retry_policy.next_delay('GET', throttled_response, attempt=2, started_at=0) == 0
+    assert retry_policy.next_delay('GET', long_throttled_response, attempt=1, started_at=0) is None
+    assert (retry_policy.stats.retries, retry_policy.stats.exhausted) == (1, 1)
+
+
+def test_async_transient_failure_is_retried(email_count_successful_response: dict) -> None:
+    mocked_responses = iter([
+        httpx.Response(HTTPStatus.SERVICE_UNAVAILABLE, headers={'Retry-After': '0'}),
+        httpx.Response(HTTPStatus.OK, json=email_count_successful_response),
+    ])
+    async_retry_policy = RetryPolicy(max_attempts=2)
+    async_hunter_client = AsyncHunterClient(
+        api_key='not_really_an_api_key',
+        http_session=httpx.AsyncClient(transport=httpx.MockTransport(lambda _: next(mocked_responses))),
+        retry_policy=async_retry_policy,
+    )
+
+    response = asyncio.run(async_hunter_client.email_counter.count_emails_by_domain('example.com'))
+
+    assert response == email_count_successful_response
+    assert async_retry_policy.stats.retries == 1
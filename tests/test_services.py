@@ -1,3 +1,9 @@
+import re
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+
+import pytest
+import requests
 import requests_mock
 
 from hunter_client.services.email_validation import PersistentEmailValidationService
@@ -30,3 +36,124 @@ def test_validate_and_store_invalid_email(
     )
     assert persistent_email_validation_service.validate_and_store_email_status('invalid@example.com') is False
     assert dummy_emails_validity_storage.get('invalid@example.com') is False
+
+
+def test_validate_many_in_order(
+    requests_mocker: requests_mock.Mocker,
+    email_verification_successful_response: dict,
+    email_verification_failed_response: dict,
+    persistent_email_validation_service: PersistentEmailValidationService,
+    dummy_emails_validity_storage: DummyStorage[str, bool],
+) -> None:
+    requests_mocker.get(
+        'https://api.hunter.io/v2/email-verifier?email=valid@example.com',
+        json=email_verification_successful_response,
+    )
+    requests_mocker.get(
+        'https://api.hunter.io/v2/email-verifier?email=invalid@example.com',
+        json=email_verification_failed_response,
+    )
+    emails = ['valid@example.com', 'invalid@example.com', 'valid@example.com']
+
+    validation_results = list(persistent_email_validation_service.validate_many(emails, max_concurrency=2))
+
+    assert validation_results == [
+        ('valid@example.com', True),
+        ('invalid@example.com', False),
+        ('valid@example.com', True),
+    ]
+    assert dummy_emails_validity_storage.get('valid@example.com') is True
+    assert dummy_emails_validity_storage.get('invalid@example.com') is False
+
+
+def test_validate_many_as_completed(
+    requests_mocker: requests_mock.Mocker,
+    email_verification_successful_response: dict,
+    email_verification_failed_response: dict,
+    persistent_email_validation_service: PersistentEmailValidationService,
+) -> None:
+    requests_mocker.get(
+        'https://api.hunter.io/v2/email-verifier?email=valid@example.com',
+        json=email_verification_successful_response,
+    )
+    requests_mocker.get(
+        'https://api.hunter.io/v2/email-verifier?email=invalid@example.com',
+        json=email_verification_failed_response,
+    )
+    emails = ['valid@example.com', 'invalid@example.com']
+
+    validation_results = persistent_email_validation_service.validate_many(emails, max_concurrency=2, ordered=False)
+
+    assert sorted(validation_results) == [('invalid@example.com', False), ('valid@example.com', True)]
+
+
+def test_validate_many_isolates_failures(
+    requests_mocker: requests_mock.Mocker,
+    email_verification_successful_response: dict,
+    persistent_email_validation_service: PersistentEmailValidationService,
+) -> None:
+    requests_mocker.get(re.compile('/v2/email-verifier'), json=email_verification_successful_response)
+    requests_mocker.get(
+        'https://api.hunter.io/v2/email-verifier?email=malformed',
+        status_code=HTTPStatus.BAD_REQUEST,
+    )
+    emails = ['john@example.com', 'malformed', 'jane@example.com']
+
+    validation_results = list(persistent_email_validation_service.validate_many(emails, max_concurrency=1))
+
+    assert validation_results[0] == ('john@example.com', True)
+    assert isinstance(validation_results[1][1], requests.HTTPError)
+    assert validation_results[2] == ('jane@example.com', True)
+    with pytest.raises(requests.HTTPError):
+        list(persistent_email_validation_service.validate_many(emails, fail_fast=True))
+
+
+def test_read_through_answers_from_storage(
+    requests_mocker: requests_mock.Mocker,
+    email_verification_successful_response: dict,
+    dummy_emails_validity_storage: DummyStorage[str, bool],
+) -> None:
+    requests_mocker.get(
+        'https://api.hunter.io/v2/email-verifier?email=valid@example.com',
+        json=email_verification_successful_response,
+    )
+    service = PersistentEmailValidationService(
+        hunter_api_key='not_really_an_api_key',
+        results_storage=dummy_emails_validity_storage,
+        read_through=True,
+    )
+
+    assert service.validate_and_store_email_status('valid@example.com') is True
+    assert service.validate_and_store_email_status('valid@example.com') is True
+    assert service.validate_and_store_email_status('valid@example.com', force_refresh=True) is True
+
+    assert requests_mocker.call_count == 2
+    assert (service.cache_stats.hits, service.cache_stats.misses) == (1, 1)
+
+
+def test_read_through_refreshes_stale_verdicts(
+    requests_mocker: requests_mock.Mocker,
+    email_verification_successful_response: dict,
+    dummy_emails_validity_storage: DummyStorage[str, bool],
+) -> None:
+    requests_mocker.get(
+        'https://api.hunter.io/v2/email-verifier?email=valid@example.com',
+        json=email_verification_successful_response,
+    )
+    verification_times_storage = DummyStorage[str, datetime]()
+    service = PersistentEmailValidationService(
+        hunter_api_key='not_really_an_api_key',
+        results_storage=dummy_emails_validity_storage,
+        read_through=True,
+        max_result_age=timedelta(days=1),
+        verification_times_storage=verification_times_storage,
+    )
+
+    service.validate_and_store_email_status('valid@example.com')
+    service.validate_and_store_email_status('valid@example.com')
+    two_days_ago = datetime.now(timezone.utc) - timedelta(days=2)
+    verification_times_storage.set('valid@example.com', two_days_ago)
+    service.validate_and_store_email_status('valid@example.com')
+
+    assert requests_mocker.call_count == 2
+    assert (service.cache_stats.hits, service.cache_stats.misses) == (1, 2)
@@ -0,0 +1,27 @@
+import asyncio
+
+import httpx
+
+from hunter_client.client import AsyncHunterClient, HunterClient
+from tests.fakes import ClosureRecordingSession
+
+
+def test_async_close_keeps_passed_in_session() -> None:
+    http_session = httpx.AsyncClient()
+    owned_session_client = AsyncHunterClient(api_key='not_really_an_api_key')
+
+    asyncio.run(AsyncHunterClient(api_key='not_really_an_api_key', http_session=http_session).aclose())
+    asyncio.run(owned_session_client.aclose())
+
+    assert not http_session.is_closed
+    assert owned_session_client.http_session.is_closed
+    asyncio.run(http_session.aclose())
+
+
+def test_close_keeps_passed_in_session() -> None:
+    http_session = ClosureRecordingSession()
+
+    with HunterClient(api_key='not_really_an_api_key', http_session=http_session):
+        assert not http_session.closed
+
+    assert not http_session.closed
@@ -0,0 +1,60 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+import requests_mock
+
+from hunter_client.client import HunterClient
+from hunter_client.services.email_validation import PersistentEmailValidationService
+from hunter_client.storages.dummy import DummyStorage
+
+WORKERS_COUNT = 4
+
+
+def test_shared_session_pool_matches_pool_size() -> None:
+    with HunterClient(api_key='not_really_an_api_key', pool_size=WORKERS_COUNT) as hunter_client:
+        http_adapter = hunter_client.http_session.get_adapter('https://api.hunter.io')
+
+        assert http_adapter._pool_maxsize == WORKERS_COUNT  # type: ignore[attr-defined]  # noqa: WPS437
+        assert hunter_client.http_session.headers['X-API-KEY'] == 'not_really_an_api_key'
+
+
+def test_per_thread_sessions_are_distinct() -> None:
+    hunter_client = HunterClient(api_key='not_really_an_api_key', per_thread_sessions=True)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        worker_sessions = list(executor.map(lambda _: hunter_client.http_session, range(2)))
+
+    assert hunter_client.http_session is hunter_client.http_session
+    assert hunter_client.http_session not in worker_sessions
+    assert all(
+        worker_session.headers['X-API-KEY'] == 'not_really_an_api_key' for worker_session in worker_sessions
+    )
+    hunter_client.close()
+
+
+def test_per_thread_sessions_reject_session() -> None:
+    with pytest.raises(ValueError, match='cannot be combined'):
+        HunterClient(api_key='not_really_an_api_key', http_session=requests.Session(), per_thread_sessions=True)
+
+
+def test_service_uses_given_client(
+    requests_mocker: requests_mock.Mocker,
+    email_verification_successful_response: dict,
+    dummy_emails_validity_storage: DummyStorage[str, bool],
+) -> None:
+    requests_mocker.get(
+        'https://api.hunter.io/v2/email-verifier?email=valid@example.com',
+        json=email_verification_successful_response,
+    )
+    service = PersistentEmailValidationService(
+        hunter_api_key='not_really_an_api_key',
+        results_storage=dummy_emails_validity_storage,
+        hunter_client=HunterClient(api_key='not_really_an_api_key', per_thread_sessions=True),
+    )
+
+    emails = ['valid@example.com' for _ in range(WORKERS_COUNT)]
+
+    validation_results = list(service.validate_many(emails, max_concurrency=WORKERS_COUNT))
+
+    assert validation_results == [(email, True) for email in emails]
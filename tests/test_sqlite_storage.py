@@ -0,0 +1,41 @@
+import sqlite3
+from pathlib import Path
+
+from hunter_client.storages.sqlite import SQLiteStorage
+
+EMAILS_COUNT = 1200
+
+
+def test_sqlite_storage_survives_reopening(tmp_path: Path) -> None:
+    database_path = tmp_path / 'results.sqlite3'
+
+    with SQLiteStorage[list[str]](database_path, commit_batch_size=2) as sqlite_storage:
+        assert sqlite_storage.get('itch.io') is None
+        sqlite_storage.set('itch.io', ['ceo@itch.io', 'john@itch.io'])
+        sqlite_storage.set('example.com', ['info@example.com'])
+        sqlite_storage.set('example.com', ['contact@example.com'])
+        sqlite_storage.delete('itch.io')
+        assert sqlite_storage.get('example.com') == ['contact@example.com']
+
+    with SQLiteStorage[list[str]](database_path) as reopened_sqlite_storage:
+        assert reopened_sqlite_storage.get('itch.io') is None
+        assert reopened_sqlite_storage.get('example.com') == ['contact@example.com']
+        reopened_sqlite_storage.close()
+
+
+def test_sqlite_storage_uses_write_ahead_log(tmp_path: Path) -> None:
+    with SQLiteStorage[bool](tmp_path / 'results.sqlite3'):
+        with sqlite3.connect(tmp_path / 'results.sqlite3') as connection:
+            assert connection.execute('PRAGMA journal_mode').fetchone() == ('wal',)
+
+
+def test_sqlite_storage_batch_operations(tmp_path: Path) -> None:
+    emails = ['user{0}@itch.io'.format(index) for index in range(EMAILS_COUNT)]
+    verdicts = dict.fromkeys(emails, True)  # noqa: WPS425
+
+    with SQLiteStorage[bool](tmp_path / 'results.sqlite3') as sqlite_storage:
+        sqlite_storage.set_many(verdicts)
+        assert sqlite_storage.get_many([*emails, 'nobody@itch.io']) == verdicts
+
+        sqlite_storage.delete_many(emails[1:])
+        assert sqlite_storage.get_many(emails) == {emails[0]: True}
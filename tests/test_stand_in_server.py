@@ -0,0 +1,72 @@
+from http import HTTPStatus
+from typing import Generator
+
+import pytest
+import requests
+
+from benchmarks.stand_in import HunterStandInServer, StandInBehaviour
+from hunter_client.client import HunterClient
+from hunter_client.services.response_models import EmailCounterResponse
+from tests.mock_responses import failed
+
+DOMAIN_EMAILS_COUNT = 25
+PAGE_SIZE = 10
+
+
+@pytest.fixture
+def stand_in_server() -> Generator[HunterStandInServer, None, None]:
+    with HunterStandInServer(StandInBehaviour(domain_emails_count=DOMAIN_EMAILS_COUNT)) as server:
+        yield server
+
+
+@pytest.fixture
+def stand_in_client(stand_in_server: HunterStandInServer) -> Generator[HunterClient, None, None]:  # noqa: WPS442
+    with HunterClient(api_key='not_really_an_api_key', base_url=stand_in_server.base_url) as client:
+        yield client
+
+
+def test_verify_email_echoes_email(stand_in_client: HunterClient) -> None:  # noqa: WPS442
+    response = stand_in_client.email_verifier.verify_email('jane@example.com')
+
+    assert response.is_valid
+    assert response.data.email == 'jane@example.com'
+
+
+def test_unknown_domain_gets_failed_payload(stand_in_client: HunterClient) -> None:  # noqa: WPS442
+    response = stand_in_client.email_counter.count_emails('nonexistent.com')
+
+    assert response == EmailCounterResponse.model_validate(failed.email_count_failed_response())
+
+
+def test_domain_search_is_paginated_and_validated(
+    stand_in_server: HunterStandInServer,  # noqa: WPS442
+    stand_in_client: HunterClient,  # noqa: WPS442
+) -> None:
+    emails = list(stand_in_client.domain_searcher.iterate_emails_by_domain('example.com', page_size=PAGE_SIZE))
+    malformed_page_response = stand_in_client.http_session.get(
+        '{0}/v2/domain-search?domain=example.com&limit=-1'.format(stand_in_server.base_url),
+        timeout=1,
+    )
+
+    assert len({email_info.value for email_info in emails}) == DOMAIN_EMAILS_COUNT
+    assert malformed_page_response.json()['errors'][0]['id'] == 'wrong_params'
+    assert stand_in_server.stats.responses_by_status == {HTTPStatus.OK: 3, HTTPStatus.BAD_REQUEST: 1}
+
+
+def test_rate_limit_injection() -> None:
+    with HunterStandInServer(StandInBehaviour(rate_limit_rate=1, retry_after=7)) as server:
+        response = requests.get('{0}/v2/email-count?domain=example.com'.format(server.base_url), timeout=1)
+
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert response.headers['Retry-After'] == '7'
+
+
+def test_error_injection() -> None:
+    server = HunterStandInServer(StandInBehaviour(error_rate=1))
+    client = HunterClient(api_key='not_really_an_api_key', base_url=server.base_url)
+    with server:
+        with pytest.raises(requests.HTTPError, match='503 Server Error'):
+            client.email_counter.count_emails('example.com')
+    client.close()
+
+    assert server.stats.responses_by_status == {HTTPStatus.SERVICE_UNAVAILABLE: 1}
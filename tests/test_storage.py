@@ -9,3 +9,14 @@ def test_dummy_storage(dummy_emails_by_domain_storage: DummyStorage) -> None:
 
     dummy_emails_by_domain_storage.delete('itch.io')
     assert dummy_emails_by_domain_storage.get('itch.io') is None
+
+
+def test_dummy_storage_batch_operations(dummy_emails_validity_storage: DummyStorage[str, bool]) -> None:
+    dummy_emails_validity_storage.set_many({'ceo@itch.io': True, 'john@itch.io': False, 'paul@itch.io': True})
+    assert dummy_emails_validity_storage.get_many(['ceo@itch.io', 'john@itch.io', 'nobody@itch.io']) == {
+        'ceo@itch.io': True,
+        'john@itch.io': False,
+    }
+
+    dummy_emails_validity_storage.delete_many(['ceo@itch.io', 'nobody@itch.io'])
+    assert dummy_emails_validity_storage.get_many(['ceo@itch.io', 'paul@itch.io']) == {'paul@itch.io': True}
@@ -0,0 +1,87 @@
+import asyncio
+
+import requests_mock
+
+from hunter_client.client import AsyncHunterClient, HunterClient
+from hunter_client.services.response_models import (
+    DomainAndNameSearcherResponse,
+    DomainSearcherResponse,
+    EmailCounterResponse,
+    EmailVerifierResponse,
+)
+
+
+def test_search_domain(
+    hunter_client: HunterClient,
+    requests_mocker: requests_mock.Mocker,
+    domain_search_successful_response: dict,
+) -> None:
+    requests_mocker.get(
+        'https://api.hunter.io/v2/domain-search?domain=example.com',
+        json=domain_search_successful_response,
+    )
+
+    response = hunter_client.domain_searcher.search_domain('example.com')
+
+    assert response == DomainSearcherResponse.model_validate(domain_search_successful_response)
+
+
+def test_find_email(
+    hunter_client: HunterClient,
+    requests_mocker: requests_mock.Mocker,
+    domain_and_name_search_successful_response: dict,
+) -> None:
+    requests_mocker.get(
+        'https://api.hunter.io/v2/email-finder?domain=example.com&first_name=John&last_name=Doe',
+        json=domain_and_name_search_successful_response,
+    )
+
+    response = hunter_client.domain_and_name_searcher.find_email('example.com', 'John', 'Doe')
+
+    assert response == DomainAndNameSearcherResponse.model_validate(domain_and_name_search_successful_response)
+
+
+def test_verify_email(
+    hunter_client: HunterClient,
+    requests_mocker: requests_mock.Mocker,
+    email_verification_successful_response: dict,
+) -> None:
+    requests_mocker.get(
+        'https://api.hunter.io/v2/email-verifier?email=test@example.com',
+        json=email_verification_successful_response,
+    )
+
+    response = hunter_client.email_verifier.verify_email('test@example.com')
+
+    assert response.is_valid
+    assert response == EmailVerifierResponse.model_validate(email_verification_successful_response)
+
+
+def test_count_emails(
+    hunter_client: HunterClient,
+    requests_mocker: requests_mock.Mocker,
+    email_count_successful_response: dict,
+) -> None:
+    requests_mocker.get(
+        'https://api.hunter.io/v2/email-count?domain=example.com',
+        json=email_count_successful_response,
+    )
+
+    response = hunter_client.email_counter.count_emails('example.com')
+
+    assert response == EmailCounterResponse.model_validate(email_count_successful_response)
+
+
+def test_async_verify_email(
+    async_hunter_client: AsyncHunterClient,
+    async_mocked_responses: dict[str, dict],
+    email_verification_failed_response: dict,
+) -> None:
+    async_mocked_responses['https://api.hunter.io/v2/email-verifier?email=invalid@example.com'] = (
+        email_verification_failed_response
+    )
+
+    response = asyncio.run(async_hunter_client.email_verifier.verify_email('invalid@example.com'))
+
+    assert not response.is_valid
+    assert response == EmailVerifierResponse.model_validate(email_verification_failed_response)
@@ -0,0 +1,88 @@
+import copy
+
+import pytest
+import requests_mock
+from pydantic import ValidationError
+
+from hunter_client.client import HunterClient
+from hunter_client.services.response_models import DomainSearcherResponse
+from hunter_client.services.response_models.records import EmailRecord
+from hunter_client.services.response_models.validation import ValidationLevel, validation_context
+
+MALFORMED_EMAIL = 'not-an-email'
+
+
+def with_malformed_email(domain_search_response: dict) -> dict:
+    response = copy.deepcopy(domain_search_response)
+    response['data']['emails'][0]['value'] = MALFORMED_EMAIL
+    return response
+
+
+def test_strict_level_validates_emails(domain_search_successful_response: dict) -> None:
+    with pytest.raises(ValidationError):
+        DomainSearcherResponse.model_validate(
+            with_malformed_email(domain_search_successful_response),
+            context=validation_context(ValidationLevel.STRICT),
+        )
+
+
+def test_trusted_level_keeps_emails_as_returned(domain_search_successful_response: dict) -> None:
+    response = DomainSearcherResponse.model_validate(
+        with_malformed_email(domain_search_successful_response),
+        context=validation_context(ValidationLevel.TRUSTED),
+    )
+
+    assert response.data.emails[0].value == MALFORMED_EMAIL
+
+
+def test_search_domain_uses_client_level(
+    hunter_client: HunterClient,
+    requests_mocker: requests_mock.Mocker,
+    domain_search_successful_response: dict,
+) -> None:
+    requests_mocker.get(
+        'https://api.hunter.io/v2/domain-search?domain=example.com',
+        json=with_malformed_email(domain_search_successful_response),
+    )
+
+    with pytest.raises(ValidationError):
+        hunter_client.domain_searcher.search_domain('example.com')
+    hunter_client.validation_level = ValidationLevel.TRUSTED
+    response = hunter_client.domain_searcher.search_domain('example.com')
+
+    assert response.data.emails[0].value == MALFORMED_EMAIL
+
+
+def test_search_domain_per_call_level(
+    hunter_client: HunterClient,
+    requests_mocker: requests_mock.Mocker,
+    domain_search_successful_response: dict,
+) -> None:
+    requests_mocker.get(
+        'https://api.hunter.io/v2/domain-search?domain=example.com',
+        json=with_malformed_email(domain_search_successful_response),
+    )
+
+    response = hunter_client.domain_searcher.search_domain('example.com', ValidationLevel.RAW)
+
+    assert response.data.emails[0].value == MALFORMED_EMAIL
+
+
+def test_raw_iteration_yields_records(
+    hunter_client: HunterClient,
+    requests_mocker: requests_mock.Mocker,
+    domain_search_successful_response: dict,
+) -> None:
+    requests_mocker.get(
+        'https://api.hunter.io/v2/domain-search?domain=example.com&limit=10&offset=0',
+        json=domain_search_successful_response,
+    )
+
+    emails = list(
+        hunter_client.domain_searcher.iterate_emails_by_domain('example.com', validation_level=ValidationLevel.RAW),
+    )
+
+    assert emails == [
+        EmailRecord.from_json(email_json) for email_json in domain_search_successful_response['data']['emails']
+    ]
+    assert [email_record.value for email_record in emails] == ['contact@example.com', 'info@example.com']